@@ -1,10 +1,22 @@
-from fastapi import APIRouter
+from fastapi import APIRouter, Depends
 
 from .user import router as user_router
 from .work import router as work_router
 from .auth import router as auth_router
+from .episode import router as episode_router
+from .internal import router as internal_router
+from .search import router as search_router
+from .comment import router as comment_router
+from .events import router as events_router
+from service.service_helper import unit_of_work
 
 router = APIRouter()
-router.include_router(user_router, prefix="/users", tags=["User"])
-router.include_router(work_router, prefix="/works", tags=["Work"])
-router.include_router(auth_router, prefix="/auth", tags=["Auth"])
\ No newline at end of file
+router.include_router(user_router, prefix="/users", tags=["User"], dependencies=[Depends(unit_of_work)])
+router.include_router(work_router, prefix="/works", tags=["Work"], dependencies=[Depends(unit_of_work)])
+router.include_router(episode_router, prefix="/works", tags=["Episode"], dependencies=[Depends(unit_of_work)])
+router.include_router(auth_router, prefix="/auth", tags=["Auth"], dependencies=[Depends(unit_of_work)])
+router.include_router(comment_router, prefix="/comments", tags=["Comment"], dependencies=[Depends(unit_of_work)])
+router.include_router(search_router, prefix="/search", tags=["Search"], dependencies=[Depends(unit_of_work)])
+# 알림 스트림은 연결이 오래 유지되므로 요청 단위 세션을 붙이지 않는다.
+router.include_router(events_router, prefix="/works", tags=["Event"])
+router.include_router(internal_router, prefix="/internal", tags=["Internal"])
\ No newline at end of file
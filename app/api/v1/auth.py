@@ -2,14 +2,14 @@ from fastapi import APIRouter, Response, Depends, HTTPException
 from schemas.models import UserCreate
 
 from core.utils.jwt import create_access_token
-from service.service_helper import service_dict
+from service.service_helper import async_service_dict
 
 router = APIRouter()
 
 @router.post("/login")
 async def login(user: UserCreate, response: Response = Response()):
-    task= service_dict.get('Auth').get("login")
-    result = task(user)
+    task= async_service_dict.get('Auth').get("login")
+    result = await task(user)
     
     if result==None:
         raise HTTPException(status_code=401, detail="Invalid credentials")
@@ -0,0 +1,29 @@
+from typing import Optional
+
+from fastapi import APIRouter, Header, HTTPException
+
+from core.utils.jwt import verify_authorization
+from service.service_helper import async_service_dict
+
+router = APIRouter()
+
+#댓글 좋아요
+@router.post("/{comment_id}/like", response_model=None)
+async def add_like(comment_id: int, authorization: Optional[str] = Header(None)):
+    payload = verify_authorization(authorization)
+    
+    addLikeTask = async_service_dict.get('Like').get("add_like")
+    try:
+        await addLikeTask(payload['id'], comment_id)
+    except ValueError:
+        raise HTTPException(status_code=404, detail="Comment not found")
+    return None
+
+#댓글 좋아요 취소
+@router.delete("/{comment_id}/like", response_model=None)
+async def delete_like(comment_id: int, authorization: Optional[str] = Header(None)):
+    payload = verify_authorization(authorization)
+    
+    deleteLikeTask = async_service_dict.get('Like').get("delete_like")
+    await deleteLikeTask(payload['id'], comment_id)
+    return None
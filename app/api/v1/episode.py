@@ -0,0 +1,92 @@
+import zlib
+from typing import Optional
+
+from fastapi import APIRouter, Header, HTTPException, Query, Response
+from fastapi.responses import StreamingResponse
+
+from core.config import Config
+from core.utils.http_range import parse_range
+from core.utils.json_response import ModelJSONResponse
+from core.utils.jwt import verify_token
+from schemas.models import EpisodeResponse
+from service.service_helper import async_service_dict, service_scope
+from service.trending import trending_buffer
+from service.watch_history import watch_history_buffer
+
+router = APIRouter()
+
+
+async def _stream_content(episode_id: int, start: int, end: int):
+    async with service_scope() as service:
+        async for chunk in service.iter_episode_content(episode_id, start, end):
+            yield chunk
+
+
+async def _gzip(chunks):
+    compressor = zlib.compressobj(wbits=31)  # gzip 포맷
+    async for chunk in chunks:
+        compressed = compressor.compress(chunk)
+        if compressed:
+            yield compressed
+    yield compressor.flush()
+
+
+#특정 회차 정보 조회 (본문 제외)
+@router.get("/{work_id}/episodes/{episode_id}", response_model=EpisodeResponse)
+async def get_episode(work_id: int, episode_id: int, authorization: Optional[str] = Header(None)):
+    getEpisodeTask = async_service_dict.get('Episode').get("get_episode_by_id")
+    try:
+        episode = await getEpisodeTask(episode_id)
+    except ValueError:
+        raise HTTPException(status_code=404, detail="Episode not found")
+    
+    if episode.work_id != work_id:
+        raise HTTPException(status_code=404, detail="Episode not found")
+    
+    # 로그인한 유저의 시청 기록과 작품의 인기 점수 (버퍼에 모았다가 일괄 upsert 한다)
+    payload = verify_token(authorization.split(' ')[1]) if authorization and ' ' in authorization else None
+    if payload is not None:
+        await watch_history_buffer.record(payload['id'], work_id)
+        await trending_buffer.record(work_id, Config.TRENDING_WATCH_WEIGHT)
+    return ModelJSONResponse(episode)
+
+#특정 회차 본문 스트리밍 (Range 또는 offset/length 로 부분 조회)
+@router.get("/{work_id}/episodes/{episode_id}/content")
+async def get_episode_content(
+    work_id: int,
+    episode_id: int,
+    offset: Optional[int] = Query(None, ge=0),
+    length: Optional[int] = Query(None, ge=1),
+    range: Optional[str] = Header(None),
+    accept_encoding: Optional[str] = Header(None),
+):
+    getLengthTask = async_service_dict.get('Episode').get("get_episode_content_length")
+    total = await getLengthTask(work_id, episode_id)
+    
+    if total is None:
+        raise HTTPException(status_code=404, detail="Episode not found")
+    
+    if offset is not None or length is not None:
+        offset = offset or 0
+        range = f"bytes={offset}-{offset + length - 1 if length else ''}"
+    try:
+        byte_range = parse_range(range, total)
+    except ValueError:
+        return Response(status_code=416, headers={"Content-Range": f"bytes */{total}"})
+    
+    headers = {"Accept-Ranges": "bytes", "Vary": "Accept-Encoding"}
+    media_type = "text/plain; charset=utf-8"
+    
+    if byte_range is not None:
+        start, end = byte_range
+        headers["Content-Range"] = f"bytes {start}-{end}/{total}"
+        headers["Content-Length"] = str(end - start + 1)
+        return StreamingResponse(_stream_content(episode_id, start, end), status_code=206, headers=headers, media_type=media_type)
+    
+    body = _stream_content(episode_id, 0, total - 1)
+    if accept_encoding and "gzip" in accept_encoding.lower() and total > 0:
+        headers["Content-Encoding"] = "gzip"
+        return StreamingResponse(_gzip(body), headers=headers, media_type=media_type)
+    
+    headers["Content-Length"] = str(total)
+    return StreamingResponse(body, headers=headers, media_type=media_type)
@@ -0,0 +1,126 @@
+import asyncio
+from typing import List
+
+from fastapi import APIRouter, HTTPException, WebSocket
+from fastapi.responses import StreamingResponse
+from starlette.background import BackgroundTask
+
+from core.config import Config
+from service.events import (
+    SlowSubscriberError,
+    SubscriberLimitError,
+    Subscription,
+    episode_topic,
+    event_broker,
+    work_topic,
+)
+from service.service_helper import async_service_dict
+
+router = APIRouter()
+
+# 느려서 구독이 끊긴 클라이언트에게 보내는 마지막 이벤트 (다시 연결하고 목록을 새로 읽어야 한다)
+OVERFLOW_EVENT = b'{"type":"overflow"}'
+
+# 워커가 구독자로 꽉 찼을 때 WebSocket 을 닫는 코드 (Try Again Later)
+WS_TRY_AGAIN_LATER = 1013
+
+# 없는 회차를 구독하려 할 때 WebSocket 을 닫는 코드 (Policy Violation)
+WS_POLICY_VIOLATION = 1008
+
+
+async def _episode_exists(work_id: int, episode_id: int) -> bool:
+    getEpisodeIdsTask = async_service_dict.get('Episode').get("get_episode_ids_by_work_id")
+    return await getEpisodeIdsTask(work_id, ids=[episode_id]) == [episode_id]
+
+
+def _subscribe(topics: List[str]) -> Subscription:
+    try:
+        return event_broker.subscribe(topics)
+    except SubscriberLimitError:
+        raise HTTPException(status_code=503, detail="Too many subscribers", headers={"Retry-After": "5"})
+
+
+def _event_stream(topics: List[str]) -> StreamingResponse:
+    subscription = _subscribe(topics)
+
+    async def stream():
+        while True:
+            try:
+                message = await subscription.get(Config.EVENTS_HEARTBEAT_INTERVAL)
+            except SlowSubscriberError:
+                yield b"data: " + OVERFLOW_EVENT + b"\n\n"
+                return
+            # 이벤트가 없으면 프록시가 연결을 끊지 않도록 주석 줄을 보낸다.
+            yield b": keep-alive\n\n" if message is None else b"data: " + message + b"\n\n"
+
+    return StreamingResponse(
+        stream(),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+        # 스트림이 끝나거나 클라이언트가 끊으면 (첫 이벤트 전이라도) 구독을 정리한다.
+        background=BackgroundTask(event_broker.unsubscribe, subscription),
+    )
+
+
+async def _send_events(websocket: WebSocket, subscription: Subscription):
+    while True:
+        try:
+            message = await subscription.get()
+        except SlowSubscriberError:
+            await websocket.send_text(OVERFLOW_EVENT.decode())
+            await websocket.close(code=WS_TRY_AGAIN_LATER)
+            return
+        await websocket.send_text(message.decode())
+
+
+async def _wait_for_disconnect(websocket: WebSocket):
+    # 클라이언트가 보내는 메시지는 무시한다.
+    while (await websocket.receive())["type"] != "websocket.disconnect":
+        pass
+
+
+async def _serve_websocket(websocket: WebSocket, topics: List[str]):
+    try:
+        subscription = event_broker.subscribe(topics)
+    except SubscriberLimitError:
+        await websocket.close(code=WS_TRY_AGAIN_LATER)
+        return
+    try:
+        await websocket.accept()
+        tasks = [
+            asyncio.ensure_future(_send_events(websocket, subscription)),
+            asyncio.ensure_future(_wait_for_disconnect(websocket)),
+        ]
+        # 보내기가 끝나거나 (느린 구독자) 클라이언트가 끊으면 다른 쪽도 멈춘다.
+        done, pending = await asyncio.wait(tasks, return_when=asyncio.FIRST_COMPLETED)
+        for task in pending:
+            task.cancel()
+        await asyncio.gather(*pending, return_exceptions=True)
+    finally:
+        event_broker.unsubscribe(subscription)
+
+#작품의 새 회차/공지 알림 (Server-Sent Events, data 는 {"type": "episode.created", "id": ..., "work_id": ...})
+#놓친 이벤트는 다시 보내지 않으므로, 다시 연결하면 목록을 새로 읽는다.
+@router.get("/{work_id}/events")
+async def get_work_events(work_id: int):
+    return _event_stream([work_topic(work_id)])
+
+#회차의 새 댓글 알림 (Server-Sent Events)
+@router.get("/{work_id}/episodes/{episode_id}/events")
+async def get_episode_events(work_id: int, episode_id: int):
+    if not await _episode_exists(work_id, episode_id):
+        raise HTTPException(status_code=404, detail="Episode not found")
+    return _event_stream([episode_topic(episode_id)])
+
+#작품의 새 회차/공지 알림 (WebSocket, 메시지는 SSE 의 data 와 같다)
+@router.websocket("/{work_id}/events/ws")
+async def work_events_ws(websocket: WebSocket, work_id: int):
+    await _serve_websocket(websocket, [work_topic(work_id)])
+
+#회차의 새 댓글 알림 (WebSocket)
+@router.websocket("/{work_id}/episodes/{episode_id}/events/ws")
+async def episode_events_ws(websocket: WebSocket, work_id: int, episode_id: int):
+    if not await _episode_exists(work_id, episode_id):
+        await websocket.close(code=WS_POLICY_VIOLATION)
+        return
+    await _serve_websocket(websocket, [episode_topic(episode_id)])
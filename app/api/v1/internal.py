@@ -0,0 +1,36 @@
+import secrets
+from typing import Optional
+
+from fastapi import APIRouter, Depends, Header, HTTPException, Query
+
+from core.config import Config
+from repositories.pool import get_pool_statistics
+from repositories.query_log import get_query_statistics
+from service.counters import counter_reconciler
+
+def _verify_internal_token(x_internal_token: Optional[str] = Header(None)):
+    if not Config.INTERNAL_API_TOKEN:
+        raise HTTPException(status_code=403, detail="Internal API is disabled")
+    if not x_internal_token or not secrets.compare_digest(x_internal_token.encode(), Config.INTERNAL_API_TOKEN.encode()):
+        raise HTTPException(status_code=401, detail="Invalid internal token")
+
+# 운영 API 는 모두 내부 토큰이 있어야 호출할 수 있다.
+router = APIRouter(dependencies=[Depends(_verify_internal_token)])
+
+# 워커별 커넥션 풀 통계 (풀 크기 조정용)
+@router.get("/pool")
+async def get_pool_stats():
+    return get_pool_statistics()
+
+# 워커별 쿼리 통계 (총 소요 시간 순, slow_only=true 면 임계값을 넘은 적 있는 문장만)
+@router.get("/slow-queries")
+async def get_slow_queries(
+    limit: int = Query(50, ge=1, le=1000),
+    slow_only: bool = Query(False),
+):
+    return get_query_statistics(limit=limit, slow_only=slow_only)
+
+# 좋아요/선호 수를 실제 행 수로 다시 계산한다 (보정된 행 수 반환)
+@router.post("/counters/reconcile")
+async def reconcile_counters():
+    return await counter_reconciler.reconcile()
@@ -0,0 +1,25 @@
+from typing import List, Optional
+
+from fastapi import APIRouter, HTTPException, Query
+
+from core.config import Config
+from core.utils.json_response import ModelJSONResponse
+from schemas.models import SearchPage
+from service.service_helper import async_service_dict
+
+router = APIRouter()
+
+#작품/회차/공지 통합 검색 (관련도 순)
+@router.get("", response_model=SearchPage)
+async def search(
+    q: str = Query(..., min_length=2, max_length=100),
+    type: Optional[List[str]] = Query(None),
+    offset: int = Query(0, ge=0),
+    limit: int = Query(Config.PAGE_SIZE_DEFAULT, ge=1, le=Config.PAGE_SIZE_MAX),
+):
+    task = async_service_dict.get('Search').get("search")
+    try:
+        result = await task(q, kinds=type, offset=offset, limit=limit)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    return ModelJSONResponse(result)
@@ -1,57 +1,85 @@
-from typing import List, Optional
+from typing import Optional
 
-from fastapi import APIRouter, Depends, HTTPException, Query, status
-from schemas.models import UserCreate, UserUpdate, UserResponse
+from fastapi import APIRouter, Depends, Header, HTTPException, Query, Response, status
+from core.config import Config
+from core.utils.conditional import is_not_modified, make_etag, validator_headers
+from core.utils.json_response import ModelJSONResponse
+from schemas.models import CursorPage, UserCreate, UserDetailResponse, UserUpdate, UserResponse
 
-from service.service_helper import service_dict
+from service.service_helper import async_service_dict
 
 router = APIRouter()
 
 # User 생성
 @router.post("/users", response_model=UserResponse)
 async def create_user_endpoint(user: UserCreate):
-    task = service_dict.get('User').get("add_user")
-    result = task(user=user)
+    task = async_service_dict.get('User').get("add_user")
+    result = await task(user=user)
     return result
 
-@router.get("/", response_model=List[UserResponse])
+# include=works 로 최근 작품을 함께 조회한다.
+@router.get("/", response_model=CursorPage[UserDetailResponse])
 async def get_users(
     id: Optional[list[int]] = Query(None),
     username: Optional[list[str]] = Query(None),
+    cursor: Optional[str] = Query(None),
+    limit: int = Query(Config.PAGE_SIZE_DEFAULT, ge=1, le=Config.PAGE_SIZE_MAX),
+    include: Optional[list[str]] = Query(None),
 ):
-    task = service_dict.get('User').get("get_user_list")
-    result = task(
-        id=id,
-        username=username
-    )
-    return result
+    task = async_service_dict.get('User').get("get_user_list")
+    try:
+        result = await task(
+            id=id,
+            username=username,
+            cursor=cursor,
+            limit=limit,
+            include=include,
+        )
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    # 서비스가 이미 검증한 결과이므로 response_model 로 다시 검증하지 않고 바로 직렬화한다.
+    return ModelJSONResponse(result)
 
 
+# If-None-Match / If-Modified-Since 가 현재 버전과 맞으면 본문 없이 304 로 응답한다.
 @router.get("/{id}", response_model=UserResponse)
-async def get_user_by_id(id: int):
-    task = service_dict.get('User').get("get_user_by_id")
-    result = task(id=id)
-    return result
+async def get_user_by_id(
+    id: int,
+    if_none_match: Optional[str] = Header(None),
+    if_modified_since: Optional[str] = Header(None),
+):
+    getVersionTask = async_service_dict.get('User').get("get_user_version")
+    version = await getVersionTask(id=id)
+    headers = None
+    if version is not None:
+        etag = make_etag(version.tag)
+        headers = validator_headers(etag, version.last_modified)
+        if is_not_modified(etag, version.last_modified, if_none_match, if_modified_since):
+            return Response(status_code=304, headers=headers)
+    
+    task = async_service_dict.get('User').get("get_user_by_id")
+    result = await task(id=id)
+    return ModelJSONResponse(result, headers=headers)
 
 
 @router.put("/{id}", response_model=UserResponse)
 async def update_user(id: int, user: UserUpdate):
-    task = service_dict.get('User').get("update_user")
-    result = task(id=id, update=user)
+    task = async_service_dict.get('User').get("update_user")
+    result = await task(id=id, update=user)
     return result
 
 
 @router.delete("/{id}", response_model=None)
 async def delete_user(id: int):
-    task = service_dict.get('User').get("delete_user")
-    result = task(id=id)
+    task = async_service_dict.get('User').get("delete_user")
+    result = await task(id=id)
     return None
 
 @router.get("/duplicated_check/{username}", response_model=bool)
 async def duplicated_check(username: str):
-    task= service_dict.get('User').get("get_user_by_username")
-    result = task(username=username)
-    if len(result) > 0:
+    task= async_service_dict.get('User').get("get_user_by_username")
+    result = await task(username=username)
+    if len(result.items) > 0:
         return True
     else :
         return False
\ No newline at end of file
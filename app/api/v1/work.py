@@ -1,24 +1,74 @@
-from typing import Optional
+from typing import List, Optional
 
-from fastapi import FastAPI, Header, Depends, HTTPException, Query, APIRouter
-from service.service_helper import service_dict
-from core.utils.jwt import verify_token
-from schemas.models import WorkCreate
+from fastapi import FastAPI, Body, Header, Depends, HTTPException, Query, APIRouter, Response
+from service.service_helper import async_service_dict
+from core.utils.jwt import verify_authorization, verify_token
+from core.config import Config
+from core.utils.conditional import is_not_modified, make_etag, validator_headers
+from core.utils.json_response import ModelJSONResponse
+from service.trending import trending_feed
+from schemas.models import (
+    BatchResponse,
+    CursorPage,
+    EpisodeBatchUpdate,
+    EpisodeCreate,
+    SimilarWork,
+    TrendingPage,
+    WorkBatchUpdate,
+    WorkCreate,
+    WorkDetailResponse,
+)
 
 router = APIRouter()
 
-#특정 유저의 작품 조회
-@router.get("/{user_id}")
-async def get_works_by_user_id(user_id: int):
-    getUserTask = service_dict.get('User').get("get_user_by_id")
-    user = getUserTask(user_id)
+async def _check_work_owner(user_id: int, work_ids: List[int]):
+    getWorkIdsTask = async_service_dict.get('Work').get("get_work_ids_by_user_id")
+    owned = await getWorkIdsTask(user_id, ids=work_ids)
+    
+    if set(owned) != set(work_ids):
+        raise HTTPException(status_code=404, detail="Work not found")
+
+#인기 작품 (최근 시청/선호에 시간 감쇠를 적용한 점수 순, 워커 메모리의 상위 목록에서 바로 응답)
+#/{user_id} 보다 먼저 선언해야 한다.
+@router.get("/trending", response_model=TrendingPage)
+async def get_trending_works(limit: int = Query(Config.PAGE_SIZE_DEFAULT, ge=1, le=Config.TRENDING_TOP_K)):
+    result = await trending_feed.get(limit)
+    return ModelJSONResponse(result)
+
+#특정 유저의 작품 조회 (include=user, include=episodes 로 작가와 최근 회차를 함께 조회)
+#include 가 없으면 작품 목록의 행 수/최대 id/마지막 수정 시각으로 ETag 를 만들고, 바뀌지 않았으면 304 로 응답한다.
+@router.get("/{user_id}", response_model=CursorPage[WorkDetailResponse])
+async def get_works_by_user_id(
+    user_id: int,
+    cursor: Optional[str] = Query(None),
+    limit: int = Query(Config.PAGE_SIZE_DEFAULT, ge=1, le=Config.PAGE_SIZE_MAX),
+    include: Optional[list[str]] = Query(None),
+    if_none_match: Optional[str] = Header(None),
+):
+    getUserTask = async_service_dict.get('User').get("get_user_by_id")
+    user = await getUserTask(user_id)
     
     if not user:
         raise HTTPException(status_code=404, detail="User not found")
     
-    getWorksTask = service_dict.get('Work').get("get_works_by_user_id")
-    works = getWorksTask(user_id)
-    return works
+    headers = None
+    if not include:
+        getVersionTask = async_service_dict.get('Work').get("get_works_version")
+        version = await getVersionTask(user_id)
+        if version is not None:
+            etag = make_etag(version.tag, cursor, limit)
+            # 목록은 ETag 로만 검증한다. 행이 삭제되거나 같은 초에 추가되어도
+            # 가장 최근 수정 시각은 그대로일 수 있어 Last-Modified 로는 알 수 없다.
+            headers = validator_headers(etag, None)
+            if is_not_modified(etag, None, if_none_match, None):
+                return Response(status_code=304, headers=headers)
+    
+    getWorksTask = async_service_dict.get('Work').get("get_works_by_user_id")
+    try:
+        works = await getWorksTask(user_id, cursor=cursor, limit=limit, include=include)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    return ModelJSONResponse(works, headers=headers)
 
 #특정 유저의 작품 추가
 @router.post("/")
@@ -28,10 +78,113 @@ async def create_work(work: WorkCreate, authorization: Optional[str] = Header(No
     if (payload == None):
         raise HTTPException(status_code=401, detail="AccessToken is strange!")
     
-    addWorkTask = service_dict.get('Work').get("add_work")
+    addWorkTask = async_service_dict.get('Work').get("add_work")
     
     newWork = WorkCreate(title=work.title, description=work.description, user_id=payload['id'])
     
-    result = addWorkTask(work)
+    result = await addWorkTask(work)
+    
+    return result
+
+#특정 유저의 작품 일괄 추가 (하나의 트랜잭션, 생성된 id 반환)
+@router.post("/batch", response_model=BatchResponse)
+async def create_works(
+    works: List[WorkCreate] = Body(..., min_length=1, max_length=Config.BATCH_MAX_ITEMS),
+    authorization: Optional[str] = Header(None),
+):
+    payload = verify_authorization(authorization)
+    
+    addWorksTask = async_service_dict.get('Work').get("add_works")
+    
+    newWorks = [WorkCreate(title=work.title, description=work.description, user_id=payload['id']) for work in works]
+    
+    result = await addWorksTask(newWorks)
+    
+    return result
+
+#특정 유저의 작품 일괄 수정
+@router.patch("/batch", response_model=BatchResponse)
+async def update_works(
+    updates: List[WorkBatchUpdate] = Body(..., min_length=1, max_length=Config.BATCH_MAX_ITEMS),
+    authorization: Optional[str] = Header(None),
+):
+    payload = verify_authorization(authorization)
+    await _check_work_owner(payload['id'], [update.id for update in updates])
+    
+    updateWorksTask = async_service_dict.get('Work').get("update_works")
+    
+    result = await updateWorksTask(updates)
+    
+    return result
+
+#특정 작품의 회차 일괄 추가 (연재 이전용)
+@router.post("/{work_id}/episodes/batch", response_model=BatchResponse)
+async def create_episodes(
+    work_id: int,
+    episodes: List[EpisodeCreate] = Body(..., min_length=1, max_length=Config.BATCH_MAX_ITEMS),
+    authorization: Optional[str] = Header(None),
+):
+    payload = verify_authorization(authorization)
+    await _check_work_owner(payload['id'], [work_id])
     
-    return result
\ No newline at end of file
+    addEpisodesTask = async_service_dict.get('Episode').get("add_episodes")
+    
+    newEpisodes = [EpisodeCreate(title=episode.title, content=episode.content, work_id=work_id) for episode in episodes]
+    
+    result = await addEpisodesTask(newEpisodes)
+    
+    return result
+
+#특정 작품의 회차 일괄 수정
+@router.patch("/{work_id}/episodes/batch", response_model=BatchResponse)
+async def update_episodes(
+    work_id: int,
+    updates: List[EpisodeBatchUpdate] = Body(..., min_length=1, max_length=Config.BATCH_MAX_ITEMS),
+    authorization: Optional[str] = Header(None),
+):
+    payload = verify_authorization(authorization)
+    await _check_work_owner(payload['id'], [work_id])
+    
+    getEpisodeIdsTask = async_service_dict.get('Episode').get("get_episode_ids_by_work_id")
+    episode_ids = [update.id for update in updates]
+    owned = await getEpisodeIdsTask(work_id, ids=episode_ids)
+    
+    if set(owned) != set(episode_ids):
+        raise HTTPException(status_code=404, detail="Episode not found")
+    
+    updateEpisodesTask = async_service_dict.get('Episode').get("update_episodes")
+    
+    result = await updateEpisodesTask(updates)
+    
+    return result
+
+#작품 선호 추가
+@router.post("/{work_id}/favorite", response_model=None)
+async def add_favorite(work_id: int, authorization: Optional[str] = Header(None)):
+    payload = verify_authorization(authorization)
+    
+    addFavoriteTask = async_service_dict.get('Favorite').get("add_favorite")
+    try:
+        await addFavoriteTask(payload['id'], work_id)
+    except ValueError:
+        raise HTTPException(status_code=404, detail="Work not found")
+    return None
+
+#작품 선호 취소
+@router.delete("/{work_id}/favorite", response_model=None)
+async def delete_favorite(work_id: int, authorization: Optional[str] = Header(None)):
+    payload = verify_authorization(authorization)
+    
+    deleteFavoriteTask = async_service_dict.get('Favorite').get("delete_favorite")
+    await deleteFavoriteTask(payload['id'], work_id)
+    return None
+
+#비슷한 작품 (이 작품을 선호/시청한 유저가 함께 본 작품, 배치 작업이 미리 계산한 결과)
+@router.get("/{work_id}/similar", response_model=List[SimilarWork])
+async def get_similar_works(
+    work_id: int,
+    limit: int = Query(Config.PAGE_SIZE_DEFAULT, ge=1, le=Config.SIMILAR_WORKS_TOP_N),
+):
+    getSimilarTask = async_service_dict.get('Recommendation').get("get_similar_works")
+    result = await getSimilarTask(work_id, limit)
+    return ModelJSONResponse(result)
@@ -1,17 +1,90 @@
+import time
+
+_import_started = time.perf_counter()
+
 import logging
+from contextlib import asynccontextmanager
 
 from fastapi import FastAPI
+from fastapi.responses import PlainTextResponse
 from api.v1 import router as api_v1_router
+from core.metrics import CONTENT_TYPE, RequestTimingMiddleware, render_metrics
+from core.utils.json_response import FastJSONResponse
+from repositories import dispose_engines, warm_up_pool
+from service.counters import counter_buffer, counter_reconciler
+from service.events import event_broker
+from service.invalidation import invalidation_bus
+from service.trending import trending_buffer, trending_feed
+from service.watch_history import watch_history_buffer
 
 logger = logging.getLogger(__name__)
-app = FastAPI()
+_import_elapsed = time.perf_counter() - _import_started
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    # 워커가 요청을 받기 전에 커넥션 풀을 미리 채운다.
+    started = time.perf_counter()
+    await warm_up_pool()
+    logger.info(
+        "Worker ready: import %.3fs, pool warm-up %.3fs",
+        _import_elapsed,
+        time.perf_counter() - started,
+    )
+    watch_history_buffer.start()
+    counter_buffer.start()
+    counter_reconciler.start()
+    trending_buffer.start()
+    trending_feed.start()
+    await invalidation_bus.start()
+    await event_broker.start()
+    yield
+    await event_broker.stop()
+    await invalidation_bus.stop()
+    # 버퍼에 남은 시청 기록, 카운터 증감과 인기 점수를 쓴 뒤 커넥션을 닫는다.
+    await trending_feed.stop()
+    await counter_reconciler.stop()
+    await watch_history_buffer.stop()
+    await counter_buffer.stop()
+    await trending_buffer.stop()
+    await dispose_engines()
+
+
+# 직렬화 비용을 줄이기 위해 orjson 으로 응답을 만든다 (설치되어 있지 않으면 표준 json).
+app = FastAPI(lifespan=lifespan, default_response_class=FastJSONResponse)
+
+# 요청 시간을 auth / service / db / serialization 단계로 나눠 측정한다.
+app.add_middleware(RequestTimingMiddleware)
 
 app.include_router(api_v1_router, prefix="/api/v1")
 
 
+# Prometheus 수집 엔드포인트 (워커별 값, 라우트와 서비스 함수별 히스토그램)
+@app.get("/metrics", include_in_schema=False)
+async def metrics():
+    return PlainTextResponse(render_metrics(), media_type=CONTENT_TYPE)
+
+
 if __name__ == "__main__":
+    import os
+
     import uvicorn
 
     from core.config import Config
+    from repositories import has_replicas
+
+    if has_replicas() and "redis" not in (Config.CACHE_BACKEND, Config.EVENTS_TRANSPORT):
+        # 최근에 쓴 클라이언트의 표식은 이 컨테이너의 워커끼리만 공유된다.
+        logger.warning(
+            "Read replicas are configured without a redis cache or event transport: "
+            "read-your-writes only holds for the workers of this container"
+        )
+
+    if Config.API_WORKERS > 1 and Config.EVENTS_TRANSPORT == "local":
+        # 워커끼리 알림과 캐시 무효화를 주고받도록 이 프로세스에서 소켓 허브를 띄운다.
+        from service.transport import SocketHub
+
+        SocketHub(Config.EVENTS_SOCKET_PATH).start_in_thread()
+        os.environ["EVENTS_TRANSPORT"] = "socket"
 
-    uvicorn.run("app:app", host=Config.API_URL, port=Config.API_PORT)
\ No newline at end of file
+    uvicorn.run("app:app", host=Config.API_URL, port=int(Config.API_PORT), workers=Config.API_WORKERS)
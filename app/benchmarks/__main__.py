@@ -0,0 +1,94 @@
+"""Benchmark the API in process and compare the results with a stored baseline.
+
+Run from the `app` directory (benchmark dependencies: benchmarks/requirements.txt):
+
+    python -m benchmarks                      # HTTP scenarios + micro benchmarks on a fresh SQLite file
+    python -m benchmarks --database mysql     # against the database configured by MYSQL_*
+    python -m benchmarks --save-baseline      # store the results as the new baseline
+
+The exit status is 1 when a benchmark regressed by more than `--tolerance`
+relative to the baseline. Baselines are only comparable on the same machine
+and database.
+"""
+import argparse
+import asyncio
+import logging
+import os
+import sys
+
+from benchmarks import environment
+
+HTTP_SCENARIOS = ["login", "user_list", "works_by_user", "create_work"]
+DEFAULT_BASELINE = os.path.join(os.path.dirname(os.path.abspath(__file__)), "baseline.json")
+
+
+def _parse_args(argv):
+    parser = argparse.ArgumentParser(prog="python -m benchmarks", description=__doc__.splitlines()[0])
+    parser.add_argument("--database", choices=["sqlite", "mysql"], default="sqlite")
+    parser.add_argument("--database-url", help="sync SQLAlchemy URL (overrides --database)")
+    parser.add_argument("--async-database-url", help="async SQLAlchemy URL matching --database-url")
+    parser.add_argument("--scenarios", default=",".join(HTTP_SCENARIOS), help="comma separated HTTP scenarios ('' for none)")
+    parser.add_argument("--no-micro", action="store_true", help="skip the micro benchmarks")
+    parser.add_argument("--users", type=int, default=200, help="seeded users")
+    parser.add_argument("--works-per-user", type=int, default=20, help="seeded works per user")
+    parser.add_argument("--requests", type=int, default=1000, help="requests per HTTP scenario (scaled per scenario)")
+    parser.add_argument("--concurrency", type=int, default=10)
+    parser.add_argument("--iterations", type=int, default=2000, help="iterations per micro benchmark")
+    parser.add_argument("--warmup", type=int, default=100)
+    parser.add_argument("--baseline", default=DEFAULT_BASELINE)
+    parser.add_argument("--save-baseline", action="store_true")
+    parser.add_argument("--tolerance", type=float, default=0.2, help="allowed regression as a fraction")
+    args = parser.parse_args(argv)
+
+    args.scenarios = [name for name in args.scenarios.split(",") if name]
+    unknown = set(args.scenarios) - set(HTTP_SCENARIOS)
+    if unknown:
+        parser.error(f"unknown scenarios: {sorted(unknown)}")
+    return args
+
+
+def main(argv=None) -> int:
+    args = _parse_args(argv)
+    logging.basicConfig(level=logging.WARNING)
+    # SQLite 는 쓰기를 직렬화하므로 동시 쓰기 시나리오에서 느린 쿼리 경고가 쏟아진다.
+    logging.getLogger("repositories.query_log").setLevel(logging.ERROR)
+    # 설정은 import 시점에 환경 변수에서 읽으므로, 앱 모듈을 가져오기 전에 DB 를 지정한다.
+    label = environment.configure(args.database, args.database_url, args.async_database_url)
+
+    from benchmarks.http import Fixtures, run_http
+    from benchmarks.micro import run_micro
+    from benchmarks.report import compare, load_baseline, print_table, save_baseline
+
+    user_ids = environment.prepare(args.users, args.works_per_user)
+    results = {}
+    if args.scenarios:
+        fixtures = Fixtures(user_ids, environment.usernames(user_ids))
+        results.update(asyncio.run(run_http(args.scenarios, fixtures, args.requests, args.concurrency, args.warmup)))
+    if not args.no_micro:
+        results.update(run_micro(user_ids, args.iterations, args.warmup))
+
+    baseline = load_baseline(args.baseline)
+    baseline_results = baseline["results"] if baseline else None
+    print_table(results, baseline_results)
+
+    if args.save_baseline:
+        meta = {key: getattr(args, key) for key in ("users", "works_per_user", "requests", "concurrency", "iterations")}
+        save_baseline(args.baseline, results, {**meta, "database": label})
+        print(f"\nBaseline saved to {args.baseline}")
+        return 0
+    if baseline_results is None:
+        print(f"\nNo baseline at {args.baseline} (use --save-baseline)")
+        return 0
+
+    regressions = compare(results, baseline_results, args.tolerance)
+    if regressions:
+        print(f"\nRegressions (tolerance {args.tolerance:.0%}):")
+        for message in regressions:
+            print(f"  {message}")
+        return 1
+    print(f"\nNo regressions (tolerance {args.tolerance:.0%})")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,125 @@
+import asyncio
+import itertools
+import time
+from typing import Awaitable, Callable, Dict, List
+
+import httpx
+
+from benchmarks.environment import BENCH_PASSWORD
+from benchmarks.report import Result, summarize
+
+API = "/api/v1"
+
+# 시나리오: (client, 사용자 풀, 요청 번호) -> 응답
+Scenario = Callable[[httpx.AsyncClient, "Fixtures", int], Awaitable[httpx.Response]]
+
+
+class Fixtures:
+    """Seeded users and a login token per user, shared by the scenarios."""
+
+    def __init__(self, user_ids: List[int], usernames: List[str]):
+        self.user_ids = user_ids
+        self.usernames = usernames
+        self.tokens: Dict[int, str] = {}
+
+    def pick(self, i: int) -> int:
+        return i % len(self.user_ids)
+
+    async def login_all(self, client: httpx.AsyncClient, count: int) -> None:
+        for index in range(min(count, len(self.user_ids))):
+            response = await _login(client, self, index)
+            response.raise_for_status()
+            self.tokens[index] = response.headers["Authorization"]
+
+
+async def _login(client: httpx.AsyncClient, fixtures: Fixtures, i: int) -> httpx.Response:
+    index = fixtures.pick(i)
+    return await client.post(
+        f"{API}/auth/login",
+        json={"username": fixtures.usernames[index], "password": BENCH_PASSWORD},
+    )
+
+
+async def _user_list(client: httpx.AsyncClient, fixtures: Fixtures, i: int) -> httpx.Response:
+    return await client.get(f"{API}/users/", params={"limit": 20})
+
+
+async def _works_by_user(client: httpx.AsyncClient, fixtures: Fixtures, i: int) -> httpx.Response:
+    user_id = fixtures.user_ids[fixtures.pick(i)]
+    return await client.get(f"{API}/works/{user_id}", params={"limit": 20})
+
+
+async def _create_work(client: httpx.AsyncClient, fixtures: Fixtures, i: int) -> httpx.Response:
+    index = i % len(fixtures.tokens)
+    return await client.post(
+        f"{API}/works/",
+        json={"title": f"bench work {i}", "description": "created by the benchmark"},
+        headers={"Authorization": fixtures.tokens[index]},
+    )
+
+
+# 이름 -> (시나리오, 요청 수 배율). 로그인은 PBKDF2 해시 비용 때문에 적게 보낸다.
+SCENARIOS: Dict[str, tuple] = {
+    "login": (_login, 0.05),
+    "user_list": (_user_list, 1.0),
+    "works_by_user": (_works_by_user, 1.0),
+    "create_work": (_create_work, 0.5),
+}
+
+
+async def _measure(
+    client: httpx.AsyncClient,
+    scenario: Scenario,
+    fixtures: Fixtures,
+    requests: int,
+    concurrency: int,
+) -> Result:
+    latencies: List[float] = []
+    errors = 0
+    counter = itertools.count()
+
+    async def worker():
+        nonlocal errors
+        while True:
+            i = next(counter)
+            if i >= requests:
+                return
+            started = time.perf_counter()
+            response = await scenario(client, fixtures, i)
+            elapsed = time.perf_counter() - started
+            if response.status_code >= 400:
+                errors += 1
+            else:
+                latencies.append(elapsed)
+
+    started = time.perf_counter()
+    await asyncio.gather(*(worker() for _ in range(concurrency)))
+    return summarize(latencies, time.perf_counter() - started, errors)
+
+
+async def run_http(
+    names: List[str],
+    fixtures: Fixtures,
+    requests: int,
+    concurrency: int,
+    warmup: int,
+) -> Dict[str, Result]:
+    """Run the HTTP scenarios in `names` against the app, in process.
+
+    Requests go through the full ASGI stack (routing, validation, services,
+    serialisation) via httpx's ASGI transport, without a network socket, and the
+    app's lifespan runs around the whole run as it does under uvicorn.
+    """
+    from app import app
+
+    results = {}
+    transport = httpx.ASGITransport(app=app)
+    async with app.router.lifespan_context(app):
+        async with httpx.AsyncClient(transport=transport, base_url="http://bench") as client:
+            await fixtures.login_all(client, concurrency)
+            for name in names:
+                scenario, share = SCENARIOS[name]
+                count = max(int(requests * share), concurrency)
+                await _measure(client, scenario, fixtures, max(int(warmup * share), 1), 1)
+                results[f"http.{name}"] = await _measure(client, scenario, fixtures, count, concurrency)
+    return results
@@ -0,0 +1,73 @@
+import time
+from typing import Callable, Dict, List
+
+from benchmarks.report import Result, summarize
+
+
+def _time(fn: Callable[[], object], iterations: int, warmup: int, batch: int = 1) -> Result:
+    """Time `iterations` calls of `fn`.
+
+    Calls that take only microseconds are timed `batch` at a time (reporting the
+    mean per call), so the timer's own overhead does not dominate the result.
+    """
+    for _ in range(warmup):
+        fn()
+    latencies: List[float] = []
+    started = time.perf_counter()
+    for _ in range(max(iterations // batch, 1)):
+        op_started = time.perf_counter()
+        for _ in range(batch):
+            fn()
+        latencies.extend([(time.perf_counter() - op_started) / batch] * batch)
+    return summarize(latencies, time.perf_counter() - started)
+
+
+def run_micro(user_ids: List[int], iterations: int, warmup: int) -> Dict[str, Result]:
+    """Time the hot helpers the endpoints are built from, on the synchronous stack.
+
+    - `to_response_model`: mapping one ORM entity to its response model.
+    - `BaseRepository.search`: a projected, keyset-paginated works-by-user query.
+    - `Service._update_model`: load, diff and update one work, with its commit.
+    """
+    from datetime import datetime
+
+    from db.models import Work
+    from repositories import Repository, SessionLocal
+    from schemas.models import WorkBatchUpdate, WorkResponse
+    from service.projection import get_projection
+    from service.service import Service, to_response_model
+
+    results = {}
+    work = Work(
+        id=1,
+        user_id=user_ids[0],
+        title="benchmark",
+        description="benchmark work " * 8,
+        favorite_count=0,
+        created_at=datetime.now(),
+    )
+    results["micro.to_response_model"] = _time(
+        lambda: to_response_model(WorkResponse, work), iterations * 10, warmup, batch=100
+    )
+
+    projection = get_projection(Work, WorkResponse)
+    with SessionLocal() as db_session:
+        repo = Repository(db_session)
+        user_id = user_ids[len(user_ids) // 2]
+        results["micro.repository_search"] = _time(
+            lambda: repo.works.search([("user_id", "eq", user_id)], limit=20, columns=projection.columns),
+            iterations,
+            warmup,
+        )
+
+        service = Service(repo)
+        work_id = repo.works.search([("user_id", "eq", user_id)], limit=1)[0].id
+        titles = iter(range(iterations + warmup))
+        results["micro.service_update_model"] = _time(
+            lambda: service._update_model(
+                repo.works, Work, WorkResponse, WorkBatchUpdate, work_id, {"title": f"updated {next(titles)}"}
+            ),
+            iterations,
+            warmup,
+        )
+    return results
@@ -0,0 +1,101 @@
+import json
+import os
+import platform
+import sys
+from datetime import datetime
+from typing import Dict, List, Optional, Sequence
+
+# 결과 한 건: {"count", "errors", "rps", "p50", "p90", "p99", "max"} (시간은 ms)
+Result = Dict[str, float]
+
+PERCENTILES = (50, 90, 99)
+
+
+def percentile(sorted_values: Sequence[float], q: float) -> float:
+    """The `q`-th percentile of already sorted values, by linear interpolation."""
+    if not sorted_values:
+        return 0.0
+    position = (len(sorted_values) - 1) * q / 100
+    lower = int(position)
+    upper = min(lower + 1, len(sorted_values) - 1)
+    return sorted_values[lower] + (sorted_values[upper] - sorted_values[lower]) * (position - lower)
+
+
+def summarize(latencies: List[float], elapsed: float, errors: int = 0) -> Result:
+    """Summarise per-operation latencies (in seconds) measured over `elapsed` seconds."""
+    values = sorted(latencies)
+    result = {
+        "count": len(values),
+        "errors": errors,
+        "rps": round(len(values) / elapsed, 1) if elapsed > 0 else 0.0,
+    }
+    for q in PERCENTILES:
+        result[f"p{q}"] = round(percentile(values, q) * 1000, 3)
+    result["max"] = round(values[-1] * 1000, 3) if values else 0.0
+    return result
+
+
+def print_table(results: Dict[str, Result], baseline: Optional[Dict[str, Result]] = None, file=sys.stdout) -> None:
+    header = f"{'benchmark':<28}{'count':>8}{'err':>5}{'rps':>11}{'p50 ms':>10}{'p90 ms':>10}{'p99 ms':>10}{'max ms':>10}"
+    if baseline is not None:
+        header += f"{'rps vs base':>13}{'p50 vs base':>13}"
+    print(header, file=file)
+    print("-" * len(header), file=file)
+    for name, result in results.items():
+        line = (
+            f"{name:<28}{result['count']:>8}{result['errors']:>5}{result['rps']:>11.1f}"
+            f"{result['p50']:>10.3f}{result['p90']:>10.3f}{result['p99']:>10.3f}{result['max']:>10.3f}"
+        )
+        base = (baseline or {}).get(name)
+        if base:
+            line += f"{_change(result['rps'], base['rps']):>13}{_change(result['p50'], base['p50']):>13}"
+        print(line, file=file)
+
+
+def _change(value: float, base: float) -> str:
+    if not base:
+        return "-"
+    return f"{(value - base) / base:+.1%}"
+
+
+def load_baseline(path: str) -> Optional[dict]:
+    if not os.path.exists(path):
+        return None
+    with open(path) as f:
+        return json.load(f)
+
+
+def save_baseline(path: str, results: Dict[str, Result], meta: dict) -> None:
+    document = {
+        "meta": {
+            **meta,
+            "created_at": datetime.now().isoformat(timespec="seconds"),
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+        },
+        "results": results,
+    }
+    with open(path, "w") as f:
+        json.dump(document, f, indent=2, sort_keys=True)
+        f.write("\n")
+
+
+def compare(results: Dict[str, Result], baseline: Dict[str, Result], tolerance: float) -> List[str]:
+    """Return a message for every benchmark that regressed by more than `tolerance`.
+
+    A benchmark regresses when its throughput drops, or its median latency grows,
+    by more than `tolerance` (a fraction, e.g. 0.2 for 20%) relative to the baseline,
+    or when it has errors the baseline did not have.
+    """
+    regressions = []
+    for name, result in results.items():
+        base = baseline.get(name)
+        if not base:
+            continue
+        if base["rps"] and result["rps"] < base["rps"] * (1 - tolerance):
+            regressions.append(f"{name}: {result['rps']:.1f} rps < baseline {base['rps']:.1f} rps")
+        if base["p50"] and result["p50"] > base["p50"] * (1 + tolerance):
+            regressions.append(f"{name}: p50 {result['p50']:.3f} ms > baseline {base['p50']:.3f} ms")
+        if result["errors"] > base.get("errors", 0):
+            regressions.append(f"{name}: {result['errors']} errors (baseline {base.get('errors', 0)})")
+    return regressions
@@ -12,9 +12,124 @@ class Config:
     DB_USER=os.getenv("MYSQL_USER", "root")
     DB_PW=os.getenv("MYSQL_PASSWORD", "rootpassword")
     DB_NAME=os.getenv("MYSQL_DB", "mydb")
+    DB_ASYNC_DRIVER=os.getenv("MYSQL_ASYNC_DRIVER", "aiomysql")
+    # 접속 URL 을 직접 지정하면 위 MySQL 설정 대신 사용한다 (벤치마크용 로컬 SQLite 등)
+    DB_URL=os.getenv("DATABASE_URL")
+    DB_ASYNC_URL=os.getenv("ASYNC_DATABASE_URL")
+
+    # 읽기 전용 복제본 (쉼표로 구분한 호스트, 계정/DB 는 위와 같다) 또는 접속 URL 을 직접 지정
+    DB_REPLICA_HOSTS=[host for host in os.getenv("MYSQL_REPLICA_HOSTS", "").split(",") if host]
+    DB_REPLICA_URLS=[url for url in os.getenv("REPLICA_DATABASE_URLS", "").split(",") if url]
+    DB_ASYNC_REPLICA_URLS=[url for url in os.getenv("ASYNC_REPLICA_DATABASE_URLS", "").split(",") if url]
+    # 복제 지연 상한 (초): 쓰기를 한 클라이언트는 이 시간 동안 primary 에서 읽는다
+    DB_REPLICA_LAG=float(os.getenv("DB_REPLICA_LAG", "5"))
+
+    # 커넥션 풀 설정 (uvicorn 워커 하나당 적용된다)
+    DB_POOL_SIZE=int(os.getenv("DB_POOL_SIZE", "5"))
+    DB_MAX_OVERFLOW=int(os.getenv("DB_MAX_OVERFLOW", "10"))
+    DB_POOL_TIMEOUT=float(os.getenv("DB_POOL_TIMEOUT", "30"))
+    # MySQL wait_timeout 보다 짧게 유지해야 끊어진 커넥션을 재사용하지 않는다.
+    DB_POOL_RECYCLE=int(os.getenv("DB_POOL_RECYCLE", "1800"))
+    DB_POOL_PRE_PING=os.getenv("DB_POOL_PRE_PING", "true").lower() in ("1", "true", "yes")
     
+    # 목록 조회 페이지 크기
+    PAGE_SIZE_DEFAULT=int(os.getenv("PAGE_SIZE_DEFAULT", "20"))
+    PAGE_SIZE_MAX=int(os.getenv("PAGE_SIZE_MAX", "100"))
+
+    # 목록 조회 include= 로 함께 불러오는 컬렉션의 부모당 최대 행 수 (최신 순, 0 이면 전부)
+    INCLUDE_COLLECTION_LIMIT=int(os.getenv("INCLUDE_COLLECTION_LIMIT", "5"))
+
+    # 일괄 생성/수정 (multi-row INSERT 한 번에 넣는 최대 행 수, 요청당 최대 항목 수)
+    BULK_CHUNK_SIZE=int(os.getenv("BULK_CHUNK_SIZE", "500"))
+    BATCH_MAX_ITEMS=int(os.getenv("BATCH_MAX_ITEMS", "1000"))
+
+    # 서비스 조회 캐시 (memory: 워커 내 LRU+TTL, redis: 워커 간 공유, none: 사용 안 함)
+    CACHE_BACKEND=os.getenv("CACHE_BACKEND", "memory")
+    CACHE_TTL=float(os.getenv("CACHE_TTL", "60"))
+    CACHE_MAX_ENTRIES=int(os.getenv("CACHE_MAX_ENTRIES", "10000"))
+    CACHE_REDIS_URL=os.getenv("CACHE_REDIS_URL", "redis://localhost:6379/0")
+
+    # id 조회 묶음 처리 (이 시간 동안 들어온 조회를 IN 쿼리 하나로, 한 번에 묶는 최대 키 수)
+    LOADER_ENABLED=os.getenv("LOADER_ENABLED", "true").lower() in ("1", "true", "yes")
+    LOADER_BATCH_DELAY=float(os.getenv("LOADER_BATCH_DELAY", "0.002"))
+    LOADER_MAX_BATCH_SIZE=int(os.getenv("LOADER_MAX_BATCH_SIZE", "100"))
+
+    # 회차 본문 스트리밍 시 한 번에 읽는 바이트 수
+    EPISODE_CHUNK_SIZE=int(os.getenv("EPISODE_CHUNK_SIZE", "65536"))
+
+    # 시청 기록 쓰기 버퍼 (이 개수가 쌓이거나 주기가 지나면 upsert, 버퍼에 둘 수 있는 최대 (유저, 작품) 수)
+    WATCH_HISTORY_FLUSH_SIZE=int(os.getenv("WATCH_HISTORY_FLUSH_SIZE", "500"))
+    WATCH_HISTORY_FLUSH_INTERVAL=float(os.getenv("WATCH_HISTORY_FLUSH_INTERVAL", "5"))
+    WATCH_HISTORY_MAX_PENDING=int(os.getenv("WATCH_HISTORY_MAX_PENDING", "50000"))
+
+    # 좋아요/선호 수 증감 버퍼 (반영 주기, 한 번에 반영하는 최대 행 수, 버퍼 상한)와 재계산 주기 (0 이면 사용 안 함)
+    COUNTER_FLUSH_SIZE=int(os.getenv("COUNTER_FLUSH_SIZE", "1000"))
+    COUNTER_FLUSH_INTERVAL=float(os.getenv("COUNTER_FLUSH_INTERVAL", "1"))
+    COUNTER_MAX_PENDING=int(os.getenv("COUNTER_MAX_PENDING", "100000"))
+    COUNTER_RECONCILE_INTERVAL=float(os.getenv("COUNTER_RECONCILE_INTERVAL", "3600"))
+    COUNTER_RECONCILE_BATCH_SIZE=int(os.getenv("COUNTER_RECONCILE_BATCH_SIZE", "1000"))
+    # 재계산 구간마다 모든 워커가 증감 버퍼를 비웠다고 답하기를 기다리는 최대 시간 (초)
+    COUNTER_RECONCILE_FLUSH_TIMEOUT=float(os.getenv("COUNTER_RECONCILE_FLUSH_TIMEOUT", "5"))
+
+    # 인기 작품 점수 (반감기 (초), 시청/선호 한 건의 가중치)
+    # 반감기를 바꾸면 이미 저장된 점수와 섞이므로 work_trending 테이블을 비운다.
+    TRENDING_HALF_LIFE=float(os.getenv("TRENDING_HALF_LIFE", "86400"))
+    TRENDING_WATCH_WEIGHT=float(os.getenv("TRENDING_WATCH_WEIGHT", "1"))
+    TRENDING_FAVORITE_WEIGHT=float(os.getenv("TRENDING_FAVORITE_WEIGHT", "5"))
+    # 이 점수 아래로 식은 작품은 랭킹 테이블에서 지운다 (정리 주기 (초), 0 이면 사용 안 함)
+    TRENDING_MIN_SCORE=float(os.getenv("TRENDING_MIN_SCORE", "0.01"))
+    TRENDING_PRUNE_INTERVAL=float(os.getenv("TRENDING_PRUNE_INTERVAL", "3600"))
+    # 인기 작품 점수 쓰기 버퍼 (반영 주기, 한 번에 반영하는 최대 작품 수, 버퍼 상한)
+    TRENDING_FLUSH_SIZE=int(os.getenv("TRENDING_FLUSH_SIZE", "1000"))
+    TRENDING_FLUSH_INTERVAL=float(os.getenv("TRENDING_FLUSH_INTERVAL", "5"))
+    TRENDING_MAX_PENDING=int(os.getenv("TRENDING_MAX_PENDING", "100000"))
+    # 워커마다 메모리에 두는 상위 작품 수와 랭킹 테이블에서 다시 읽는 주기 (초)
+    TRENDING_TOP_K=int(os.getenv("TRENDING_TOP_K", "100"))
+    TRENDING_REFRESH_INTERVAL=float(os.getenv("TRENDING_REFRESH_INTERVAL", "10"))
+
+    # 비슷한 작품 추천 배치 (작품당 저장하는 이웃 수, 선호/시청 한 건의 가중치)
+    SIMILAR_WORKS_TOP_N=int(os.getenv("SIMILAR_WORKS_TOP_N", "20"))
+    SIMILAR_WORKS_FAVORITE_WEIGHT=float(os.getenv("SIMILAR_WORKS_FAVORITE_WEIGHT", "2"))
+    SIMILAR_WORKS_WATCH_WEIGHT=float(os.getenv("SIMILAR_WORKS_WATCH_WEIGHT", "1"))
+    # 한 번에 읽는 선호/시청 행 수, 한 번에 유사도를 계산하는 작품 수 (메모리 사용량을 정한다)
+    SIMILAR_WORKS_CHUNK_SIZE=int(os.getenv("SIMILAR_WORKS_CHUNK_SIZE", "100000"))
+    SIMILAR_WORKS_BLOCK_SIZE=int(os.getenv("SIMILAR_WORKS_BLOCK_SIZE", "1000"))
+
+    # 워커 간 메시지 전달 (새 회차/공지/댓글 알림과 캐시 무효화가 함께 쓴다)
+    # local: 한 워커 안에서만, socket: 같은 호스트의 워커끼리 Unix 소켓 허브로, redis: Redis pub/sub 으로 모든 컨테이너에
+    # python app.py 를 워커 여러 개로 띄우면 local 대신 socket 을 쓰고 허브도 직접 띄운다.
+    EVENTS_TRANSPORT=os.getenv("EVENTS_TRANSPORT", "local")
+    EVENTS_SOCKET_PATH=os.getenv("EVENTS_SOCKET_PATH", "/tmp/app-events.sock")
+    EVENTS_REDIS_URL=os.getenv("EVENTS_REDIS_URL", CACHE_REDIS_URL)
+    # 새 회차/공지/댓글 알림 (SSE/WebSocket)
+    # 구독자마다 쌓아 둘 수 있는 이벤트 수 (넘으면 느린 구독자로 보고 연결을 끊는다), 워커당 최대 구독자 수
+    EVENTS_QUEUE_SIZE=int(os.getenv("EVENTS_QUEUE_SIZE", "100"))
+    EVENTS_MAX_SUBSCRIBERS=int(os.getenv("EVENTS_MAX_SUBSCRIBERS", "10000"))
+    # 이벤트가 없을 때 SSE 연결에 keep-alive 주석을 보내는 주기 (초)
+    EVENTS_HEARTBEAT_INTERVAL=float(os.getenv("EVENTS_HEARTBEAT_INTERVAL", "15"))
+
+    # 느린 쿼리 로그 (임계값 이상 걸린 SELECT 는 EXPLAIN 결과도 남긴다, 집계하는 문장 수 상한)
+    SLOW_QUERY_THRESHOLD_MS=float(os.getenv("SLOW_QUERY_THRESHOLD_MS", "200"))
+    SLOW_QUERY_EXPLAIN=os.getenv("SLOW_QUERY_EXPLAIN", "true").lower() in ("1", "true", "yes")
+    SLOW_QUERY_MAX_STATEMENTS=int(os.getenv("SLOW_QUERY_MAX_STATEMENTS", "1000"))
+
+    # 요청별 단계 시간 (auth/service/db/serialization) 을 Server-Timing 헤더로도 내려준다
+    SERVER_TIMING=os.getenv("SERVER_TIMING", "false").lower() in ("1", "true", "yes")
+
+    # 검색 결과를 넘겨볼 수 있는 최대 위치 (offset + limit)
+    SEARCH_MAX_RESULTS=int(os.getenv("SEARCH_MAX_RESULTS", "1000"))
+
     API_URL=os.getenv("API_URL", "127.0.0.1")
     API_PORT=os.getenv("API_HOST", "8000")
+    # python app.py 로 띄울 워커 프로세스 수
+    API_WORKERS=int(os.getenv("API_WORKERS", "1"))
     
     JWT_SECRET_KEY=os.getenv("JWT_SECRET_KEY", "jwt_sercret_key")
+
+    # /internal 운영 API 호출에 필요한 토큰 (X-Internal-Token 헤더, 비워 두면 운영 API 를 막는다)
+    INTERNAL_API_TOKEN=os.getenv("INTERNAL_API_TOKEN", "")
+
+    # 비밀번호 해시 (PBKDF2-SHA256 반복 횟수, 해시 전용 스레드 수)
+    PASSWORD_HASH_ITERATIONS=int(os.getenv("PASSWORD_HASH_ITERATIONS", "600000"))
+    PASSWORD_HASH_WORKERS=int(os.getenv("PASSWORD_HASH_WORKERS", str(os.cpu_count() or 1)))
     
\ No newline at end of file
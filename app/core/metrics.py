@@ -0,0 +1,184 @@
+import threading
+import time
+from bisect import bisect_left
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Dict, List, Optional, Sequence, Tuple
+
+from core.config import Config
+
+# Prometheus 텍스트 형식 (text/plain; version=0.0.4)
+CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+
+# 히스토그램 구간 (초)
+DEFAULT_BUCKETS = (0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+
+_registry: List["Histogram"] = []
+
+
+def _escape(value: str) -> str:
+    return value.replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+class Histogram:
+    """A cumulative histogram with labels, rendered in the Prometheus text format.
+
+    Values are per worker process (like the pool and query statistics); Prometheus
+    sums the workers' series when they are scraped separately.
+
+    Attributes:
+        name (str): The metric name, e.g. "http_request_duration_seconds".
+        documentation (str): The HELP text.
+        labelnames (Tuple[str, ...]): The label names, in the order `observe` takes them.
+        buckets (Tuple[float, ...]): The upper bounds of the buckets, ascending.
+    """
+
+    def __init__(self, name: str, documentation: str, labelnames: Sequence[str], buckets: Sequence[float] = DEFAULT_BUCKETS):
+        self.name = name
+        self.documentation = documentation
+        self.labelnames = tuple(labelnames)
+        self.buckets = tuple(buckets)
+        self._lock = threading.Lock()
+        # 레이블 값 -> [구간별 개수..., +Inf 개수], 합계
+        self._counts: Dict[Tuple[str, ...], List[int]] = {}
+        self._sums: Dict[Tuple[str, ...], float] = {}
+        _registry.append(self)
+
+    def observe(self, value: float, *labels: str) -> None:
+        with self._lock:
+            counts = self._counts.get(labels)
+            if counts is None:
+                counts = self._counts[labels] = [0] * (len(self.buckets) + 1)
+                self._sums[labels] = 0.0
+            counts[bisect_left(self.buckets, value)] += 1
+            self._sums[labels] += value
+
+    def render(self) -> List[str]:
+        lines = [f"# HELP {self.name} {self.documentation}", f"# TYPE {self.name} histogram"]
+        with self._lock:
+            series = sorted((labels, list(counts), self._sums[labels]) for labels, counts in self._counts.items())
+        for labels, counts, total in series:
+            label_text = ",".join(f'{name}="{_escape(value)}"' for name, value in zip(self.labelnames, labels))
+            prefix = f"{label_text}," if label_text else ""
+            cumulative = 0
+            for bound, count in zip(self.buckets + (float("inf"),), counts):
+                cumulative += count
+                le = "+Inf" if bound == float("inf") else repr(bound)
+                lines.append(f'{self.name}_bucket{{{prefix}le="{le}"}} {cumulative}')
+            lines.append(f"{self.name}_sum{{{label_text}}} {total}")
+            lines.append(f"{self.name}_count{{{label_text}}} {cumulative}")
+        return lines
+
+
+def render_metrics() -> str:
+    """Render every registered metric in the Prometheus text format."""
+    lines = []
+    for histogram in _registry:
+        lines.extend(histogram.render())
+    return "\n".join(lines) + "\n"
+
+
+request_duration = Histogram(
+    "http_request_duration_seconds",
+    "Time from receiving a request to sending the end of its response.",
+    ("method", "route", "status"),
+)
+request_phase_duration = Histogram(
+    "http_request_phase_seconds",
+    "Time a request spent in each phase (auth, service, db, serialization, other); db is part of service.",
+    ("route", "phase"),
+)
+service_function_duration = Histogram(
+    "service_function_duration_seconds",
+    "Time spent in a service function, including its database time.",
+    ("function",),
+)
+db_statement_duration = Histogram(
+    "db_statement_duration_seconds",
+    "Time spent executing SQL statements, by calling service function.",
+    ("function",),
+)
+
+
+class RequestTimings:
+    """The time one request has spent in each phase so far (seconds)."""
+
+    __slots__ = ("phases",)
+
+    def __init__(self):
+        self.phases: Dict[str, float] = {}
+
+    def add(self, phase: str, elapsed: float) -> None:
+        self.phases[phase] = self.phases.get(phase, 0.0) + elapsed
+
+
+# 현재 요청의 단계별 시간 (RequestTimingMiddleware 가 설정한다)
+_current_timings: ContextVar[Optional[RequestTimings]] = ContextVar("request_timings", default=None)
+
+
+def record_phase(phase: str, elapsed: float) -> None:
+    """Add `elapsed` seconds to `phase` of the current request (no-op outside requests)."""
+    timings = _current_timings.get()
+    if timings is not None:
+        timings.add(phase, elapsed)
+
+
+@contextmanager
+def timed(phase: str):
+    """Time the block as `phase` of the current request."""
+    started = time.perf_counter()
+    try:
+        yield
+    finally:
+        record_phase(phase, time.perf_counter() - started)
+
+
+class RequestTimingMiddleware:
+    """ASGI middleware that times each HTTP request and its phases.
+
+    The phases are recorded by hooks in the code that does the work (`verify_token`,
+    the service dispatch, the SQLAlchemy statement events and the response
+    renderers) into a per-request `RequestTimings`, which the hooks reach through a
+    context variable. "other" is the rest: routing, request validation and the
+    framework's own response handling.
+
+    With `Config.SERVER_TIMING` set, the breakdown is also sent to the client in a
+    `Server-Timing` header.
+    """
+
+    def __init__(self, app):
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        timings = RequestTimings()
+        token = _current_timings.set(timings)
+        started = time.perf_counter()
+        status = 500
+
+        async def send_with_timings(message):
+            nonlocal status
+            if message["type"] == "http.response.start":
+                status = message["status"]
+                if Config.SERVER_TIMING:
+                    header = ", ".join(f"{phase};dur={elapsed * 1000:.2f}" for phase, elapsed in timings.phases.items())
+                    if header:
+                        message["headers"] = list(message.get("headers", [])) + [(b"server-timing", header.encode())]
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_with_timings)
+        finally:
+            _current_timings.reset(token)
+            elapsed = time.perf_counter() - started
+            route = scope.get("route")
+            # 경로 변수를 그대로 레이블로 쓰지 않도록 라우트의 경로 템플릿을 쓴다.
+            route_path = getattr(route, "path", None) or "<unmatched>"
+            request_duration.observe(elapsed, scope["method"], route_path, str(status))
+            for phase, phase_elapsed in timings.phases.items():
+                request_phase_duration.observe(phase_elapsed, route_path, phase)
+            accounted = sum(value for phase, value in timings.phases.items() if phase != "db")
+            request_phase_duration.observe(max(elapsed - accounted, 0.0), route_path, "other")
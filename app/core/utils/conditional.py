@@ -0,0 +1,98 @@
+import hashlib
+from datetime import datetime, timezone
+from email.utils import format_datetime, parsedate_to_datetime
+from typing import Dict, Optional
+
+import pytz
+
+# DB 의 TIMESTAMP 값은 서울 시각으로 저장된다 (db.models 참고).
+_DB_TIMEZONE = pytz.timezone('Asia/Seoul')
+
+
+def make_etag(version: str, *variant: object) -> str:
+    """Build a weak ETag from a resource version and the request parameters that shape the body.
+
+    The ETag is weak (`W/"..."`) because it identifies the state of the rows, not the
+    exact bytes of the response.
+
+    Args:
+        version (str): The version of the rows (`ResourceVersion.tag`).
+        *variant (object): Parameters that select a different body of the same rows,
+            e.g. the page cursor and limit.
+
+    Returns:
+        str: The ETag header value.
+    """
+    digest = hashlib.sha1("|".join([version, *map(str, variant)]).encode()).hexdigest()
+    return f'W/"{digest[:16]}"'
+
+
+def _as_utc(value: datetime) -> datetime:
+    if value.tzinfo is None:
+        value = _DB_TIMEZONE.localize(value)
+    return value.astimezone(timezone.utc)
+
+
+def format_http_date(value: datetime) -> str:
+    """Format a DB timestamp as an HTTP date (`Sun, 06 Nov 1994 08:49:37 GMT`)."""
+    return format_datetime(_as_utc(value).replace(microsecond=0), usegmt=True)
+
+
+def parse_http_date(value: Optional[str]) -> Optional[datetime]:
+    """Parse an HTTP date header, or return None when it is missing or invalid."""
+    if not value:
+        return None
+    try:
+        parsed = parsedate_to_datetime(value)
+    except (TypeError, ValueError, IndexError):
+        return None
+    if parsed is None:
+        return None
+    return _as_utc(parsed) if parsed.tzinfo else parsed.replace(tzinfo=timezone.utc)
+
+
+def validator_headers(etag: str, last_modified: Optional[datetime]) -> Dict[str, str]:
+    """Return the `ETag` (and `Last-Modified`) headers of a response."""
+    headers = {"ETag": etag}
+    if last_modified is not None:
+        headers["Last-Modified"] = format_http_date(last_modified)
+    return headers
+
+
+def _etag_matches(etag: str, if_none_match: str) -> bool:
+    # If-None-Match 는 약한 비교를 한다 (W/ 접두사를 무시).
+    if if_none_match.strip() == "*":
+        return True
+    opaque = etag[2:] if etag.startswith("W/") else etag
+    for candidate in if_none_match.split(","):
+        candidate = candidate.strip()
+        if candidate.startswith("W/"):
+            candidate = candidate[2:]
+        if candidate == opaque:
+            return True
+    return False
+
+
+def is_not_modified(
+    etag: str,
+    last_modified: Optional[datetime],
+    if_none_match: Optional[str],
+    if_modified_since: Optional[str],
+) -> bool:
+    """Whether a GET with these conditional headers should be answered with 304.
+
+    `If-None-Match` takes precedence; `If-Modified-Since` is only evaluated when it
+    is absent, at the one-second resolution of HTTP dates (RFC 9110 13.2.2).
+
+    Args:
+        etag (str): The current ETag of the resource.
+        last_modified (Optional[datetime]): The current modification time, if known.
+        if_none_match (Optional[str]): The If-None-Match header value.
+        if_modified_since (Optional[str]): The If-Modified-Since header value.
+    """
+    if if_none_match:
+        return _etag_matches(etag, if_none_match)
+    since = parse_http_date(if_modified_since)
+    if since is None or last_modified is None:
+        return False
+    return _as_utc(last_modified).replace(microsecond=0) <= since
@@ -0,0 +1,47 @@
+import re
+from typing import Optional, Tuple
+
+# first-pos "-" last-pos (둘 중 하나는 생략할 수 있다)
+_BYTE_RANGE = re.compile(r"([0-9]*)-([0-9]*)")
+
+
+def parse_range(header: Optional[str], total: int) -> Optional[Tuple[int, int]]:
+    """Parse a single-part `Range: bytes=...` header against a body of `total` bytes.
+
+    Args:
+        header (Optional[str]): The Range header value.
+        total (int): The full length of the body in bytes.
+
+    Returns:
+        Optional[Tuple[int, int]]: The inclusive `(start, end)` byte positions, or None
+        when the whole body should be served (no header, another unit, a multi-part
+        range, which servers may ignore, or an invalid range, which they must ignore
+        per RFC 9110 14.2).
+
+    Raises:
+        ValueError: If the range is well-formed but cannot be satisfied (HTTP 416).
+    """
+    if not header:
+        return None
+    unit, _, spec = header.partition("=")
+    if unit.strip().lower() != "bytes" or "," in spec:
+        return None
+
+    match = _BYTE_RANGE.fullmatch(spec.strip())
+    if match is None or match.group(0) == "-":
+        return None
+    first, last = match.groups()
+    if first == "":
+        # bytes=-N : 마지막 N 바이트
+        suffix = int(last)
+        if suffix == 0 or total == 0:
+            raise ValueError(f"Unsatisfiable range '{header}'.")
+        return max(0, total - suffix), total - 1
+
+    start = int(first)
+    end = int(last) if last else total - 1
+    if last and end < start:
+        return None
+    if start >= total:
+        raise ValueError(f"Unsatisfiable range '{header}'.")
+    return start, min(end, total - 1)
@@ -0,0 +1,74 @@
+import json
+from functools import lru_cache
+from typing import Any, Mapping, Optional
+
+from fastapi.responses import JSONResponse
+from pydantic import BaseModel, TypeAdapter
+from starlette.background import BackgroundTask
+from starlette.responses import Response
+
+from core.metrics import timed
+
+try:
+    import orjson
+except ImportError:  # orjson 이 없으면 표준 json 으로 직렬화한다.
+    orjson = None
+
+
+class FastJSONResponse(JSONResponse):
+    """The default response class: serialises with orjson when it is installed.
+
+    FastAPI has already turned the endpoint's result into JSON-compatible data
+    (validated against `response_model`) when this is rendered; only the final
+    encoding step is replaced.
+    """
+
+    def render(self, content: Any) -> bytes:
+        with timed("serialization"):
+            if orjson is None:
+                return super().render(content)
+            return orjson.dumps(content, option=orjson.OPT_NON_STR_KEYS)
+
+
+@lru_cache(maxsize=None)
+def _list_adapter(item_type: type[BaseModel]) -> TypeAdapter:
+    return TypeAdapter(list[item_type])
+
+
+def dump_json(content: Any) -> bytes:
+    """Serialise already validated pydantic data in one pass, without validating it again.
+
+    Models are dumped by their own (compiled) serializer, and lists of models by a
+    cached `TypeAdapter(list[Model])` in a single call.
+    """
+    if isinstance(content, BaseModel):
+        return content.__pydantic_serializer__.to_json(content)
+    if isinstance(content, list) and content and isinstance(content[0], BaseModel):
+        return _list_adapter(type(content[0])).dump_json(content)
+    if orjson is not None:
+        return orjson.dumps(content, option=orjson.OPT_NON_STR_KEYS)
+    return json.dumps(content, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+
+
+class ModelJSONResponse(Response):
+    """A response for pre-validated service results.
+
+    FastAPI passes Response objects through untouched, so returning one skips the
+    re-validation against `response_model` (which is still used for the OpenAPI
+    schema) and `jsonable_encoder`.
+    """
+
+    media_type = "application/json"
+
+    def __init__(
+        self,
+        content: Any,
+        status_code: int = 200,
+        headers: Optional[Mapping[str, str]] = None,
+        background: Optional[BackgroundTask] = None,
+    ):
+        super().__init__(content, status_code, headers, self.media_type, background)
+
+    def render(self, content: Any) -> bytes:
+        with timed("serialization"):
+            return dump_json(content)
@@ -2,7 +2,9 @@ import jwt
 from datetime import datetime, timedelta
 from pytz import timezone
 from typing import Optional
+from fastapi import HTTPException
 from core.config import Config
+from core.metrics import timed
 
 ALGORITHM = "HS256"
 SECRET_KEY = Config.JWT_SECRET_KEY # 비밀 키는 안전하게 관리해야 합니다.
@@ -19,8 +21,18 @@ def create_access_token(data: dict, expires_delta: Optional[timedelta] = None):
     return encoded_jwt
 
 def verify_token(token: str):
-    try:
-        payload = jwt.decode(token, SECRET_KEY, algorithms=[ALGORITHM])
-        return payload
-    except jwt.PyJWTError:
-        return None
+    with timed("auth"):
+        try:
+            payload = jwt.decode(token, SECRET_KEY, algorithms=[ALGORITHM])
+            return payload
+        except jwt.PyJWTError:
+            return None
+
+# Authorization 헤더("Bearer <토큰>")를 검증하고, 잘못되면 401 을 낸다.
+def verify_authorization(authorization: Optional[str]) -> dict:
+    payload = verify_token(authorization.split(' ')[1]) if authorization and ' ' in authorization else None
+    
+    if (payload == None):
+        raise HTTPException(status_code=401, detail="AccessToken is strange!")
+    
+    return payload
@@ -0,0 +1,85 @@
+import asyncio
+import base64
+import hashlib
+import hmac
+import os
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from typing import Optional
+
+from core.config import Config
+
+ALGORITHM = "pbkdf2_sha256"
+SALT_BYTES = 16
+
+# hashlib.pbkdf2_hmac 은 GIL 을 해제하므로 스레드 풀로도 코어 수만큼 병렬 처리된다.
+_executor = ThreadPoolExecutor(
+    max_workers=Config.PASSWORD_HASH_WORKERS,
+    thread_name_prefix="password-hash",
+)
+
+
+def _b64(raw: bytes) -> str:
+    return base64.b64encode(raw).decode()
+
+
+def hash_password(password: str, iterations: Optional[int] = None) -> str:
+    """Hash a password as `pbkdf2_sha256$<iterations>$<salt>$<hash>`.
+
+    Args:
+        password (str): The plaintext password.
+        iterations (Optional[int]): The cost; defaults to `Config.PASSWORD_HASH_ITERATIONS`.
+    """
+    iterations = iterations or Config.PASSWORD_HASH_ITERATIONS
+    salt = os.urandom(SALT_BYTES)
+    digest = hashlib.pbkdf2_hmac("sha256", password.encode(), salt, iterations)
+    return f"{ALGORITHM}${iterations}${_b64(salt)}${_b64(digest)}"
+
+
+def verify_password(password: str, hashed: str) -> bool:
+    """Check a password against a value produced by `hash_password`.
+
+    Values without the algorithm prefix are legacy plaintext passwords and are
+    compared in constant time; `needs_rehash` reports them for upgrading.
+    """
+    if not hashed.startswith(f"{ALGORITHM}$"):
+        return hmac.compare_digest(password.encode(), hashed.encode())
+    try:
+        _, iterations, salt, digest = hashed.split("$")
+        expected = base64.b64decode(digest)
+        actual = hashlib.pbkdf2_hmac("sha256", password.encode(), base64.b64decode(salt), int(iterations))
+    except ValueError:
+        return False
+    return hmac.compare_digest(actual, expected)
+
+
+def needs_rehash(hashed: str) -> bool:
+    """Whether a stored value is plaintext or was hashed with a different cost."""
+    if not hashed.startswith(f"{ALGORITHM}$"):
+        return True
+    return hashed.split("$")[1] != str(Config.PASSWORD_HASH_ITERATIONS)
+
+
+@lru_cache(maxsize=1)
+def _dummy_hash() -> str:
+    return hash_password(os.urandom(SALT_BYTES).hex())
+
+
+async def hash_password_async(password: str) -> str:
+    """`hash_password` run on the bounded hashing pool instead of the event loop."""
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(_executor, hash_password, password)
+
+
+async def verify_password_async(password: str, hashed: Optional[str]) -> bool:
+    """`verify_password` run on the bounded hashing pool instead of the event loop.
+
+    When `hashed` is None (unknown user) a dummy hash is verified so the response
+    time does not reveal whether the username exists.
+    """
+    loop = asyncio.get_running_loop()
+    if hashed is None:
+        dummy = await loop.run_in_executor(_executor, _dummy_hash)
+        await loop.run_in_executor(_executor, verify_password, password, dummy)
+        return False
+    return await loop.run_in_executor(_executor, verify_password, password, hashed)
@@ -0,0 +1,58 @@
+"""Create the database schema.
+
+Run once per deployment (before starting the API workers):
+
+    python -m db.bootstrap
+"""
+import logging
+import time
+
+from sqlalchemy import inspect, text
+from sqlalchemy.schema import CreateColumn
+
+from db.models import Base
+
+logger = logging.getLogger(__name__)
+
+
+def create_schema(engine) -> None:
+    """Create missing tables, and missing columns and indexes of existing tables.
+
+    `create_all` skips tables that already exist, so columns and indexes added to
+    the models later (e.g. the counter columns, the keyset pagination indexes) are
+    created here explicitly. New columns need a server default (or to be nullable).
+    """
+    existing_tables = set(inspect(engine).get_table_names())
+    Base.metadata.create_all(engine)
+
+    inspector = inspect(engine)
+    for table in Base.metadata.sorted_tables:
+        if table.name not in existing_tables:
+            continue
+        existing_columns = {column["name"] for column in inspector.get_columns(table.name)}
+        for column in table.columns:
+            if column.name not in existing_columns:
+                logger.info("Adding column %s to %s", column.name, table.name)
+                with engine.begin() as conn:
+                    conn.execute(text(
+                        f"ALTER TABLE {table.name} ADD COLUMN {CreateColumn(column).compile(dialect=engine.dialect)}"
+                    ))
+        existing_indexes = {index["name"] for index in inspector.get_indexes(table.name)}
+        for index in table.indexes:
+            if index.name not in existing_indexes:
+                logger.info("Creating index %s on %s", index.name, table.name)
+                index.create(engine)
+
+
+def main() -> None:
+    from repositories import get_engine
+
+    logging.basicConfig(level=logging.INFO)
+    started = time.perf_counter()
+    create_schema(get_engine())
+    get_engine().dispose()
+    logger.info("Schema ready in %.3fs", time.perf_counter() - started)
+
+
+if __name__ == "__main__":
+    main()
@@ -1,18 +1,32 @@
 from datetime import datetime
 from pytz import timezone
-from sqlalchemy import create_engine, Column, Integer, String, Text, TIMESTAMP, ForeignKey, text
+from sqlalchemy import create_engine, Column, Double, Index, Integer, String, Text, TIMESTAMP, ForeignKey, text
+from sqlalchemy.dialects import mysql
 from sqlalchemy.ext.declarative import declarative_base
 from sqlalchemy.orm import relationship
 
 Base = declarative_base()
+
+# 마지막 수정 시각 (ETag/Last-Modified 용, 같은 초 안의 수정도 구분하도록 MySQL 에서는 마이크로초까지 저장)
+UPDATED_AT = TIMESTAMP().with_variant(mysql.TIMESTAMP(fsp=6), "mysql")
+
+
+def _now():
+    return datetime.now(timezone('Asia/Seoul'))
         
 class User(Base):
     __tablename__ = 'users'
+    # 목록 조회 keyset 페이지네이션 (created_at, id) 용 인덱스
+    __table_args__ = (
+        Index('ix_users_created_at_id', 'created_at', 'id'),
+    )
     
     id = Column(Integer, primary_key=True, autoincrement=True)
     username = Column(String(255), unique=True, nullable=False)
     password = Column(String(255), nullable=False)
-    created_at = Column(TIMESTAMP, server_default=text("CURRENT_TIMESTAMP"), nullable=False, default=datetime.now(timezone('Asia/Seoul')))
+    created_at = Column(TIMESTAMP, server_default=text("CURRENT_TIMESTAMP"), nullable=False, default=_now)
+    # 수정할 때마다 갱신된다 (생성 후 수정된 적이 없으면 NULL)
+    updated_at = Column(UPDATED_AT, nullable=True, onupdate=_now)
 
     # 관계 설정: 한 유저는 여러 작품을 가질 수 있다.
     works = relationship("Work", back_populates="user")
@@ -27,12 +41,23 @@ class User(Base):
     
 class Work(Base):
     __tablename__ = 'works'
+    # 목록 조회 keyset 페이지네이션 (created_at, id) 용 인덱스
+    __table_args__ = (
+        Index('ix_works_created_at_id', 'created_at', 'id'),
+        Index('ix_works_user_id_created_at_id', 'user_id', 'created_at', 'id'),
+        # 검색용 FULLTEXT 인덱스 (한글 부분 검색을 위해 ngram 파서 사용)
+        Index('ft_works_title_description', 'title', 'description', mysql_prefix='FULLTEXT', mysql_with_parser='ngram'),
+    )
     
     id = Column(Integer, primary_key=True, autoincrement=True)
     user_id = Column(Integer, ForeignKey('users.id'))
     title = Column(String(255), nullable=False)
     description = Column(Text)
-    created_at = Column(TIMESTAMP, server_default=text("CURRENT_TIMESTAMP"), nullable=False, default=datetime.now(timezone('Asia/Seoul')))
+    created_at = Column(TIMESTAMP, server_default=text("CURRENT_TIMESTAMP"), nullable=False, default=_now)
+    # 선호 수 (favorites 의 COUNT(*) 를 비정규화한 값, 증감은 모아서 반영하고 주기적으로 재계산한다)
+    favorite_count = Column(Integer, server_default=text("0"), nullable=False, default=0)
+    # 수정할 때마다 갱신된다 (선호 수 반영 포함, 생성 후 수정된 적이 없으면 NULL)
+    updated_at = Column(UPDATED_AT, nullable=True, onupdate=_now)
     
     # 관계 설정: 한 작품은 하나의 유저에 의해 생성된다.
     user = relationship("User", back_populates="works")
@@ -46,12 +71,15 @@ class Work(Base):
 
 class Episode(Base):
     __tablename__ = 'episodes'
+    __table_args__ = (
+        Index('ft_episodes_title', 'title', mysql_prefix='FULLTEXT', mysql_with_parser='ngram'),
+    )
     
     id = Column(Integer, primary_key=True, autoincrement=True)
     work_id = Column(Integer, ForeignKey('works.id'))
     title = Column(String(255), nullable=False)
     content = Column(Text)
-    created_at = Column(TIMESTAMP, default="CURRENT_TIMESTAMP")
+    created_at = Column(TIMESTAMP, server_default=text("CURRENT_TIMESTAMP"), nullable=False, default=_now)
     
     # 관계 설정: 한 회차는 하나의 작품에 속한다.
     work = relationship("Work", back_populates="episodes")
@@ -60,12 +88,15 @@ class Episode(Base):
 
 class Notice(Base):
     __tablename__ = 'notices'
+    __table_args__ = (
+        Index('ft_notices_title', 'title', mysql_prefix='FULLTEXT', mysql_with_parser='ngram'),
+    )
     
     id = Column(Integer, primary_key=True, autoincrement=True)
     work_id = Column(Integer, ForeignKey('works.id'))
     title = Column(String(255), nullable=False)
     content = Column(Text)
-    created_at = Column(TIMESTAMP, server_default=text("CURRENT_TIMESTAMP"), nullable=False, default=datetime.now(timezone('Asia/Seoul')))
+    created_at = Column(TIMESTAMP, server_default=text("CURRENT_TIMESTAMP"), nullable=False, default=_now)
     
     # 관계 설정: 한 공지사항은 하나의 작품에 속한다.
     work = relationship("Work", back_populates="notices")
@@ -80,7 +111,9 @@ class Comment(Base):
     episode_id = Column(Integer, ForeignKey('episodes.id'))
     notice_id = Column(Integer, ForeignKey('notices.id'))
     content = Column(Text, nullable=False)
-    created_at = Column(TIMESTAMP, server_default=text("CURRENT_TIMESTAMP"), nullable=False, default=datetime.now(timezone('Asia/Seoul')))
+    created_at = Column(TIMESTAMP, server_default=text("CURRENT_TIMESTAMP"), nullable=False, default=_now)
+    # 좋아요 수 (likes 의 COUNT(*) 를 비정규화한 값)
+    like_count = Column(Integer, server_default=text("0"), nullable=False, default=0)
     
     # 관계 설정: 한 댓글은 하나의 유저에 의해 작성된다.
     user = relationship("User", back_populates="comments")
@@ -93,11 +126,16 @@ class Comment(Base):
 
 class Favorite(Base):
     __tablename__ = 'favorites'
+    # 유저는 작품을 한 번만 선호할 수 있다.
+    __table_args__ = (
+        Index('uq_favorites_user_id_work_id', 'user_id', 'work_id', unique=True),
+        Index('ix_favorites_work_id', 'work_id'),
+    )
     
     id = Column(Integer, primary_key=True, autoincrement=True)
     user_id = Column(Integer, ForeignKey('users.id'))
     work_id = Column(Integer, ForeignKey('works.id'))
-    added_at = Column(TIMESTAMP, default="CURRENT_TIMESTAMP")
+    added_at = Column(TIMESTAMP, server_default=text("CURRENT_TIMESTAMP"))
     
     # 관계 설정: 한 선호 작품은 하나의 유저와 작품에 속한다.
     user = relationship("User", back_populates="favorites")
@@ -105,6 +143,11 @@ class Favorite(Base):
 
 class Like(Base):
     __tablename__ = 'likes'
+    # 유저는 댓글에 좋아요를 한 번만 누를 수 있다.
+    __table_args__ = (
+        Index('uq_likes_user_id_comment_id', 'user_id', 'comment_id', unique=True),
+        Index('ix_likes_comment_id', 'comment_id'),
+    )
     
     id = Column(Integer, primary_key=True, autoincrement=True)
     user_id = Column(Integer, ForeignKey('users.id'))
@@ -117,13 +160,42 @@ class Like(Base):
 
 class WatchHistory(Base):
     __tablename__ = 'watch_history'
+    # (유저, 작품) 당 한 행만 유지한다 (시청 기록은 upsert 로 갱신된다)
+    __table_args__ = (
+        Index('uq_watch_history_user_id_work_id', 'user_id', 'work_id', unique=True),
+    )
     
     id = Column(Integer, primary_key=True, autoincrement=True)
     user_id = Column(Integer, ForeignKey('users.id'))
     work_id = Column(Integer, ForeignKey('works.id'))
-    watched_at = Column(TIMESTAMP, server_default=text("CURRENT_TIMESTAMP"), nullable=False, default=datetime.now(timezone('Asia/Seoul')))
+    watched_at = Column(TIMESTAMP, server_default=text("CURRENT_TIMESTAMP"), nullable=False, default=_now)
     
     # 관계 설정: 한 시청 기록은 하나의 유저에 의해 생성된다.
     user = relationship("User", back_populates="watch_history")
     # 관계 설정: 한 시청 기록은 하나의 작품에 속한다.
-    work = relationship("Work", back_populates="watch_history")
\ No newline at end of file
+    work = relationship("Work", back_populates="watch_history")
+
+class WorkTrending(Base):
+    __tablename__ = 'work_trending'
+    # 점수 순 상위 작품 조회, 식은 작품 정리용 인덱스
+    __table_args__ = (
+        Index('ix_work_trending_score', 'score'),
+    )
+    
+    # 작품당 한 행만 유지한다 (점수는 upsert 로 누적된다)
+    work_id = Column(Integer, ForeignKey('works.id'), primary_key=True, autoincrement=False)
+    # 시간 감쇠 인기 점수의 로그 값 (기준 시각으로 환산한 값, service.trending 참고)
+    score = Column(Double, nullable=False)
+
+class WorkSimilarity(Base):
+    __tablename__ = 'work_similarities'
+    # 작품의 비슷한 작품을 유사도 순으로 조회한다.
+    __table_args__ = (
+        Index('ix_work_similarities_work_id_score', 'work_id', 'score'),
+    )
+    
+    # 작품마다 유사도 상위 N 개만 저장한다 (배치 작업 jobs.similar_works 가 통째로 다시 쓴다)
+    work_id = Column(Integer, ForeignKey('works.id'), primary_key=True, autoincrement=False)
+    similar_work_id = Column(Integer, ForeignKey('works.id'), primary_key=True, autoincrement=False)
+    # 선호/시청한 유저 벡터의 코사인 유사도 (0~1)
+    score = Column(Double, nullable=False)
@@ -0,0 +1,169 @@
+"""Compute the "readers also liked" neighbours of every work.
+
+Run from the `app` directory (job dependencies: jobs/requirements.txt), e.g. from cron:
+
+    python -m jobs.similar_works
+    python -m jobs.similar_works --top-n 30 --chunk-size 200000 --block-size 500
+
+Favorites and watch history are streamed in chunks into a sparse user x work
+matrix, the cosine similarity of every pair of works is computed block by block
+with sparse matrix products, and the `--top-n` most similar works of each work
+replace its rows in `work_similarities`, which `GET /works/{id}/similar` reads.
+"""
+import argparse
+import logging
+import sys
+import time
+from typing import Iterator, List, Tuple
+
+import numpy as np
+from scipy import sparse
+
+from core.config import Config
+from repositories import Repository, SessionLocal
+from repositories.base import BaseRepository
+from repositories.routing import read_from_replica
+from service.service import Service
+
+logger = logging.getLogger(__name__)
+
+
+def _parse_args(argv):
+    parser = argparse.ArgumentParser(prog="python -m jobs.similar_works", description=__doc__.splitlines()[0])
+    parser.add_argument("--top-n", type=int, default=Config.SIMILAR_WORKS_TOP_N, help="neighbours stored per work")
+    parser.add_argument("--chunk-size", type=int, default=Config.SIMILAR_WORKS_CHUNK_SIZE, help="interaction rows read per query")
+    parser.add_argument("--block-size", type=int, default=Config.SIMILAR_WORKS_BLOCK_SIZE, help="works whose similarities are computed together")
+    return parser.parse_args(argv)
+
+
+def _chunk_arrays(rows: list, weight: float) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    users = np.fromiter((row.user_id for row in rows), dtype=np.int32, count=len(rows))
+    works = np.fromiter((row.work_id for row in rows), dtype=np.int32, count=len(rows))
+    return users, works, np.full(len(rows), weight, dtype=np.float32)
+
+
+def _to_matrix(chunks: list, shape: Tuple[int, int]) -> sparse.csr_matrix:
+    users, works, data = (np.concatenate(arrays) for arrays in zip(*chunks))
+    # 같은 (유저, 작품) 의 가중치는 더해진다.
+    return sparse.csr_matrix((data, (users, works)), shape=shape)
+
+
+def build_interaction_matrix(
+    sources: List[Tuple[BaseRepository, float]],
+    shape: Tuple[int, int],
+    chunk_size: int,
+) -> sparse.csr_matrix:
+    """Stream interaction tables into a sparse user x work matrix of summed weights.
+
+    Only one chunk of rows is held at a time, as compact arrays. The arrays are
+    added to the result once they hold about as many entries as the result itself,
+    so the temporary memory stays proportional to the matrix and every entry is
+    merged O(log n) times.
+
+    Args:
+        sources (List[Tuple[BaseRepository, float]]): Repositories of tables with
+            `user_id` and `work_id` columns, and the weight of one of their rows.
+        shape (Tuple[int, int]): (max user id + 1, max work id + 1).
+        chunk_size (int): Rows read per query.
+    """
+    matrix = sparse.csr_matrix(shape, dtype=np.float32)
+    pending = []
+    pending_size = 0
+    for repository, weight in sources:
+        model = repository.model
+        for rows in repository.scan([model.user_id, model.work_id], chunk_size):
+            rows = [row for row in rows if row.user_id is not None and row.work_id is not None]
+            if not rows:
+                continue
+            pending.append(_chunk_arrays(rows, weight))
+            pending_size += len(rows)
+            if pending_size >= max(matrix.nnz, chunk_size):
+                matrix = matrix + _to_matrix(pending, shape)
+                pending, pending_size = [], 0
+    if pending:
+        matrix = matrix + _to_matrix(pending, shape)
+    return matrix.tocsr()
+
+
+def top_neighbours(
+    matrix: sparse.csr_matrix,
+    top_n: int,
+    block_size: int,
+) -> Iterator[Tuple[int, int, np.ndarray, np.ndarray, np.ndarray]]:
+    """Yield the `top_n` most similar works of each work, one block of works at a time.
+
+    The similarity of two works is the cosine of their columns, i.e. of the weighted
+    vectors of the users who interacted with them. For a block B of works, the
+    co-occurrences with every other work are one sparse product `X[:, B].T @ X`,
+    so memory is bounded by the block size times the number of works.
+
+    Yields:
+        (start, end, work_ids, similar_work_ids, scores) for the works with ids in
+        [start, end), sorted by work id and descending score.
+    """
+    n_works = matrix.shape[1]
+    csc = matrix.tocsc()
+    norms = np.sqrt(np.asarray(matrix.multiply(matrix).sum(axis=0), dtype=np.float64).ravel())
+    inverse_norms = np.divide(1.0, norms, out=np.zeros_like(norms), where=norms > 0)
+
+    for start in range(0, n_works, block_size):
+        end = min(start + block_size, n_works)
+        block = (csc[:, start:end].T.tocsr() @ matrix).tocoo()
+        rows, cols = block.row.astype(np.int64), block.col.astype(np.int64)
+        work_ids = rows + start
+        # 자기 자신은 이웃에서 뺀다.
+        keep = cols != work_ids
+        work_ids, cols = work_ids[keep], cols[keep]
+        scores = block.data[keep] * inverse_norms[work_ids] * inverse_norms[cols]
+
+        # 작품 순, 유사도 내림차순 (같으면 id 순) 으로 정렬해 작품마다 앞의 top_n 개를 남긴다.
+        order = np.lexsort((cols, -scores, work_ids))
+        work_ids, cols, scores = work_ids[order], cols[order], scores[order]
+        rank = np.arange(len(work_ids)) - np.searchsorted(work_ids, work_ids, side="left")
+        keep = rank < top_n
+        yield start, end, work_ids[keep], cols[keep], scores[keep]
+
+
+def run(top_n: int, chunk_size: int, block_size: int) -> dict:
+    """Recompute and store the neighbours of every work; return run statistics."""
+    started = time.perf_counter()
+    # 원본 테이블은 복제본에서 읽는다 (쓰기부터는 primary 로 고정된다).
+    read_from_replica.set(True)
+    with SessionLocal() as db_session:
+        repo = Repository(db_session)
+        service = Service(repo)
+        shape = ((repo.users.get_max_id() or 0) + 1, (repo.works.get_max_id() or 0) + 1)
+        matrix = build_interaction_matrix(
+            [
+                (repo.favorites, Config.SIMILAR_WORKS_FAVORITE_WEIGHT),
+                (repo.watch_history, Config.SIMILAR_WORKS_WATCH_WEIGHT),
+            ],
+            shape,
+            chunk_size,
+        )
+        loaded = time.perf_counter()
+        logger.info("Loaded %d user-work pairs in %.1fs", matrix.nnz, loaded - started)
+
+        stored = 0
+        for start, end, work_ids, similar_work_ids, scores in top_neighbours(matrix, top_n, block_size):
+            rows = [
+                {"work_id": work_id, "similar_work_id": similar_work_id, "score": score}
+                for work_id, similar_work_id, score in zip(work_ids.tolist(), similar_work_ids.tolist(), scores.tolist())
+            ]
+            # 마지막 블록은 끝을 열어 두어 그 뒤 id 의 오래된 이웃도 지운다.
+            service.replace_similar_works(start, end if end < shape[1] else None, rows)
+            stored += len(rows)
+    elapsed = time.perf_counter() - started
+    logger.info("Stored %d neighbours in %.1fs", stored, elapsed)
+    return {"pairs": int(matrix.nnz), "works": shape[1], "neighbours": stored, "seconds": round(elapsed, 3)}
+
+
+def main(argv=None) -> int:
+    args = _parse_args(argv)
+    logging.basicConfig(level=logging.INFO)
+    print(run(args.top_n, args.chunk_size, args.block_size))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -1,22 +1,223 @@
-from sqlalchemy import create_engine, event
-from sqlalchemy.orm import sessionmaker
+import asyncio
+from functools import cached_property
+
+from sqlalchemy import create_engine, event, text
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
+from sqlalchemy.orm import Session, sessionmaker
 
 from core.config import Config
 from db.models import (
     Base,
+    Comment,
+    Episode,
+    Favorite,
+    Like,
     User,
+    WatchHistory,
     Work,
+    WorkSimilarity,
+    WorkTrending,
+)
+from repositories.pool import (
+    InstrumentedAsyncAdaptedQueuePool,
+    InstrumentedQueuePool,
+    register_pool_listeners,
 )
+from repositories.query_log import register_query_listeners
+from repositories.routing import route
 from repositories.repositories import (
+    AsyncCommentRepository,
+    AsyncCounterRepository,
+    AsyncEpisodeRepository,
+    AsyncFavoriteRepository,
+    AsyncLikeRepository,
+    AsyncSearchRepository,
+    AsyncSimilarityRepository,
+    AsyncTrendingRepository,
+    AsyncUserRepository,
+    AsyncWatchHistoryRepository,
+    AsyncWorkRepository,
+    CommentRepository,
+    CounterRepository,
+    EpisodeRepository,
+    FavoriteRepository,
+    LikeRepository,
+    SearchRepository,
+    SimilarityRepository,
+    TrendingRepository,
     UserRepository,
+    WatchHistoryRepository,
     WorkRepository
 )
 
-# 데이터베이스 연결 설정 (MySQL 예시)
-engine = create_engine(f"mysql+mysqlconnector://{Config.DB_USER}:{Config.DB_PW}@{Config.DB_HOST}/{Config.DB_NAME}")
+def _pool_options(name):
+    return dict(
+        pool_size=Config.DB_POOL_SIZE,
+        max_overflow=Config.DB_MAX_OVERFLOW,
+        pool_timeout=Config.DB_POOL_TIMEOUT,
+        pool_recycle=Config.DB_POOL_RECYCLE,
+        pool_pre_ping=Config.DB_POOL_PRE_PING,
+        pool_logging_name=name,
+    )
+
+# 엔진은 처음 사용할 때 만든다 (import 시점에 DB 에 접속하지 않도록).
+# 스키마 생성은 `python -m db.bootstrap` 으로 따로 실행한다.
+_engines = {}
+
+def get_engine():
+    """
+    Return the synchronous engine, creating it on first use.
+    """
+    if "sync" not in _engines:
+        # 데이터베이스 연결 설정 (MySQL 예시)
+        engine = create_engine(
+            Config.DB_URL
+            or f"mysql+mysqlconnector://{Config.DB_USER}:{Config.DB_PW}@{Config.DB_HOST}/{Config.DB_NAME}",
+            poolclass=InstrumentedQueuePool,
+            **_pool_options("sync"),
+        )
+        register_pool_listeners("sync", engine)
+        register_query_listeners(engine)
+        _engines["sync"] = engine
+    return _engines["sync"]
+
+
+def get_async_engine():
+    """
+    Return the async engine used by the endpoints, creating it on first use.
+    """
+    if "async" not in _engines:
+        # 비동기 엔드포인트에서 사용하는 엔진 (이벤트 루프를 블로킹하지 않는 드라이버)
+        async_engine = create_async_engine(
+            Config.DB_ASYNC_URL
+            or f"mysql+{Config.DB_ASYNC_DRIVER}://{Config.DB_USER}:{Config.DB_PW}@{Config.DB_HOST}/{Config.DB_NAME}",
+            poolclass=InstrumentedAsyncAdaptedQueuePool,
+            **_pool_options("async"),
+        )
+        register_pool_listeners("async", async_engine.sync_engine)
+        register_query_listeners(async_engine.sync_engine)
+        _engines["async"] = async_engine
+    return _engines["async"]
+
+
+def has_replicas():
+    """
+    Whether read replicas are configured (without creating their engines).
+    """
+    return bool(Config.DB_REPLICA_URLS or Config.DB_REPLICA_HOSTS)
+
+
+def _replica_urls(async_driver=False):
+    if Config.DB_REPLICA_URLS:
+        return Config.DB_ASYNC_REPLICA_URLS if async_driver else Config.DB_REPLICA_URLS
+    driver = Config.DB_ASYNC_DRIVER if async_driver else "mysqlconnector"
+    return [
+        f"mysql+{driver}://{Config.DB_USER}:{Config.DB_PW}@{host}/{Config.DB_NAME}"
+        for host in Config.DB_REPLICA_HOSTS
+    ]
+
+
+def get_replica_engines():
+    """
+    Return the synchronous engines of the read replicas (empty without replicas).
+    """
+    if "replicas" not in _engines:
+        replicas = []
+        for i, url in enumerate(_replica_urls()):
+            engine = create_engine(url, poolclass=InstrumentedQueuePool, **_pool_options(f"replica-{i}"))
+            register_pool_listeners(f"replica-{i}", engine)
+            register_query_listeners(engine)
+            replicas.append(engine)
+        _engines["replicas"] = replicas
+    return _engines["replicas"]
+
+
+def get_async_replica_engines():
+    """
+    Return the async engines of the read replicas (empty without replicas).
+    """
+    if "async_replicas" not in _engines:
+        replicas = []
+        for i, url in enumerate(_replica_urls(async_driver=True)):
+            async_engine = create_async_engine(
+                url,
+                poolclass=InstrumentedAsyncAdaptedQueuePool,
+                **_pool_options(f"async-replica-{i}"),
+            )
+            register_pool_listeners(f"async-replica-{i}", async_engine.sync_engine)
+            register_query_listeners(async_engine.sync_engine)
+            replicas.append(async_engine)
+        _engines["async_replicas"] = replicas
+    return _engines["async_replicas"]
+
+
+def __getattr__(name):
+    # `from repositories import engine` 호환용 (처음 접근할 때 엔진을 만든다)
+    if name == "engine":
+        return get_engine()
+    if name == "async_engine":
+        return get_async_engine()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+class LazyEngineSession(Session):
+    """
+    A Session bound to `get_engine()`, resolved when it first needs a connection.
+    Reads of read-only service functions go to a replica (see `routing.route`).
+    """
+
+    def get_bind(self, mapper=None, clause=None, **kw):
+        return route(self, get_engine(), get_replica_engines(), clause)
+
+
+class LazyAsyncEngineSession(Session):
+    """
+    The sync_session_class of AsyncSessionLocal, bound to `get_async_engine()`
+    (or, for reads of read-only service functions, to a replica).
+    """
+
+    def get_bind(self, mapper=None, clause=None, **kw):
+        replicas = [replica.sync_engine for replica in get_async_replica_engines()]
+        return route(self, get_async_engine().sync_engine, replicas, clause)
+
+
+SessionLocal = sessionmaker(class_=LazyEngineSession, autoflush=False, autocommit=False)
+AsyncSessionLocal = async_sessionmaker(sync_session_class=LazyAsyncEngineSession, autoflush=False, expire_on_commit=False)
+
+
+async def warm_up_pool(size=None):
+    """
+    Open `size` (default `Config.DB_POOL_SIZE`) connections of the async engine
+    and of each async replica engine concurrently and return them to the pool,
+    so the first requests do not pay for connection setup.
+    """
+    size = Config.DB_POOL_SIZE if size is None else size
+
+    async def _open(async_engine):
+        conn = await async_engine.connect()
+        await conn.execute(text("SELECT 1"))
+        return conn
+
+    conns = await asyncio.gather(*[
+        _open(async_engine)
+        for async_engine in [get_async_engine(), *get_async_replica_engines()]
+        for _ in range(size)
+    ])
+    for conn in conns:
+        await conn.close()
+
+
+async def dispose_engines():
+    """
+    Close every pooled connection of the engines created so far.
+    """
+    for async_engine in [_engines.get("async"), *_engines.get("async_replicas", [])]:
+        if async_engine is not None:
+            await async_engine.dispose()
+    for engine in [_engines.get("sync"), *_engines.get("replicas", [])]:
+        if engine is not None:
+            engine.dispose()
 
-Base.metadata.create_all(engine)
-SessionLocal = sessionmaker(bind=engine, autoflush=False, autocommit=False)
 
 def get_session(session_factory=None):
     """
@@ -34,9 +235,26 @@ def get_session(session_factory=None):
         db_session.close()
 
 
+async def get_async_session(session_factory=None):
+    """
+    The AsyncSession counterpart of `get_session`.
+    The db_session is closed (and its connection returned to the pool) after use.
+    """
+    if session_factory is None:
+        session_factory = AsyncSessionLocal
+    db_session = session_factory()
+    try:
+        yield db_session
+    except Exception as e:
+        raise e
+    finally:
+        await db_session.close()
+
+
 class Repository:
     """
     A convenience class that instantiates all repositories for a given db_session.
+    Each repository is built on first access only.
 
     Usage:
         with get_session() as db_session:
@@ -47,14 +265,56 @@ class Repository:
 
     def __init__(self, db_session):
         self.db_session = db_session
-        self.users = UserRepository(db_session, User)
-        self.works = WorkRepository(db_session, Work)
+
+    @cached_property
+    def users(self) -> UserRepository:
+        return UserRepository(self.db_session, User)
+
+    @cached_property
+    def works(self) -> WorkRepository:
+        return WorkRepository(self.db_session, Work)
+
+    @cached_property
+    def episodes(self) -> EpisodeRepository:
+        return EpisodeRepository(self.db_session, Episode)
+
+    @cached_property
+    def watch_history(self) -> WatchHistoryRepository:
+        return WatchHistoryRepository(self.db_session, WatchHistory)
+
+    @cached_property
+    def trending(self) -> TrendingRepository:
+        return TrendingRepository(self.db_session, WorkTrending)
+
+    @cached_property
+    def similarities(self) -> SimilarityRepository:
+        return SimilarityRepository(self.db_session, WorkSimilarity)
+
+    @cached_property
+    def comments(self) -> CommentRepository:
+        return CommentRepository(self.db_session, Comment)
+
+    @cached_property
+    def favorites(self) -> FavoriteRepository:
+        return FavoriteRepository(self.db_session, Favorite)
+
+    @cached_property
+    def likes(self) -> LikeRepository:
+        return LikeRepository(self.db_session, Like)
+
+    @cached_property
+    def counters(self) -> CounterRepository:
+        return CounterRepository(self.db_session)
+
+    @cached_property
+    def search(self) -> SearchRepository:
+        return SearchRepository(self.db_session)
 
     def drop_all(self):
         """
         Drop all tables in the database.
         """
-        Base.metadata.drop_all(engine)
+        Base.metadata.drop_all(get_engine())
 
     def commit(self):
         """
@@ -78,4 +338,139 @@ class Repository:
         """
         Close the db_session.
         """
-        self.db_session.close()
\ No newline at end of file
+        self.db_session.close()
+
+
+class AsyncRepository(Repository):
+    """
+    The AsyncSession counterpart of `Repository`.
+
+    Usage:
+        async for db_session in get_async_session():
+            repo = AsyncRepository(db_session)
+            user = await repo.users.get_by_id(1)
+            # ...
+    """
+
+    def __init__(self, db_session):
+        super().__init__(db_session)
+        self._after_commit_callbacks = []
+
+    def after_commit(self, callback):
+        """
+        Run the coroutine function `callback` once the current transaction commits.
+        Callbacks are dropped if the transaction is rolled back instead.
+        """
+        self._after_commit_callbacks.append(callback)
+
+    async def _run_after_commit_callbacks(self):
+        callbacks, self._after_commit_callbacks = self._after_commit_callbacks, []
+        for callback in callbacks:
+            await callback()
+
+    @cached_property
+    def users(self) -> AsyncUserRepository:
+        return AsyncUserRepository(self.db_session, User)
+
+    @cached_property
+    def works(self) -> AsyncWorkRepository:
+        return AsyncWorkRepository(self.db_session, Work)
+
+    @cached_property
+    def episodes(self) -> AsyncEpisodeRepository:
+        return AsyncEpisodeRepository(self.db_session, Episode)
+
+    @cached_property
+    def watch_history(self) -> AsyncWatchHistoryRepository:
+        return AsyncWatchHistoryRepository(self.db_session, WatchHistory)
+
+    @cached_property
+    def trending(self) -> AsyncTrendingRepository:
+        return AsyncTrendingRepository(self.db_session, WorkTrending)
+
+    @cached_property
+    def similarities(self) -> AsyncSimilarityRepository:
+        return AsyncSimilarityRepository(self.db_session, WorkSimilarity)
+
+    @cached_property
+    def comments(self) -> AsyncCommentRepository:
+        return AsyncCommentRepository(self.db_session, Comment)
+
+    @cached_property
+    def favorites(self) -> AsyncFavoriteRepository:
+        return AsyncFavoriteRepository(self.db_session, Favorite)
+
+    @cached_property
+    def likes(self) -> AsyncLikeRepository:
+        return AsyncLikeRepository(self.db_session, Like)
+
+    @cached_property
+    def counters(self) -> AsyncCounterRepository:
+        return AsyncCounterRepository(self.db_session)
+
+    @cached_property
+    def search(self) -> AsyncSearchRepository:
+        return AsyncSearchRepository(self.db_session)
+
+    async def drop_all(self):
+        """
+        Drop all tables in the database.
+        """
+        async with get_async_engine().begin() as conn:
+            await conn.run_sync(Base.metadata.drop_all)
+
+    async def commit(self):
+        """
+        Commit the current transaction.
+        """
+        await self.db_session.commit()
+        await self._run_after_commit_callbacks()
+
+    async def flush(self):
+        """
+        Flush pending changes without committing.
+        """
+        await self.db_session.flush()
+
+    async def refresh(self, model):
+        """
+        Refresh the given model.
+        """
+        await self.db_session.refresh(model)
+
+    async def rollback(self):
+        """
+        Rollback the current transaction.
+        """
+        self._after_commit_callbacks = []
+        await self.db_session.rollback()
+
+    async def close(self):
+        """
+        Close the db_session.
+        """
+        await self.db_session.close()
+
+
+class UnitOfWork(AsyncRepository):
+    """
+    An AsyncRepository shared by every service call of a single request.
+
+    All calls run in one db_session and one transaction: `commit` only flushes
+    (so generated ids and refreshes still work), and the transaction is committed
+    once by `complete` when the request succeeds. `rollback` discards the whole
+    transaction, including the work of earlier service calls.
+    """
+
+    async def commit(self):
+        """
+        Flush pending changes; the transaction is committed by `complete`.
+        """
+        await self.db_session.flush()
+
+    async def complete(self):
+        """
+        Commit the request's transaction.
+        """
+        await self.db_session.commit()
+        await self._run_after_commit_callbacks()
@@ -1,9 +1,37 @@
-from typing import Any, Generic, List, Optional, Tuple, TypeVar
+import logging
+from datetime import datetime
+from collections import defaultdict
+from typing import Any, Generic, List, Mapping, Optional, Sequence, Tuple, TypeVar
 
-from sqlalchemy.orm import Session
+from sqlalchemy import Select, and_, func, insert, inspect, or_, select, text, update
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session, aliased, joinedload, load_only, selectinload
+from sqlalchemy.orm.attributes import set_committed_value
+
+from core.config import Config
 
 T = TypeVar("T")
 
+logger = logging.getLogger(__name__)
+
+_AUTOINCREMENT_SETTINGS = text("SELECT @@auto_increment_increment, @@innodb_autoinc_lock_mode")
+# 엔진 URL -> (auto_increment_increment, 여러 행 INSERT 의 id 가 연속으로 배정되는지)
+_autoincrement_settings: dict = {}
+
+
+def _parse_autoincrement_settings(row) -> Tuple[int, bool]:
+    increment, lock_mode = int(row[0]), int(row[1])
+    # 0 (traditional), 1 (consecutive) 은 행 수가 정해진 INSERT 에 id 를 한 번에 배정한다.
+    # 2 (interleaved) 는 동시에 실행되는 INSERT .. SELECT / ON DUPLICATE KEY UPDATE 와 id 가 섞일 수 있다.
+    consecutive = lock_mode in (0, 1)
+    if not consecutive:
+        logger.warning(
+            "innodb_autoinc_lock_mode=%d does not guarantee consecutive ids for multi-row INSERTs; "
+            "add_many inserts one row per statement (set it to 1 to batch)",
+            lock_mode,
+        )
+    return increment, consecutive
+
 
 class BaseRepository(Generic[T]):
     """A generic base repository providing simple CRUD and search operations for a given SQLAlchemy model.
@@ -23,24 +51,278 @@ class BaseRepository(Generic[T]):
         self.db_session = db_session
         self.model = model
 
-    def get_by_id(self, entity_id: int) -> Optional[T]:
+    def _select(
+        self,
+        columns: Optional[Sequence[Any]] = None,
+        include: Optional[Mapping[str, Sequence[str]]] = None,
+    ) -> Select:
+        """Select whole entities, or only `columns` when a projection is given.
+
+        With `include`, entities are selected (loading only `columns`, if given)
+        together with the eager-loading options of the included relationships.
+        """
+        if include:
+            stmt = select(self.model).options(*self._include_options(include))
+            return stmt.options(load_only(*columns)) if columns else stmt
+        return select(*columns) if columns else select(self.model)
+
+    def _relationship(self, name: str):
+        relationships = inspect(self.model).relationships
+        if name not in relationships:
+            raise ValueError(
+                f"'{name}' is not a relationship of the model '{self.model.__name__}'."
+            )
+        return relationships[name]
+
+    def _is_limited_collection(self, name: str) -> bool:
+        return self._relationship(name).uselist and Config.INCLUDE_COLLECTION_LIMIT > 0
+
+    def _include_options(self, include: Mapping[str, Sequence[str]]) -> list:
+        """Build the eager-loading options for `include`.
+
+        Many-to-one relationships are joined into the main query (`joinedload`).
+        Collections are loaded by one `SELECT .. WHERE fk IN (..)` per relationship
+        (`selectinload`), or, when `Config.INCLUDE_COLLECTION_LIMIT` is set, by
+        `_limited_collection_statement` after the main query.
+        """
+        options = []
+        for name, column_names in include.items():
+            relationship = self._relationship(name)
+            if self._is_limited_collection(name):
+                continue
+            attribute = getattr(self.model, name)
+            loader = selectinload(attribute) if relationship.uselist else joinedload(attribute)
+            if column_names:
+                target = relationship.mapper.class_
+                loader = loader.load_only(*[getattr(target, column) for column in column_names])
+            options.append(loader)
+        return options
+
+    def _limited_collection_statement(self, name: str, parent_ids: List[Any], column_names: Sequence[str]) -> Select:
+        """Select the latest `Config.INCLUDE_COLLECTION_LIMIT` rows of collection `name` per parent.
+
+        The rows are ranked with ROW_NUMBER() over (created_at, id), newest first,
+        inside a subquery restricted to the parents' foreign keys, so only their
+        rows are read.
+        """
+        relationship = self._relationship(name)
+        target = relationship.mapper.class_
+        ((_, remote),) = relationship.local_remote_pairs
+        names = list(dict.fromkeys([*(column_names or [c.key for c in target.__table__.columns]), "id", remote.key]))
+        foreign_key = getattr(target, remote.key)
+        ranked = (
+            select(
+                *[getattr(target, column) for column in names],
+                func.row_number()
+                .over(partition_by=foreign_key, order_by=(target.created_at.desc(), target.id.desc()))
+                .label("row_number"),
+            )
+            .where(foreign_key.in_(parent_ids))
+            .subquery()
+        )
+        latest = aliased(target, ranked)
+        return (
+            select(latest)
+            .options(load_only(*[getattr(latest, column) for column in names]))
+            .where(ranked.c.row_number <= Config.INCLUDE_COLLECTION_LIMIT)
+            .order_by(ranked.c.row_number)
+        )
+
+    def _limited_collection_statements(self, entities: List[T], include: Mapping[str, Sequence[str]]):
+        """Yield `(name, statement)` for the limited collections in `include`."""
+        if not entities:
+            return
+        for name, column_names in include.items():
+            if self._is_limited_collection(name):
+                parent_ids = [entity.id for entity in entities]
+                yield name, self._limited_collection_statement(name, parent_ids, column_names)
+
+    def _attach_collection(self, entities: List[T], name: str, children: List[Any]) -> None:
+        """Set the loaded `children` as the (already loaded) collection `name` of `entities`."""
+        ((_, remote),) = self._relationship(name).local_remote_pairs
+        by_parent = defaultdict(list)
+        for child in children:
+            by_parent[getattr(child, remote.key)].append(child)
+        for entity in entities:
+            set_committed_value(entity, name, by_parent.get(entity.id, []))
+
+    def _fetch_all(self, stmt: Select, columns: Optional[Sequence[Any]], include: Optional[Mapping[str, Sequence[str]]]) -> List:
+        if include:
+            entities = self.db_session.scalars(stmt).all()
+            for name, collection_stmt in self._limited_collection_statements(entities, include):
+                self._attach_collection(entities, name, self.db_session.scalars(collection_stmt).all())
+            return entities
+        if columns:
+            return self.db_session.execute(stmt).all()
+        return self.db_session.scalars(stmt).all()
+
+    def _get_by_id_statement(self, entity_id: int, columns: Optional[Sequence[Any]] = None) -> Select:
+        return self._select(columns).where(self.model.id == entity_id)
+
+    def _search_statement(
+        self,
+        conditions: List[Tuple[str, str, Any]],
+        columns: Optional[Sequence[Any]] = None,
+        include: Optional[Mapping[str, Sequence[str]]] = None,
+    ) -> Select:
+        """Build the SELECT statement for `search`.
+
+        Raises:
+            ValueError: If a provided field does not exist on the model or an unsupported operator is used.
+        """
+        stmt = self._select(columns, include)
+
+        for field_name, op, val in conditions:
+            # Check that the field exists on the model
+            if not hasattr(self.model, field_name):
+                raise ValueError(
+                    f"Field '{field_name}' does not exist on the model '{self.model.__name__}'."
+                )
+
+            field = getattr(self.model, field_name)
+
+            # Apply the filter based on the operator
+            if op == "eq":
+                stmt = stmt.where(field == val)
+            elif op == "in":
+                if not isinstance(val, (list, tuple, set)):
+                    raise ValueError("For 'in' operator, the value must be an iterable.")
+                stmt = stmt.where(field.in_(val))
+            elif op == "gt":
+                stmt = stmt.where(field > val)
+            elif op == "lt":
+                stmt = stmt.where(field < val)
+            elif op == "gte":
+                stmt = stmt.where(field >= val)
+            elif op == "lte":
+                stmt = stmt.where(field <= val)
+            elif op == "like":
+                # Assuming val is a string pattern, e.g. '%lee%'
+                stmt = stmt.where(field.like(val))
+            else:
+                raise ValueError(f"Unsupported operator '{op}'.")
+
+        return stmt
+
+    def _grouped_statement(self, field_name: str, values: Sequence[Any], limit: int, columns: Sequence[Any]) -> Select:
+        """Build the statement for `search_grouped`.
+
+        The rows of `field_name IN (values)` (see `_search_statement`) are ranked with
+        ROW_NUMBER() per value in keyset order `(created_at, id)`, and the first
+        `limit` of each value are selected, the value's column included.
+        """
+        field = getattr(self.model, field_name, None)
+        if field is not None and field_name not in [column.key for column in columns]:
+            columns = [*columns, field]
+        stmt = self._search_statement([(field_name, "in", list(values))], columns)
+        ranked = stmt.add_columns(
+            func.row_number()
+            .over(partition_by=field, order_by=(self.model.created_at, self.model.id))
+            .label("row_number")
+        ).subquery()
+        return (
+            select(*[ranked.c[column.key] for column in columns])
+            .where(ranked.c.row_number <= limit)
+            .order_by(ranked.c.created_at, ranked.c.id)
+        )
+
+    def _version_statement(self, conditions: List[Tuple[str, str, Any]]) -> Select:
+        """Build the statement for `get_version`.
+
+        The rows matching `conditions` (see `_search_statement`) are aggregated into
+        `(count, max_id, last_modified)`, where a row's modification time is its
+        `updated_at`, or its `created_at` if it was never updated (or the model has
+        no `updated_at`).
+        """
+        modified = self.model.created_at
+        if hasattr(self.model, "updated_at"):
+            modified = func.coalesce(self.model.updated_at, self.model.created_at)
+        columns = [
+            func.count().label("count"),
+            func.max(self.model.id).label("max_id"),
+            func.max(modified).label("last_modified"),
+        ]
+        return self._search_statement(conditions).with_only_columns(*columns)
+
+    def _scan_statement(self, columns: Sequence[Any], chunk_size: int, after_id: Optional[int]) -> Select:
+        stmt = select(self.model.id, *columns).order_by(self.model.id).limit(chunk_size)
+        if after_id is not None:
+            stmt = stmt.where(self.model.id > after_id)
+        return stmt
+
+    def _paginate(
+        self,
+        stmt: Select,
+        limit: Optional[int] = None,
+        after: Optional[Tuple[datetime, int]] = None,
+    ) -> Select:
+        """Apply keyset pagination over `(created_at, id)` to a statement.
+
+        Args:
+            stmt (Select): The statement to paginate.
+            limit (Optional[int]): The maximum number of rows to return.
+            after (Optional[Tuple[datetime, int]]): The `(created_at, id)` of the last
+                row of the previous page; only rows strictly after it are returned.
+
+        Returns:
+            Select: The statement ordered by `(created_at, id)`, or unchanged if
+            neither `limit` nor `after` is given.
+        """
+        if limit is None and after is None:
+            return stmt
+
+        if after is not None:
+            created_at, entity_id = after
+            stmt = stmt.where(
+                or_(
+                    self.model.created_at > created_at,
+                    and_(self.model.created_at == created_at, self.model.id > entity_id),
+                )
+            )
+        stmt = stmt.order_by(self.model.created_at, self.model.id)
+        return stmt.limit(limit) if limit is not None else stmt
+
+    def get_by_id(self, entity_id: int, columns: Optional[Sequence[Any]] = None) -> Optional[T]:
         """Retrieve an entity by its primary key ID.
 
         Args:
             entity_id (int): The primary key ID of the entity.
+            columns (Optional[Sequence[Any]]): Columns to select instead of the whole entity.
 
         Returns:
-            Optional[T]: The entity instance or None if not found.
+            Optional[T]: The entity instance (or a row of `columns`) or None if not found.
         """
-        return self.db_session.query(self.model).filter(self.model.id == entity_id).one_or_none()
+        stmt = self._get_by_id_statement(entity_id, columns)
+        if columns:
+            return self.db_session.execute(stmt).one_or_none()
+        return self.db_session.scalars(stmt).one_or_none()
 
-    def get_all(self) -> List[T]:
+    def get_all(
+        self,
+        limit: Optional[int] = None,
+        after: Optional[Tuple[datetime, int]] = None,
+        columns: Optional[Sequence[Any]] = None,
+        include: Optional[Mapping[str, Sequence[str]]] = None,
+    ) -> List[T]:
         """Retrieve all entities of this model type.
 
+        Args:
+            limit (Optional[int]): The maximum number of entities to return.
+            after (Optional[Tuple[datetime, int]]): The keyset position to resume after
+                (see `_paginate`).
+            columns (Optional[Sequence[Any]]): Columns to select instead of whole entities.
+            include (Optional[Mapping[str, Sequence[str]]]): Relationships to eager-load,
+                mapped to the column names to load for them (see `_include_options`).
+                Entities (loading only `columns`) are returned when given.
+
         Returns:
-            List[T]: A list of all entity instances.
+            List[T]: A list of all entity instances (or rows of `columns`).
+
+        Raises:
+            ValueError: If an included name is not a relationship of the model.
         """
-        return self.db_session.query(self.model).all()
+        stmt = self._paginate(self._select(columns, include), limit, after)
+        return self._fetch_all(stmt, columns, include)
 
     def add(self, entity: T):
         """Add a new entity to the database.
@@ -50,6 +332,95 @@ class BaseRepository(Generic[T]):
         """
         self.db_session.add(entity)
 
+    def _needs_autoincrement_settings(self) -> bool:
+        bind = self.db_session.get_bind()
+        return (
+            not bind.dialect.insert_returning
+            and bind.dialect.name in ("mysql", "mariadb")
+            and bind.url not in _autoincrement_settings
+        )
+
+    def _autoincrement(self) -> Optional[Tuple[int, bool]]:
+        """Return the cached `(increment, consecutive)` AUTO_INCREMENT settings of the bind.
+
+        None on dialects with INSERT .. RETURNING, which report the ids themselves.
+        """
+        bind = self.db_session.get_bind()
+        if bind.dialect.insert_returning:
+            return None
+        return _autoincrement_settings.get(bind.url, (1, True))
+
+    def _insert_many_statements(self, rows: List[dict]):
+        """Yield `(statement, params, returning, size)` for INSERTs of at most `Config.BULK_CHUNK_SIZE` rows.
+
+        On dialects with INSERT .. RETURNING each chunk is one "insertmanyvalues"
+        batch whose RETURNING rows come back in parameter order. Otherwise (MySQL)
+        each chunk is a single multi-row INSERT, whose generated ids start at the
+        cursor's `lastrowid` and are `auto_increment_increment` apart, as InnoDB
+        guarantees for inserts whose row count is known up front with
+        `innodb_autoinc_lock_mode` 0 or 1. With lock mode 2 each row is inserted by a
+        statement of its own, whose `lastrowid` is its id.
+        """
+        autoincrement = self._autoincrement()
+        returning = autoincrement is None
+        if not returning and not autoincrement[1]:
+            for row in rows:
+                yield insert(self.model).values(row), None, False, 1
+            return
+        for start in range(0, len(rows), Config.BULK_CHUNK_SIZE):
+            chunk = rows[start:start + Config.BULK_CHUNK_SIZE]
+            if returning:
+                stmt = insert(self.model).returning(self.model.id, sort_by_parameter_order=True)
+                yield stmt, chunk, returning, len(chunk)
+            else:
+                yield insert(self.model).values(chunk), None, returning, len(chunk)
+
+    def _inserted_ids(self, result, returning: bool, size: int) -> List[int]:
+        if returning:
+            return list(result.scalars())
+        increment = self._autoincrement()[0]
+        return list(range(result.lastrowid, result.lastrowid + size * increment, increment))
+
+    def _update_many_rows(self, rows: List[dict]) -> List[dict]:
+        for row in rows:
+            if "id" not in row:
+                raise ValueError("Every row passed to 'update_many' must contain an 'id'.")
+            for key in row:
+                if not hasattr(self.model, key):
+                    raise ValueError(
+                        f"Field '{key}' does not exist on '{self.model.__name__}' entities."
+                    )
+        return rows
+
+    def add_many(self, rows: List[dict]) -> List[int]:
+        """Insert several rows with multi-row INSERT statements, without loading entities.
+
+        Args:
+            rows (List[dict]): Column-value mappings; every row must have the same keys.
+
+        Returns:
+            List[int]: The generated primary key IDs, in the order of `rows`.
+        """
+        if self._needs_autoincrement_settings():
+            row = self.db_session.execute(_AUTOINCREMENT_SETTINGS).one()
+            _autoincrement_settings[self.db_session.get_bind().url] = _parse_autoincrement_settings(row)
+        ids = []
+        for stmt, params, returning, size in self._insert_many_statements(rows):
+            ids.extend(self._inserted_ids(self.db_session.execute(stmt, params), returning, size))
+        return ids
+
+    def update_many(self, rows: List[dict]) -> None:
+        """Update several rows by primary key with one executemany UPDATE.
+
+        Args:
+            rows (List[dict]): Column-value mappings, each including the row's `id`.
+
+        Raises:
+            ValueError: If a row has no `id` or a field does not exist on the model.
+        """
+        if rows:
+            self.db_session.execute(update(self.model), self._update_many_rows(rows))
+
     def delete(self, entity: T) -> None:
         """Delete an entity from the database.
 
@@ -58,7 +429,14 @@ class BaseRepository(Generic[T]):
         """
         self.db_session.delete(entity)
 
-    def search(self, conditions: List[Tuple[str, str, Any]]) -> List[T]:
+    def search(
+        self,
+        conditions: List[Tuple[str, str, Any]],
+        limit: Optional[int] = None,
+        after: Optional[Tuple[datetime, int]] = None,
+        columns: Optional[Sequence[Any]] = None,
+        include: Optional[Mapping[str, Sequence[str]]] = None,
+    ) -> List[T]:
         """
         Search for entities based on a list of conditions.
 
@@ -69,46 +447,86 @@ class BaseRepository(Generic[T]):
                 - field_name (str): The attribute on the model to filter by.
                 - operator (str): The comparison operator ("eq", "in", "gt", "lt", "gte", "lte", "like").
                 - value (Any): The value to compare against.
+            limit (Optional[int]): The maximum number of entities to return.
+            after (Optional[Tuple[datetime, int]]): The keyset position to resume after
+                (see `_paginate`).
+            columns (Optional[Sequence[Any]]): Columns to select instead of whole entities.
+            include (Optional[Mapping[str, Sequence[str]]]): Relationships to eager-load
+                (see `get_all`).
+
+        Returns:
+            List[T]: A list of entities (or rows of `columns`) that match all given conditions.
+
+        Raises:
+            ValueError: If a provided field does not exist on the model, an unsupported operator
+                is used, or an included name is not a relationship of the model.
+        """
+        stmt = self._paginate(self._search_statement(conditions, columns, include), limit, after)
+        return self._fetch_all(stmt, columns, include)
+
+    def search_grouped(self, field_name: str, values: Sequence[Any], limit: int, columns: Sequence[Any]) -> List:
+        """Return the first page of each of several values in one query.
+
+        For every value of `values`, up to `limit` rows with `field_name == value`
+        are selected in keyset order `(created_at, id)`, as `search` with that
+        condition and `limit` would return them.
+
+        Args:
+            field_name (str): The attribute to group by, e.g. "user_id".
+            values (Sequence[Any]): The values to load pages for.
+            limit (int): The maximum number of rows per value.
+            columns (Sequence[Any]): The columns to select (`field_name` is added if missing).
+
+        Returns:
+            List: Rows of `columns`, ordered by `(created_at, id)`.
+
+        Raises:
+            ValueError: If `field_name` does not exist on the model.
+        """
+        return self.db_session.execute(self._grouped_statement(field_name, values, limit, columns)).all()
+
+    def get_version(self, conditions: List[Tuple[str, str, Any]]):
+        """Return a cheap version probe of the rows matching `conditions`.
+
+        Inserting, deleting or updating a matching row changes the result, so it can
+        stand in for the rows themselves in ETag/Last-Modified validators.
+
+        Args:
+            conditions (List[Tuple[str, str, Any]]): The conditions (see `search`).
 
         Returns:
-            List[T]: A list of entities that match all given conditions.
+            Row: `(count, max_id, last_modified)`; `count` is 0 and the others are
+            None when no row matches.
 
         Raises:
             ValueError: If a provided field does not exist on the model or an unsupported operator is used.
         """
-        q = self.db_session.query(self.model)
+        return self.db_session.execute(self._version_statement(conditions)).one()
 
-        for field_name, op, val in conditions:
-            # Check that the field exists on the model
-            if not hasattr(self.model, field_name):
-                raise ValueError(
-                    f"Field '{field_name}' does not exist on the model '{self.model.__name__}'."
-                )
+    def get_max_id(self) -> Optional[int]:
+        """Return the largest primary key ID (None when the table is empty)."""
+        return self.db_session.scalars(select(func.max(self.model.id))).one()
 
-            field = getattr(self.model, field_name)
+    def scan(self, columns: Sequence[Any], chunk_size: int):
+        """Read the whole table in primary key order, `chunk_size` rows at a time.
 
-            # Apply the filter based on the operator
-            if op == "eq":
-                q = q.filter(field == val)
-            elif op == "in":
-                if not isinstance(val, (list, tuple, set)):
-                    raise ValueError("For 'in' operator, the value must be an iterable.")
-                q = q.filter(field.in_(val))
-            elif op == "gt":
-                q = q.filter(field > val)
-            elif op == "lt":
-                q = q.filter(field < val)
-            elif op == "gte":
-                q = q.filter(field >= val)
-            elif op == "lte":
-                q = q.filter(field <= val)
-            elif op == "like":
-                # Assuming val is a string pattern, e.g. '%lee%'
-                q = q.filter(field.like(val))
-            else:
-                raise ValueError(f"Unsupported operator '{op}'.")
+        Every chunk is a separate keyset query (`id > last id`), so no statement
+        holds a long-running cursor and only one chunk is in memory at a time.
 
-        return q.all()
+        Args:
+            columns (Sequence[Any]): The columns to select (`id` is added).
+            chunk_size (int): The maximum number of rows per chunk.
+
+        Yields:
+            List: Rows of `columns`, in `id` order.
+        """
+        last_id = None
+        while True:
+            rows = self.db_session.execute(self._scan_statement(columns, chunk_size, last_id)).all()
+            if not rows:
+                return
+            yield rows
+            last_id = rows[-1].id
 
     def update(self, entity: T, **fields):
         """Update specific fields on an entity.
@@ -125,4 +543,154 @@ class BaseRepository(Generic[T]):
                 raise ValueError(
                     f"Field '{key}' does not exist on '{self.model.__name__}' entities."
                 )
-            setattr(entity, key, value)
\ No newline at end of file
+            setattr(entity, key, value)
+
+
+class AsyncBaseRepository(BaseRepository[T]):
+    """The `AsyncSession` counterpart of `BaseRepository`.
+
+    Statements are built by the same helpers as the synchronous repository; only the
+    methods that talk to the database are coroutines. `add` and `update` only touch
+    the identity map and therefore stay synchronous.
+
+    Attributes:
+        db_session (AsyncSession): The SQLAlchemy async session used to interact with the database.
+        model (type[T]): The SQLAlchemy model class this repository manages.
+    """
+
+    def __init__(self, db_session: AsyncSession, model: type[T]):
+        super().__init__(db_session, model)
+
+    async def get_by_id(self, entity_id: int, columns: Optional[Sequence[Any]] = None) -> Optional[T]:
+        """Retrieve an entity by its primary key ID.
+
+        See `BaseRepository.get_by_id` for the arguments.
+
+        Returns:
+            Optional[T]: The entity instance (or a row of `columns`) or None if not found.
+        """
+        stmt = self._get_by_id_statement(entity_id, columns)
+        if columns:
+            return (await self.db_session.execute(stmt)).one_or_none()
+        return (await self.db_session.scalars(stmt)).one_or_none()
+
+    async def _fetch_all(self, stmt: Select, columns: Optional[Sequence[Any]], include: Optional[Mapping[str, Sequence[str]]]) -> List:
+        if include:
+            entities = (await self.db_session.scalars(stmt)).all()
+            for name, collection_stmt in self._limited_collection_statements(entities, include):
+                self._attach_collection(entities, name, (await self.db_session.scalars(collection_stmt)).all())
+            return entities
+        if columns:
+            return (await self.db_session.execute(stmt)).all()
+        return (await self.db_session.scalars(stmt)).all()
+
+    async def get_all(
+        self,
+        limit: Optional[int] = None,
+        after: Optional[Tuple[datetime, int]] = None,
+        columns: Optional[Sequence[Any]] = None,
+        include: Optional[Mapping[str, Sequence[str]]] = None,
+    ) -> List[T]:
+        """Retrieve all entities of this model type.
+
+        See `BaseRepository.get_all` for the pagination, projection and include arguments.
+
+        Returns:
+            List[T]: A list of all entity instances (or rows of `columns`).
+        """
+        stmt = self._paginate(self._select(columns, include), limit, after)
+        return await self._fetch_all(stmt, columns, include)
+
+    async def add_many(self, rows: List[dict]) -> List[int]:
+        """Insert several rows with multi-row INSERT statements, without loading entities.
+
+        See `BaseRepository.add_many`.
+
+        Returns:
+            List[int]: The generated primary key IDs, in the order of `rows`.
+        """
+        if self._needs_autoincrement_settings():
+            row = (await self.db_session.execute(_AUTOINCREMENT_SETTINGS)).one()
+            _autoincrement_settings[self.db_session.get_bind().url] = _parse_autoincrement_settings(row)
+        ids = []
+        for stmt, params, returning, size in self._insert_many_statements(rows):
+            ids.extend(self._inserted_ids(await self.db_session.execute(stmt, params), returning, size))
+        return ids
+
+    async def update_many(self, rows: List[dict]) -> None:
+        """Update several rows by primary key with one executemany UPDATE.
+
+        See `BaseRepository.update_many`.
+        """
+        if rows:
+            await self.db_session.execute(update(self.model), self._update_many_rows(rows))
+
+    async def delete(self, entity: T) -> None:
+        """Delete an entity from the database.
+
+        Args:
+            entity (T): The entity instance to delete.
+        """
+        await self.db_session.delete(entity)
+
+    async def search(
+        self,
+        conditions: List[Tuple[str, str, Any]],
+        limit: Optional[int] = None,
+        after: Optional[Tuple[datetime, int]] = None,
+        columns: Optional[Sequence[Any]] = None,
+        include: Optional[Mapping[str, Sequence[str]]] = None,
+    ) -> List[T]:
+        """Search for entities based on a list of conditions.
+
+        See `BaseRepository.search` for the condition format, pagination, projection and include arguments.
+
+        Returns:
+            List[T]: A list of entities (or rows of `columns`) that match all given conditions.
+
+        Raises:
+            ValueError: If a provided field does not exist on the model, an unsupported operator
+                is used, or an included name is not a relationship of the model.
+        """
+        stmt = self._paginate(self._search_statement(conditions, columns, include), limit, after)
+        return await self._fetch_all(stmt, columns, include)
+
+    async def search_grouped(self, field_name: str, values: Sequence[Any], limit: int, columns: Sequence[Any]) -> List:
+        """Return the first page of each of several values in one query.
+
+        See `BaseRepository.search_grouped`.
+
+        Returns:
+            List: Rows of `columns`, ordered by `(created_at, id)`.
+        """
+        return (await self.db_session.execute(self._grouped_statement(field_name, values, limit, columns))).all()
+
+    async def get_version(self, conditions: List[Tuple[str, str, Any]]):
+        """Return a cheap version probe of the rows matching `conditions`.
+
+        See `BaseRepository.get_version`.
+
+        Returns:
+            Row: `(count, max_id, last_modified)`.
+        """
+        return (await self.db_session.execute(self._version_statement(conditions))).one()
+
+    async def get_max_id(self) -> Optional[int]:
+        """Return the largest primary key ID (None when the table is empty)."""
+        return (await self.db_session.scalars(select(func.max(self.model.id)))).one()
+
+    async def scan(self, columns: Sequence[Any], chunk_size: int):
+        """Read the whole table in primary key order, `chunk_size` rows at a time.
+
+        See `BaseRepository.scan`.
+
+        Yields:
+            List: Rows of `columns`, in `id` order.
+        """
+        last_id = None
+        while True:
+            rows = (await self.db_session.execute(self._scan_statement(columns, chunk_size, last_id))).all()
+            if not rows:
+                return
+            yield rows
+            last_id = rows[-1].id
@@ -0,0 +1,34 @@
+import base64
+import binascii
+import json
+from datetime import datetime
+from typing import Optional, Tuple
+
+from core.config import Config
+
+
+def encode_cursor(created_at: datetime, entity_id: int) -> str:
+    """Encode a `(created_at, id)` keyset position as an opaque cursor string."""
+    raw = json.dumps([created_at.isoformat(), entity_id], separators=(",", ":"))
+    return base64.urlsafe_b64encode(raw.encode()).decode().rstrip("=")
+
+
+def decode_cursor(cursor: str) -> Tuple[datetime, int]:
+    """Decode a cursor produced by `encode_cursor`.
+
+    Raises:
+        ValueError: If the cursor is malformed.
+    """
+    try:
+        raw = base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4))
+        created_at, entity_id = json.loads(raw)
+        return datetime.fromisoformat(created_at), int(entity_id)
+    except (binascii.Error, UnicodeDecodeError, TypeError, ValueError) as e:
+        raise ValueError(f"Invalid cursor '{cursor}'.") from e
+
+
+def clamp_page_size(limit: Optional[int]) -> int:
+    """Return `limit` bounded to `[1, Config.PAGE_SIZE_MAX]` (default `Config.PAGE_SIZE_DEFAULT`)."""
+    if limit is None:
+        return Config.PAGE_SIZE_DEFAULT
+    return max(1, min(limit, Config.PAGE_SIZE_MAX))
@@ -0,0 +1,161 @@
+import threading
+import time
+from bisect import bisect_left
+
+from sqlalchemy import event, exc
+from sqlalchemy.pool import AsyncAdaptedQueuePool, QueuePool
+
+# 풀 대기 시간 히스토그램 구간 (초)
+WAIT_BUCKETS = (0.001, 0.005, 0.01, 0.05, 0.1, 0.5, 1.0, 5.0)
+
+pool_statistics = {}
+
+
+class PoolStatistics:
+    """Checkout/wait counters for a single engine's connection pool.
+
+    Counters are cumulative for the lifetime of the worker process. Live values
+    (checked out / overflow / idle connections) are read from the engine's current
+    pool when a snapshot is taken.
+
+    Attributes:
+        name (str): The label of the engine, e.g. "primary".
+        engine: The (sync) Engine whose pool is observed.
+    """
+
+    def __init__(self, name, engine):
+        self.name = name
+        self.engine = engine
+        self._lock = threading.Lock()
+        self.connects = 0
+        self.checkouts = 0
+        self.checkins = 0
+        self.invalidations = 0
+        self.timeouts = 0
+        self.wait_total = 0.0
+        self.wait_max = 0.0
+        self.wait_buckets = [0] * (len(WAIT_BUCKETS) + 1)
+        self.hold_total = 0.0
+        self.hold_max = 0.0
+
+    def record_wait(self, elapsed: float):
+        with self._lock:
+            self.wait_total += elapsed
+            self.wait_max = max(self.wait_max, elapsed)
+            self.wait_buckets[bisect_left(WAIT_BUCKETS, elapsed)] += 1
+
+    def record_timeout(self):
+        with self._lock:
+            self.timeouts += 1
+
+    def snapshot(self) -> dict:
+        pool = self.engine.pool
+        with self._lock:
+            waits = sum(self.wait_buckets)
+            return {
+                "pool": {
+                    "size": pool.size(),
+                    "checked_out": pool.checkedout(),
+                    "checked_in": pool.checkedin(),
+                    "overflow": pool.overflow(),
+                },
+                "connects": self.connects,
+                "checkouts": self.checkouts,
+                "checkins": self.checkins,
+                "invalidations": self.invalidations,
+                "timeouts": self.timeouts,
+                "wait": {
+                    "count": waits,
+                    "total_seconds": self.wait_total,
+                    "avg_seconds": self.wait_total / waits if waits else 0.0,
+                    "max_seconds": self.wait_max,
+                    "buckets": {
+                        **{f"le_{bound}": count for bound, count in zip(WAIT_BUCKETS, self.wait_buckets)},
+                        "le_inf": self.wait_buckets[-1],
+                    },
+                },
+                "hold": {
+                    "total_seconds": self.hold_total,
+                    "avg_seconds": self.hold_total / self.checkins if self.checkins else 0.0,
+                    "max_seconds": self.hold_max,
+                },
+            }
+
+
+class _WaitTimingMixin:
+    """Time how long `_do_get` blocks waiting for a free connection.
+
+    The statistics are looked up by the pool's logging name, which is the only
+    label that survives `Pool.recreate()` (e.g. after `engine.dispose()`).
+    """
+
+    def _do_get(self):
+        stats = pool_statistics.get(self._orig_logging_name)
+        start = time.perf_counter()
+        try:
+            return super()._do_get()
+        except exc.TimeoutError:
+            if stats is not None:
+                stats.record_timeout()
+            raise
+        finally:
+            if stats is not None:
+                stats.record_wait(time.perf_counter() - start)
+
+
+class InstrumentedQueuePool(_WaitTimingMixin, QueuePool):
+    pass
+
+
+class InstrumentedAsyncAdaptedQueuePool(_WaitTimingMixin, AsyncAdaptedQueuePool):
+    pass
+
+
+def register_pool_listeners(name: str, engine) -> PoolStatistics:
+    """Publish checkout/checkin statistics of `engine`'s pool under `name`.
+
+    The engine must have been created with `pool_logging_name=name` and one of the
+    instrumented pool classes for the wait statistics to be collected.
+
+    Args:
+        name (str): The label of the engine.
+        engine: A sync Engine (use `AsyncEngine.sync_engine` for async engines).
+
+    Returns:
+        PoolStatistics: The statistics object registered for the engine.
+    """
+    stats = PoolStatistics(name, engine)
+    pool_statistics[name] = stats
+
+    @event.listens_for(engine, "connect")
+    def _on_connect(dbapi_connection, connection_record):
+        with stats._lock:
+            stats.connects += 1
+
+    @event.listens_for(engine, "checkout")
+    def _on_checkout(dbapi_connection, connection_record, connection_proxy):
+        connection_record.info["checked_out_at"] = time.perf_counter()
+        with stats._lock:
+            stats.checkouts += 1
+
+    @event.listens_for(engine, "checkin")
+    def _on_checkin(dbapi_connection, connection_record):
+        checked_out_at = connection_record.info.pop("checked_out_at", None)
+        with stats._lock:
+            stats.checkins += 1
+            if checked_out_at is not None:
+                held = time.perf_counter() - checked_out_at
+                stats.hold_total += held
+                stats.hold_max = max(stats.hold_max, held)
+
+    @event.listens_for(engine, "invalidate")
+    def _on_invalidate(dbapi_connection, connection_record, exception):
+        with stats._lock:
+            stats.invalidations += 1
+
+    return stats
+
+
+def get_pool_statistics() -> dict:
+    """Return a snapshot of every registered pool, keyed by engine label."""
+    return {name: stats.snapshot() for name, stats in pool_statistics.items()}
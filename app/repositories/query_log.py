@@ -0,0 +1,223 @@
+import logging
+import re
+import threading
+import time
+from contextvars import ContextVar
+from typing import Optional
+
+from sqlalchemy import event
+
+from core.config import Config
+from core.metrics import db_statement_duration, record_phase
+from db.models import Base
+
+logger = logging.getLogger(__name__)
+
+# 현재 실행 중인 서비스 함수 ("Category.function", service_helper 가 설정한다)
+current_service_function: ContextVar[Optional[str]] = ContextVar("service_function", default=None)
+
+# EXPLAIN 실행 중인 커넥션 표시 (EXPLAIN 자체는 기록하지 않는다)
+_EXPLAINING = "query_log_explaining"
+_STARTED = "query_log_started"
+
+_EXPLAIN_PREFIX = {
+    "mysql": "EXPLAIN ",
+    "sqlite": "EXPLAIN QUERY PLAN ",
+    "postgresql": "EXPLAIN ",
+}
+
+_PLACEHOLDER = r"(?:%s|\?|:\w+|%\(\w+\)s|\$\d+)"
+_IN_LIST = re.compile(rf"\(\s*{_PLACEHOLDER}(?:\s*,\s*{_PLACEHOLDER})+\s*\)")
+_VALUES_ROWS = re.compile(r"(\(\s*\.\.\.\s*\))(?:\s*,\s*\(\s*\.\.\.\s*\))+")
+_WHITESPACE = re.compile(r"\s+")
+
+query_statistics = {}
+_lock = threading.Lock()
+
+
+def normalize_statement(statement: str) -> str:
+    """Collapse whitespace, IN lists and multi-row VALUES so that statements that
+    differ only in the number of bound values share one entry.
+    """
+    statement = _WHITESPACE.sub(" ", statement).strip()
+    statement = _IN_LIST.sub("(...)", statement)
+    return _VALUES_ROWS.sub(r"\1", statement)
+
+
+def unindexed_foreign_keys() -> dict:
+    """Return {table: {column, ...}} of foreign key columns declared in the models
+    that are not the leading column of any index (or the primary key).
+    """
+    result = {}
+    for table in Base.metadata.sorted_tables:
+        leading = {index.expressions[0].name for index in table.indexes if index.expressions}
+        leading.update(column.name for column in list(table.primary_key.columns)[:1])
+        leading.update(column.name for column in table.columns if column.unique)
+        columns = {fk.parent.name for fk in table.foreign_keys if fk.parent.name not in leading}
+        if columns:
+            result[table.name] = columns
+    return result
+
+
+class QueryStatistics:
+    """Timings of one normalised statement.
+
+    Attributes:
+        statement (str): The normalised SQL text.
+        count (int): Number of executions.
+        slow_count (int): Executions slower than `Config.SLOW_QUERY_THRESHOLD_MS`.
+        service_functions (set): Service functions that issued the statement.
+        last_slow (dict): Duration, caller, plan and warnings of the latest slow execution.
+    """
+
+    def __init__(self, statement):
+        self.statement = statement
+        self.count = 0
+        self.total = 0.0
+        self.max = 0.0
+        self.slow_count = 0
+        self.service_functions = set()
+        self.last_slow = None
+
+    def record(self, elapsed: float, service_function: Optional[str]):
+        self.count += 1
+        self.total += elapsed
+        self.max = max(self.max, elapsed)
+        if service_function is not None:
+            self.service_functions.add(service_function)
+
+    def snapshot(self) -> dict:
+        return {
+            "statement": self.statement,
+            "count": self.count,
+            "total_seconds": self.total,
+            "avg_seconds": self.total / self.count if self.count else 0.0,
+            "max_seconds": self.max,
+            "slow_count": self.slow_count,
+            "service_functions": sorted(self.service_functions),
+            "last_slow": self.last_slow,
+        }
+
+
+def _statistics_for(statement: str) -> Optional[QueryStatistics]:
+    stats = query_statistics.get(statement)
+    if stats is None and len(query_statistics) < Config.SLOW_QUERY_MAX_STATEMENTS:
+        stats = query_statistics.setdefault(statement, QueryStatistics(statement))
+    return stats
+
+
+def _explain(conn, statement, parameters) -> Optional[list]:
+    prefix = _EXPLAIN_PREFIX.get(conn.dialect.name)
+    if prefix is None:
+        return None
+    conn.info[_EXPLAINING] = True
+    try:
+        result = conn.exec_driver_sql(prefix + statement, parameters)
+        return [dict(row._mapping) for row in result]
+    except Exception:
+        logger.debug("EXPLAIN failed for %s", statement, exc_info=True)
+        return None
+    finally:
+        conn.info.pop(_EXPLAINING, None)
+
+
+def _full_scans(dialect_name: str, plan: list) -> set:
+    """Tables read without an index according to `plan`."""
+    tables = set()
+    for row in plan:
+        if dialect_name == "sqlite":
+            # e.g. "SCAN comments" (인덱스를 쓰면 "SEARCH ... USING INDEX" 로 나온다)
+            detail = str(row.get("detail", ""))
+            if detail.startswith("SCAN ") and "USING" not in detail:
+                tables.add(detail.split()[1])
+        elif str(row.get("type", "")).upper() == "ALL" and row.get("table"):
+            tables.add(row["table"])
+    return tables
+
+
+def _missing_index_warnings(statement: str, scanned_tables: set) -> list:
+    warnings = [f"full table scan on {table}" for table in sorted(scanned_tables)]
+    for table, columns in sorted(unindexed_foreign_keys().items()):
+        for column in sorted(columns):
+            if f"{table}.{column}" in statement:
+                warnings.append(f"{table}.{column} is filtered or joined on but has no index")
+    return warnings
+
+
+def register_query_listeners(engine) -> None:
+    """Time every statement executed on `engine`.
+
+    Statements slower than `Config.SLOW_QUERY_THRESHOLD_MS` are logged together with
+    the calling service function, and (for single SELECTs, when
+    `Config.SLOW_QUERY_EXPLAIN` is set) their EXPLAIN plan and missing-index warnings.
+
+    Args:
+        engine: A sync Engine (use `AsyncEngine.sync_engine` for async engines).
+    """
+
+    @event.listens_for(engine, "before_cursor_execute")
+    def _before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+        if conn.info.get(_EXPLAINING):
+            return
+        conn.info.setdefault(_STARTED, []).append(time.perf_counter())
+
+    @event.listens_for(engine, "after_cursor_execute")
+    def _after_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+        if conn.info.get(_EXPLAINING) or not conn.info.get(_STARTED):
+            return
+        elapsed = time.perf_counter() - conn.info[_STARTED].pop()
+        service_function = current_service_function.get()
+        record_phase("db", elapsed)
+        db_statement_duration.observe(elapsed, service_function or "<none>")
+        normalized = normalize_statement(statement)
+
+        with _lock:
+            stats = _statistics_for(normalized)
+            if stats is not None:
+                stats.record(elapsed, service_function)
+
+        if elapsed * 1000 < Config.SLOW_QUERY_THRESHOLD_MS:
+            return
+
+        plan, warnings = None, []
+        explainable = (
+            Config.SLOW_QUERY_EXPLAIN
+            and not executemany
+            and normalized.upper().startswith("SELECT")
+            # 서버 측 커서는 결과를 다 읽기 전에 다른 문장을 실행할 수 없다.
+            and not (context is not None and context.execution_options.get("stream_results"))
+        )
+        if explainable:
+            plan = _explain(conn, statement, parameters)
+            if plan is not None:
+                warnings = _missing_index_warnings(normalized, _full_scans(conn.dialect.name, plan))
+
+        logger.warning(
+            "Slow query (%.1f ms) from %s: %s%s",
+            elapsed * 1000,
+            service_function or "<unknown>",
+            normalized,
+            "".join(f"\n  warning: {warning}" for warning in warnings),
+        )
+        if stats is not None:
+            with _lock:
+                stats.slow_count += 1
+                stats.last_slow = {
+                    "duration_seconds": elapsed,
+                    "service_function": service_function,
+                    "at": time.time(),
+                    "explain": plan,
+                    "warnings": warnings,
+                }
+
+
+def get_query_statistics(limit: int = 50, slow_only: bool = False) -> list:
+    """Return the `limit` statements with the largest total time, slowest first."""
+    with _lock:
+        snapshots = [
+            stats.snapshot()
+            for stats in query_statistics.values()
+            if not slow_only or stats.slow_count
+        ]
+    snapshots.sort(key=lambda snapshot: snapshot["total_seconds"], reverse=True)
+    return snapshots[:limit]
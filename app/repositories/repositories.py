@@ -1,18 +1,387 @@
+from typing import Any, List, Optional, Sequence
+
+from sqlalchemy import (
+    Float,
+    LargeBinary,
+    Select,
+    Update,
+    bindparam,
+    case,
+    cast,
+    delete,
+    func,
+    insert,
+    literal,
+    or_,
+    select,
+    type_coerce,
+    union_all,
+    update,
+)
+from sqlalchemy.dialects import mysql, sqlite
+from sqlalchemy.dialects.mysql import match
+
+from core.config import Config
+
 from db.models import *
 
-from repositories.base import BaseRepository
-from schemas.models import UserCreate
+from repositories.base import AsyncBaseRepository, BaseRepository, T
 
 class UserRepository(BaseRepository[User]):
-    def login(self, user: UserCreate) -> User:
+    def _get_by_username_statement(self, username: str) -> Select:
+        # username 의 unique 인덱스만 사용한다 (비밀번호는 애플리케이션에서 검증).
+        return select(self.model).where(self.model.username == username)
+
+    def get_by_username(self, username: str) -> User:
+        return self.db_session.scalars(self._get_by_username_statement(username)).one_or_none()
+
+class WorkRepository(BaseRepository[Work]):
+    pass
+
+class EpisodeRepository(BaseRepository[Episode]):
+    def _content_length_statement(self, work_id: int, episode_id: int) -> Select:
+        # 바이트 단위로 다루기 위해 본문을 BINARY 로 변환한다 (UTF-8 문자 수가 아니라 바이트 수).
+        return select(func.coalesce(func.length(cast(self.model.content, LargeBinary)), 0)).where(
+            self.model.id == episode_id,
+            self.model.work_id == work_id,
+        )
+
+    def _content_chunk_statement(self, episode_id: int, offset: int, size: int) -> Select:
+        return select(func.substr(cast(self.model.content, LargeBinary), offset + 1, size)).where(
+            self.model.id == episode_id,
+        )
+
+    def get_content_length(self, work_id: int, episode_id: int) -> Optional[int]:
+        return self.db_session.scalars(self._content_length_statement(work_id, episode_id)).one_or_none()
+
+    def get_content_chunk(self, episode_id: int, offset: int, size: int) -> bytes:
+        return self.db_session.scalars(self._content_chunk_statement(episode_id, offset, size)).one_or_none() or b""
+
+class WatchHistoryRepository(BaseRepository[WatchHistory]):
+    def _upsert_many_statements(self, rows: List[dict]):
+        # 이미 있는 (user_id, work_id) 는 더 최근 시각으로만 갱신한다.
+        dialect = self.db_session.get_bind().dialect.name
+        for start in range(0, len(rows), Config.BULK_CHUNK_SIZE):
+            chunk = rows[start:start + Config.BULK_CHUNK_SIZE]
+            if dialect == "mysql":
+                stmt = mysql.insert(self.model).values(chunk)
+                yield stmt.on_duplicate_key_update(
+                    watched_at=func.greatest(self.model.watched_at, stmt.inserted.watched_at),
+                )
+            else:
+                stmt = sqlite.insert(self.model).values(chunk)
+                yield stmt.on_conflict_do_update(
+                    index_elements=[self.model.user_id, self.model.work_id],
+                    set_={"watched_at": func.max(self.model.watched_at, stmt.excluded.watched_at)},
+                )
+
+    def upsert_many(self, rows: List[dict]) -> None:
+        """Insert or refresh (user_id, work_id, watched_at) rows with multi-row upserts."""
+        for stmt in self._upsert_many_statements(rows):
+            self.db_session.execute(stmt)
+
+class TrendingRepository(BaseRepository[WorkTrending]):
+    """Time-decayed popularity scores of works, kept in log space (see `service.trending`)."""
+
+    def _log_add(self, current, added):
+        # ln(e^a + e^b) 를 넘침 없이 계산한다 (큰 쪽 + ln(1 + e^(작은 쪽 - 큰 쪽))).
+        return case(
+            (current >= added, current + func.ln(1 + func.exp(added - current))),
+            else_=added + func.ln(1 + func.exp(current - added)),
+        )
+
+    def _upsert_many_statements(self, rows: List[dict]):
+        # 이미 있는 작품은 점수를 더한다 (여러 워커가 동시에 더해도 잃어버리지 않는다).
+        dialect = self.db_session.get_bind().dialect.name
+        for start in range(0, len(rows), Config.BULK_CHUNK_SIZE):
+            chunk = rows[start:start + Config.BULK_CHUNK_SIZE]
+            if dialect == "mysql":
+                stmt = mysql.insert(self.model).values(chunk)
+                yield stmt.on_duplicate_key_update(
+                    score=self._log_add(self.model.score, stmt.inserted.score),
+                )
+            else:
+                stmt = sqlite.insert(self.model).values(chunk)
+                yield stmt.on_conflict_do_update(
+                    index_elements=[self.model.work_id],
+                    set_={"score": self._log_add(self.model.score, stmt.excluded.score)},
+                )
+
+    def _top_statement(self, limit: int, columns: Sequence[Any]) -> Select:
         return (
-            self.db_session.query(self.model)
-            .filter(
-                self.model.username == user.username,
-                self.model.password == user.password,
-            )
-            .one_or_none()
+            select(*columns, self.model.score.label("trending_score"))
+            .join(Work, Work.id == self.model.work_id)
+            .order_by(self.model.score.desc(), self.model.work_id)
+            .limit(limit)
         )
 
-class WorkRepository(BaseRepository[Work]):
+    def _prune_statement(self, min_score: float):
+        return delete(self.model).where(self.model.score < min_score)
+
+    def upsert_many(self, rows: List[dict]) -> None:
+        """Add (work_id, score) log-space scores to the stored ones with multi-row upserts."""
+        for stmt in self._upsert_many_statements(rows):
+            self.db_session.execute(stmt)
+
+    def get_top(self, limit: int, columns: Sequence[Any]) -> List:
+        """Return rows of the work `columns` plus `trending_score`, highest score first."""
+        return self.db_session.execute(self._top_statement(limit, columns)).all()
+
+    def prune(self, min_score: float) -> int:
+        """Delete the rows scored below `min_score` (log space); return how many were deleted."""
+        return self.db_session.execute(self._prune_statement(min_score)).rowcount
+
+class SimilarityRepository(BaseRepository[WorkSimilarity]):
+    """The precomputed neighbours of each work (written by `jobs.similar_works`)."""
+
+    def _replace_statements(self, start_id: int, end_id: Optional[int], rows: List[dict]):
+        # 범위 안 작품의 이웃을 모두 지우고 새로 넣는다 (이웃이 없어진 작품도 지워진다).
+        stmt = delete(self.model).where(self.model.work_id >= start_id)
+        if end_id is not None:
+            stmt = stmt.where(self.model.work_id < end_id)
+        yield stmt, None
+        for start in range(0, len(rows), Config.BULK_CHUNK_SIZE):
+            yield insert(self.model), rows[start:start + Config.BULK_CHUNK_SIZE]
+
+    def _similar_statement(self, work_id: int, limit: int, columns: Sequence[Any]) -> Select:
+        return (
+            select(*columns, self.model.score.label("similarity_score"))
+            .join(Work, Work.id == self.model.similar_work_id)
+            .where(self.model.work_id == work_id)
+            .order_by(self.model.score.desc(), self.model.similar_work_id)
+            .limit(limit)
+        )
+
+    def replace(self, start_id: int, end_id: Optional[int], rows: List[dict]) -> None:
+        """Replace the neighbours of the works with ids in [start_id, end_id) by `rows`.
+
+        Args:
+            start_id (int): The first work id of the range.
+            end_id (Optional[int]): The end of the range (exclusive), or None for no end.
+            rows (List[dict]): (work_id, similar_work_id, score) rows of works in the range.
+        """
+        for stmt, params in self._replace_statements(start_id, end_id, rows):
+            self.db_session.execute(stmt, params)
+
+    def get_similar(self, work_id: int, limit: int, columns: Sequence[Any]) -> List:
+        """Return rows of the similar works' `columns` plus `similarity_score`, most similar first."""
+        return self.db_session.execute(self._similar_statement(work_id, limit, columns)).all()
+
+class CommentRepository(BaseRepository[Comment]):
+    pass
+
+class UniqueRowRepository(BaseRepository[T]):
+    """Rows that exist at most once per unique key, e.g. a user's favorite of a work.
+
+    Adding and deleting are single statements, so concurrent requests for the same
+    row cannot both succeed (or fail on the unique index).
+    """
+
+    def _add_if_absent_statement(self, row: dict):
+        # 이미 있으면 오류 없이 건너뛴다 (영향받은 행 수로 추가 여부를 안다).
+        if self.db_session.get_bind().dialect.name == "mysql":
+            return mysql.insert(self.model).values(row).prefix_with("IGNORE")
+        return sqlite.insert(self.model).values(row).on_conflict_do_nothing()
+
+    def _delete_matching_statement(self, row: dict):
+        return delete(self.model).where(*[getattr(self.model, key) == value for key, value in row.items()])
+
+    def add_if_absent(self, row: dict) -> bool:
+        """Insert `row` unless a row with the same unique key exists; return whether it was inserted."""
+        return self.db_session.execute(self._add_if_absent_statement(row)).rowcount == 1
+
+    def delete_matching(self, row: dict) -> int:
+        """Delete the rows whose columns equal the values of `row`; return how many were deleted."""
+        return self.db_session.execute(self._delete_matching_statement(row)).rowcount
+
+class FavoriteRepository(UniqueRowRepository[Favorite]):
+    pass
+
+class LikeRepository(UniqueRowRepository[Like]):
+    pass
+
+class CounterRepository:
+    """Denormalised COUNT(*) columns, e.g. `works.favorite_count`.
+
+    The columns are changed by relative deltas (so concurrent writers never
+    overwrite each other) and periodically reconciled with the real counts.
+    """
+
+    # name -> (model, counter column, foreign key of the counted rows)
+    COUNTERS = {
+        "work_favorites": (Work, Work.favorite_count, Favorite.work_id),
+        "comment_likes": (Comment, Comment.like_count, Like.comment_id),
+    }
+
+    def __init__(self, db_session):
+        self.db_session = db_session
+
+    def _apply_deltas_statement(self, name: str) -> Update:
+        model, counter, _ = self.COUNTERS[name]
+        table = model.__table__
+        # ORM 의 bulk UPDATE (primary key 기준) 대신 테이블에 직접 executemany 한다.
+        return (
+            update(table)
+            .where(table.c.id == bindparam("b_id"))
+            .values({counter.key: table.c[counter.key] + bindparam("b_delta")})
+        )
+
+    def _reconcile_statement(self, name: str, start_id: int, end_id: int) -> Update:
+        model, counter, foreign_key = self.COUNTERS[name]
+        actual = select(func.count()).where(foreign_key == model.id).scalar_subquery()
+        return (
+            update(model)
+            .where(model.id >= start_id, model.id < end_id, counter != actual)
+            .values({counter: actual})
+            .execution_options(synchronize_session=False)
+        )
+
+    def _max_id_statement(self, name: str) -> Select:
+        model, _, _ = self.COUNTERS[name]
+        return select(func.max(model.id))
+
+    def apply_deltas(self, name: str, deltas: dict) -> None:
+        """Add `deltas` ({id: delta}) to the counter `name` with one executemany UPDATE."""
+        rows = [{"b_id": entity_id, "b_delta": delta} for entity_id, delta in deltas.items() if delta]
+        if rows:
+            self.db_session.execute(self._apply_deltas_statement(name), rows)
+
+    def reconcile(self, name: str, start_id: int, end_id: int) -> int:
+        """Reset the counters of ids in [start_id, end_id) that drifted; return how many were fixed."""
+        return self.db_session.execute(self._reconcile_statement(name, start_id, end_id)).rowcount
+
+    def get_max_id(self, name: str) -> Optional[int]:
+        return self.db_session.scalars(self._max_id_statement(name)).one()
+
+
+class AsyncUserRepository(AsyncBaseRepository[User], UserRepository):
+    async def get_by_username(self, username: str) -> User:
+        result = await self.db_session.scalars(self._get_by_username_statement(username))
+        return result.one_or_none()
+
+class AsyncWorkRepository(AsyncBaseRepository[Work], WorkRepository):
     pass
+
+class AsyncEpisodeRepository(AsyncBaseRepository[Episode], EpisodeRepository):
+    async def get_content_length(self, work_id: int, episode_id: int) -> Optional[int]:
+        result = await self.db_session.scalars(self._content_length_statement(work_id, episode_id))
+        return result.one_or_none()
+
+    async def get_content_chunk(self, episode_id: int, offset: int, size: int) -> bytes:
+        result = await self.db_session.scalars(self._content_chunk_statement(episode_id, offset, size))
+        return result.one_or_none() or b""
+
+class AsyncWatchHistoryRepository(AsyncBaseRepository[WatchHistory], WatchHistoryRepository):
+    async def upsert_many(self, rows: List[dict]) -> None:
+        for stmt in self._upsert_many_statements(rows):
+            await self.db_session.execute(stmt)
+
+class AsyncTrendingRepository(AsyncBaseRepository[WorkTrending], TrendingRepository):
+    async def upsert_many(self, rows: List[dict]) -> None:
+        for stmt in self._upsert_many_statements(rows):
+            await self.db_session.execute(stmt)
+
+    async def get_top(self, limit: int, columns: Sequence[Any]) -> List:
+        return (await self.db_session.execute(self._top_statement(limit, columns))).all()
+
+    async def prune(self, min_score: float) -> int:
+        return (await self.db_session.execute(self._prune_statement(min_score))).rowcount
+
+class AsyncSimilarityRepository(AsyncBaseRepository[WorkSimilarity], SimilarityRepository):
+    async def replace(self, start_id: int, end_id: Optional[int], rows: List[dict]) -> None:
+        for stmt, params in self._replace_statements(start_id, end_id, rows):
+            await self.db_session.execute(stmt, params)
+
+    async def get_similar(self, work_id: int, limit: int, columns: Sequence[Any]) -> List:
+        return (await self.db_session.execute(self._similar_statement(work_id, limit, columns))).all()
+
+class AsyncCommentRepository(AsyncBaseRepository[Comment], CommentRepository):
+    pass
+
+class AsyncUniqueRowRepository(AsyncBaseRepository[T], UniqueRowRepository[T]):
+    async def add_if_absent(self, row: dict) -> bool:
+        return (await self.db_session.execute(self._add_if_absent_statement(row))).rowcount == 1
+
+    async def delete_matching(self, row: dict) -> int:
+        return (await self.db_session.execute(self._delete_matching_statement(row))).rowcount
+
+class AsyncFavoriteRepository(AsyncUniqueRowRepository[Favorite], FavoriteRepository):
+    pass
+
+class AsyncLikeRepository(AsyncUniqueRowRepository[Like], LikeRepository):
+    pass
+
+class AsyncCounterRepository(CounterRepository):
+    async def apply_deltas(self, name: str, deltas: dict) -> None:
+        rows = [{"b_id": entity_id, "b_delta": delta} for entity_id, delta in deltas.items() if delta]
+        if rows:
+            await self.db_session.execute(self._apply_deltas_statement(name), rows)
+
+    async def reconcile(self, name: str, start_id: int, end_id: int) -> int:
+        return (await self.db_session.execute(self._reconcile_statement(name, start_id, end_id))).rowcount
+
+    async def get_max_id(self, name: str) -> Optional[int]:
+        return (await self.db_session.scalars(self._max_id_statement(name))).one()
+
+
+class SearchRepository:
+    """Relevance-ranked text search over works, episodes and notices.
+
+    On MySQL this uses the FULLTEXT (ngram) indexes declared on the models, which
+    InnoDB keeps up to date on every write. Other dialects (local development
+    databases) fall back to a substring match with a constant score.
+    """
+
+    # kind -> (model, work id column, searched columns)
+    SOURCES = {
+        "work": (Work, Work.id, (Work.title, Work.description)),
+        "episode": (Episode, Episode.work_id, (Episode.title,)),
+        "notice": (Notice, Notice.work_id, (Notice.title,)),
+    }
+
+    def __init__(self, db_session):
+        self.db_session = db_session
+
+    def _score(self, columns: Sequence, query: str):
+        if self.db_session.get_bind().dialect.name == "mysql":
+            return match(*columns, against=query).in_natural_language_mode()
+        # 검색어의 % 와 _ 는 와일드카드가 아니라 글자로 찾는다.
+        return case((or_(*[column.contains(query, autoescape=True) for column in columns]), 1.0), else_=0.0)
+
+    def _search_statement(self, query: str, kinds: Sequence[str], limit: int, offset: int) -> Select:
+        parts = []
+        for kind in kinds:
+            model, work_id, columns = self.SOURCES[kind]
+            score = self._score(columns, query)
+            # 각 부분은 필요한 만큼만 (offset + limit) 가져온 뒤 합쳐서 정렬한다.
+            # (SQLite 는 괄호로 감싼 UNION 항을 허용하지 않아 서브쿼리로 한 번 감싼다)
+            top = (
+                select(
+                    literal(kind).label("kind"),
+                    model.id.label("id"),
+                    work_id.label("work_id"),
+                    model.title.label("title"),
+                    type_coerce(score, Float).label("score"),
+                )
+                .where(score > 0)
+                .order_by(score.desc())
+                .limit(offset + limit)
+                .subquery()
+            )
+            parts.append(select(top))
+        ranked = union_all(*parts).subquery()
+        return (
+            select(ranked)
+            .order_by(ranked.c.score.desc(), ranked.c.kind, ranked.c.id)
+            .limit(limit)
+            .offset(offset)
+        )
+
+    def search(self, query: str, kinds: Sequence[str], limit: int, offset: int = 0) -> List:
+        """Return up to `limit` rows of (kind, id, work_id, title, score), best match first."""
+        return self.db_session.execute(self._search_statement(query, kinds, limit, offset)).all()
+
+
+class AsyncSearchRepository(SearchRepository):
+    async def search(self, query: str, kinds: Sequence[str], limit: int, offset: int = 0) -> List:
+        return (await self.db_session.execute(self._search_statement(query, kinds, limit, offset))).all()
@@ -0,0 +1,39 @@
+import random
+from contextvars import ContextVar
+
+# 현재 서비스 함수가 복제본에서 읽어도 되는지 (service_helper 가 설정한다)
+read_from_replica: ContextVar[bool] = ContextVar("read_from_replica", default=False)
+
+# 세션에서 쓰기가 일어났는지, 세션이 고른 복제본 (session.info 키)
+_WROTE = "routing_wrote"
+_REPLICA = "routing_replica"
+
+
+def route(session, primary, replicas, clause=None):
+    """Pick the engine a session's next statement runs on.
+
+    Statements go to a replica only while a read-only service function runs
+    (`read_from_replica`) and the session has not written yet. Once it flushes or
+    executes an INSERT/UPDATE/DELETE, the session stays on the primary, so its later
+    reads see its own writes. A session keeps the replica it picked first, so all
+    its reads come from one copy.
+
+    Args:
+        session: The (sync) Session asking for a bind.
+        primary: The primary engine.
+        replicas (list): The replica engines (empty when none are configured).
+        clause: The statement about to run, if known.
+    """
+    if session._flushing or (clause is not None and getattr(clause, "is_dml", False)):
+        session.info[_WROTE] = True
+    # 읽기 전용이 아닌 서비스 함수는 조회도 primary 에서 한다 (쓰기 직전의 확인 조회 등).
+    if not replicas or session.info.get(_WROTE) or not read_from_replica.get():
+        return primary
+    if _REPLICA not in session.info:
+        session.info[_REPLICA] = random.randrange(len(replicas))
+    return replicas[session.info[_REPLICA]]
+
+
+def has_written(session) -> bool:
+    """Whether `session` has written (and is therefore pinned to the primary)."""
+    return bool(session.info.get(_WROTE))
@@ -1,6 +1,6 @@
 from pydantic import BaseModel
 from datetime import datetime
-from typing import List, Optional
+from typing import Generic, List, Optional, TypeVar
 
 class CustomBaseModel(BaseModel):
     class Config:
@@ -25,6 +25,8 @@ class CustomBaseModel(BaseModel):
         return self.__str__()    
     
 
+T = TypeVar("T")
+
 # Base model for common attributes (optional)
 class TimestampedBaseModel(CustomBaseModel):
     created_at: datetime
@@ -37,6 +39,9 @@ class UserBase(CustomBaseModel):
 class WorkBase(CustomBaseModel):
     pass
 
+class EpisodeBase(CustomBaseModel):
+    pass
+
 class UserCreate(UserBase):
     username: str
     password: str
@@ -55,8 +60,114 @@ class WorkCreate(WorkBase):
     description: str
     user_id: Optional[int] = 1
 
+class WorkBatchUpdate(WorkBase):
+    id: int
+    title: Optional[str] = None
+    description: Optional[str] = None
+
 class WorkResponse(TimestampedBaseModel):
     id: int
     title: str
-    
-    
\ No newline at end of file
+    favorite_count: int = 0
+
+# Episode Models
+class EpisodeCreate(EpisodeBase):
+    title: str
+    content: Optional[str] = None
+    work_id: Optional[int] = None
+
+class EpisodeBatchUpdate(EpisodeBase):
+    id: int
+    title: Optional[str] = None
+    content: Optional[str] = None
+
+class EpisodeResponse(TimestampedBaseModel):
+    id: int
+    work_id: int
+    title: str
+
+# Include Models (목록 조회의 include= 로 요청한 관계만 채워진다)
+class UserDetailResponse(UserResponse):
+    # 최근 작품 (Config.INCLUDE_COLLECTION_LIMIT 개)
+    works: Optional[List[WorkResponse]] = None
+
+class WorkDetailResponse(WorkResponse):
+    user: Optional[UserResponse] = None
+    # 최근 회차 (Config.INCLUDE_COLLECTION_LIMIT 개)
+    episodes: Optional[List[EpisodeResponse]] = None
+
+# Batch Models
+class BatchResponse(CustomBaseModel):
+    # 생성/수정된 행의 id (요청 순서)
+    ids: List[int]
+
+
+# Pagination Models
+class CursorPage(CustomBaseModel, Generic[T]):
+    items: List[T]
+    # 다음 페이지 조회용 커서 (마지막 페이지면 None)
+    next_cursor: Optional[str] = None
+
+# Trending Models
+class TrendingWork(CustomBaseModel):
+    work: WorkResponse
+    # 시간 감쇠를 적용한 인기 점수 (목록을 만든 시각 기준)
+    score: float
+
+class TrendingPage(CustomBaseModel):
+    items: List[TrendingWork]
+    # 목록을 만든 시각 (워커마다 주기적으로 다시 만든다)
+    computed_at: datetime
+
+# Recommendation Models
+class SimilarWork(CustomBaseModel):
+    work: WorkResponse
+    # 선호/시청한 유저가 겹치는 정도 (코사인 유사도, 0~1)
+    score: float
+
+# Event Models
+class EntityEvent(CustomBaseModel):
+    # episode.created / notice.created / comment.created
+    type: str
+    id: int
+    work_id: Optional[int] = None
+    episode_id: Optional[int] = None
+    notice_id: Optional[int] = None
+
+class EntityChange(CustomBaseModel):
+    # 변경을 커밋한 워커 (자기 메시지는 이미 반영했으므로 건너뛴다)
+    origin: str
+    table: str
+    ids: List[int]
+    # 무효화할 캐시 태그
+    tags: List[str]
+
+class WorkerMessage(CustomBaseModel):
+    # 워커끼리 주고받는 제어 메시지 (hello/bye/flush/flushed/writes)
+    origin: str
+    # flush 요청 id (flushed 로 되돌려준다)
+    request: Optional[str] = None
+    # hello 에 대한 답인지
+    reply: bool = False
+    # 최근에 쓴 클라이언트의 표식 키 (writes)
+    key: Optional[str] = None
+
+# Search Models
+class SearchResult(CustomBaseModel):
+    # work / episode / notice
+    kind: str
+    id: int
+    work_id: Optional[int] = None
+    title: str
+    score: float
+
+class SearchPage(CustomBaseModel):
+    items: List[SearchResult]
+    # 다음 페이지 조회용 offset (마지막 페이지면 None)
+    next_offset: Optional[int] = None
+
+# Conditional Request Models
+class ResourceVersion(CustomBaseModel):
+    # 행 수, 최대 id, 마지막 수정 시각으로 만든 버전 문자열 (ETag 의 재료)
+    tag: str
+    last_modified: Optional[datetime] = None
@@ -0,0 +1,304 @@
+import asyncio
+import hashlib
+import logging
+import secrets
+import time
+from collections import OrderedDict
+from functools import lru_cache
+from typing import Any, Awaitable, Callable, Iterable, Optional
+
+from pydantic import TypeAdapter
+
+from core.config import Config
+from db.models import Base
+
+logger = logging.getLogger(__name__)
+
+VERSION_TTL = 24 * 60 * 60
+
+
+def entity_tag(db_model_class: type[Base], entity_id: Any) -> str:
+    """The cache tag of a single row, e.g. `users:1`."""
+    return f"{db_model_class.__tablename__}:{entity_id}"
+
+
+def list_tag(db_model_class: type[Base], column: str, value: Any) -> str:
+    """The cache tag of the rows sharing a foreign key value, e.g. `works:user_id=1`."""
+    return f"{db_model_class.__tablename__}:{column}={value}"
+
+
+def invalidation_tags(db_model_class: type[Base], values: dict) -> set[str]:
+    """Return the tags a write of a row with `values` invalidates.
+
+    That is the row's own tag plus the list tag of every foreign key column present
+    in `values`.
+    """
+    tags = set()
+    if values.get("id") is not None:
+        tags.add(entity_tag(db_model_class, values["id"]))
+    for column in db_model_class.__table__.columns:
+        if column.foreign_keys and values.get(column.name) is not None:
+            tags.add(list_tag(db_model_class, column.name, values[column.name]))
+    return tags
+
+
+def foreign_key_columns(db_model_class: type[Base]) -> list[str]:
+    return [column.name for column in db_model_class.__table__.columns if column.foreign_keys]
+
+
+class CacheBackend:
+    """The storage interface used by `ServiceCache`.
+
+    Backends with `stores_objects = False` only hold bytes/str values (a shared
+    backend such as Redis, or a local stand-in for one); values are serialised with
+    the response model's TypeAdapter before being stored.
+    """
+
+    stores_objects = False
+    # 모든 워커가 같은 저장소를 보는지 (아니면 무효화를 워커마다 반영해야 한다)
+    shared = False
+
+    async def get(self, key: str) -> Optional[Any]:
+        raise NotImplementedError
+
+    async def set(self, key: str, value: Any, ttl: float) -> None:
+        raise NotImplementedError
+
+    async def delete(self, keys: Iterable[str]) -> None:
+        raise NotImplementedError
+
+
+class MemoryCacheBackend(CacheBackend):
+    """An in-process LRU cache whose entries also expire after a TTL.
+
+    Args:
+        max_entries (int): The number of entries kept before the least recently used is evicted.
+        stores_objects (bool): Keep response objects as they are (default). With False the
+            backend behaves like a shared one and only receives serialised values.
+    """
+
+    def __init__(self, max_entries: int, stores_objects: bool = True):
+        self.max_entries = max_entries
+        self.stores_objects = stores_objects
+        self._entries = OrderedDict()
+
+    async def get(self, key: str) -> Optional[Any]:
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        expires_at, value = entry
+        if expires_at < time.monotonic():
+            del self._entries[key]
+            return None
+        self._entries.move_to_end(key)
+        return value
+
+    async def set(self, key: str, value: Any, ttl: float) -> None:
+        self._entries[key] = (time.monotonic() + ttl, value)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+
+    async def delete(self, keys: Iterable[str]) -> None:
+        for key in keys:
+            self._entries.pop(key, None)
+
+    def clear(self) -> None:
+        self._entries.clear()
+
+
+class RedisCacheBackend(CacheBackend):
+    """A cache shared by every worker, stored in Redis (requires the optional `redis` package)."""
+
+    shared = True
+
+    def __init__(self, url: str):
+        try:
+            import redis.asyncio as redis
+        except ImportError as e:
+            raise RuntimeError("CACHE_BACKEND=redis requires the 'redis' package.") from e
+        self._client = redis.from_url(url)
+
+    async def get(self, key: str) -> Optional[Any]:
+        return await self._client.get(key)
+
+    async def set(self, key: str, value: Any, ttl: float) -> None:
+        await self._client.set(key, value, ex=max(1, int(ttl)))
+
+    async def delete(self, keys: Iterable[str]) -> None:
+        keys = list(keys)
+        if keys:
+            await self._client.delete(*keys)
+
+
+@lru_cache(maxsize=None)
+def _type_adapter(response_type: Any) -> TypeAdapter:
+    return TypeAdapter(response_type)
+
+
+class ServiceCache:
+    """Read-through cache for service read functions with tag-based invalidation.
+
+    Every cached value belongs to one tag (see `entity_tag` / `list_tag`). Its key
+    embeds the tag's current version, and invalidating a tag replaces the version,
+    so all keys of the tag (e.g. every page of a list) become unreachable at once
+    and a read that raced with the invalidation can only store under a stale key.
+
+    Args:
+        backend (Optional[CacheBackend]): Where entries are stored; None disables caching.
+        ttl (float): Seconds an entry stays valid.
+    """
+
+    def __init__(self, backend: Optional[CacheBackend], ttl: float):
+        self.backend = backend
+        self.ttl = ttl
+        self._delayed: set[asyncio.Task] = set()
+
+    async def _version(self, tag: str) -> str:
+        version = await self.backend.get(f"v:{tag}")
+        if version is None:
+            version = secrets.token_hex(4)
+            await self.backend.set(f"v:{tag}", version, VERSION_TTL)
+        return version.decode() if isinstance(version, bytes) else version
+
+    async def get_or_load(
+        self,
+        tag: str,
+        suffix: str,
+        response_type: Any,
+        loader: Callable[[], Awaitable[Any]],
+    ) -> Any:
+        """Return the cached value for `(tag, suffix)`, or load and store it.
+
+        Args:
+            tag (str): The tag whose invalidation drops this value.
+            suffix (str): Distinguishes values of the same tag (e.g. the page cursor).
+            response_type (Any): The type of the value, used to (de)serialise it.
+            loader (Callable[[], Awaitable[Any]]): Loads the value on a miss.
+        """
+        if self.backend is None:
+            return await loader()
+
+        try:
+            key = f"{tag}@{await self._version(tag)}:{suffix}"
+            cached = await self.backend.get(key)
+        except Exception:
+            logger.exception("Cache read failed for %s", tag)
+            return await loader()
+        if cached is not None:
+            if self.backend.stores_objects:
+                return cached
+            return _type_adapter(response_type).validate_json(cached)
+
+        value = await loader()
+        if value is not None:
+            stored = value if self.backend.stores_objects else _type_adapter(response_type).dump_json(value)
+            try:
+                await self.backend.set(key, stored, self.ttl)
+            except Exception:
+                logger.exception("Cache write failed for %s", tag)
+        return value
+
+    async def invalidate(self, tags: Iterable[str]) -> None:
+        """Make every cached value of `tags` unreachable."""
+        if self.backend is None:
+            return
+        for tag in tags:
+            await self.backend.set(f"v:{tag}", secrets.token_hex(4), VERSION_TTL)
+
+    def clear_local(self) -> None:
+        """Drop every entry of an in-process backend (when invalidations may have been missed)."""
+        if isinstance(self.backend, MemoryCacheBackend):
+            self.backend.clear()
+
+    async def invalidate_later(self, tags: Iterable[str], delay: float) -> None:
+        """Invalidate `tags` once more after `delay` seconds, in the background.
+
+        A read served by a lagging replica can cache the pre-write state right after
+        the post-commit invalidation; this drops it once the replicas have caught up.
+        """
+        if self.backend is None:
+            return
+        task = asyncio.create_task(self._invalidate_after(list(tags), delay))
+        self._delayed.add(task)
+        task.add_done_callback(self._delayed.discard)
+
+    async def _invalidate_after(self, tags: list, delay: float) -> None:
+        await asyncio.sleep(delay)
+        try:
+            await self.invalidate(tags)
+        except Exception:
+            logger.exception("Delayed cache invalidation failed for %s", tags)
+
+
+class RecentWrites:
+    """Remembers which clients wrote within the last `window` seconds.
+
+    Used for read-your-writes with read replicas: a client that wrote recently reads
+    from the primary until the replicas have caught up. Clients are identified by a
+    hash of their credentials (the access token), and the markers are kept in the
+    cache backend, so with a shared backend every worker sees them. With a
+    per-process backend `invalidation_bus` copies each marker to the other workers.
+
+    Args:
+        backend (CacheBackend): Where the markers are stored.
+        window (float): Seconds a client stays on the primary after a write.
+    """
+
+    def __init__(self, backend: CacheBackend, window: float):
+        self.backend = backend
+        self.window = window
+        # 이 시각 (monotonic) 까지는 모든 클라이언트를 최근에 쓴 것으로 본다.
+        self._everyone_until = 0.0
+
+    @property
+    def shared(self) -> bool:
+        return self.backend.shared
+
+    @staticmethod
+    def _key(client: str) -> str:
+        return f"w:{hashlib.sha256(client.encode()).hexdigest()[:32]}"
+
+    async def add(self, client: str) -> str:
+        """Mark `client` and return the marker's key (which other workers can `mark`)."""
+        key = self._key(client)
+        await self.mark(key)
+        return key
+
+    async def mark(self, key: str) -> None:
+        try:
+            await self.backend.set(key, "1", self.window)
+        except Exception:
+            logger.exception("Failed to record a recent write")
+
+    def mark_everyone(self) -> None:
+        """Treat every client as having written, for one `window` (when markers may have been missed)."""
+        self._everyone_until = time.monotonic() + self.window
+
+    async def contains(self, client: str) -> bool:
+        if time.monotonic() < self._everyone_until:
+            return True
+        try:
+            return await self.backend.get(self._key(client)) is not None
+        except Exception:
+            # 확인할 수 없으면 primary 에서 읽는다.
+            logger.exception("Failed to look up recent writes")
+            return True
+
+
+def create_cache_backend() -> Optional[CacheBackend]:
+    if Config.CACHE_BACKEND == "memory":
+        return MemoryCacheBackend(Config.CACHE_MAX_ENTRIES)
+    elif Config.CACHE_BACKEND == "redis":
+        return RedisCacheBackend(Config.CACHE_REDIS_URL)
+    elif Config.CACHE_BACKEND == "none":
+        return None
+    else:
+        raise ValueError(f"Unsupported CACHE_BACKEND '{Config.CACHE_BACKEND}'.")
+
+
+service_cache = ServiceCache(create_cache_backend(), Config.CACHE_TTL)
+recent_writes = RecentWrites(
+    service_cache.backend or MemoryCacheBackend(Config.CACHE_MAX_ENTRIES),
+    Config.DB_REPLICA_LAG,
+)
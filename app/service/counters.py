@@ -0,0 +1,100 @@
+import asyncio
+import logging
+from collections import defaultdict
+from typing import Optional
+
+from core.config import Config
+from service.invalidation import invalidation_bus
+from service.write_behind import WriteBehindBuffer
+
+logger = logging.getLogger(__name__)
+
+
+class CounterBuffer(WriteBehindBuffer):
+    """Coalesces counter increments, e.g. +1/-1 on `works.favorite_count`.
+
+    Deltas are summed per (counter name, id) and applied by one executemany UPDATE
+    per counter and flush, in a single transaction. Deltas dropped when the buffer
+    is full show up as drift, which `CounterReconciler` fixes.
+    """
+
+    name = "counter"
+
+    def __init__(
+        self,
+        flush_size: int = Config.COUNTER_FLUSH_SIZE,
+        flush_interval: float = Config.COUNTER_FLUSH_INTERVAL,
+        max_pending: int = Config.COUNTER_MAX_PENDING,
+    ):
+        super().__init__(flush_size, flush_interval, max_pending)
+
+    def _combine(self, current: int, value: int) -> int:
+        return current + value
+
+    async def _write(self, pending: dict) -> None:
+        # service_helper 는 service.service (이 모듈을 import 한다) 를 import 하므로 여기서 가져온다.
+        from service.service_helper import service_scope
+
+        deltas = defaultdict(dict)
+        for (name, entity_id), delta in pending.items():
+            if delta:
+                deltas[name][entity_id] = delta
+        if not deltas:
+            return
+        async with service_scope() as service:
+            await service.apply_counter_deltas(dict(deltas))
+
+    async def increment(self, name: str, entity_id: int, delta: int = 1) -> None:
+        """Buffer `delta` for the counter `name` of `entity_id`."""
+        await self.add((name, entity_id), delta)
+
+
+class CounterReconciler:
+    """Periodically recomputes the counters from the counted rows.
+
+    Fixes drift from dropped or failed increments. Before each id range is
+    recomputed, every worker flushes its `counter_buffer` (see
+    `InvalidationBus.flush_all`), so only deltas buffered in the few milliseconds
+    between those flushes and the UPDATE can be counted twice until the next run.
+    """
+
+    def __init__(self, interval: float = Config.COUNTER_RECONCILE_INTERVAL):
+        self.interval = interval
+        self._task: Optional[asyncio.Task] = None
+
+    async def reconcile(self) -> dict:
+        from service.service_helper import service_scope
+
+        async with service_scope() as service:
+            fixed = await service.reconcile_counters()
+        if any(fixed.values()):
+            logger.info("Reconciled drifted counters: %s", fixed)
+        return fixed
+
+    async def _run(self):
+        while True:
+            await asyncio.sleep(self.interval)
+            try:
+                await self.reconcile()
+            except Exception:
+                logger.exception("Counter reconciliation failed")
+
+    def start(self) -> None:
+        """Start the periodic reconciliation, unless the interval is 0."""
+        if self._task is None and self.interval > 0:
+            self._task = asyncio.create_task(self._run())
+
+    async def stop(self) -> None:
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+
+
+counter_buffer = CounterBuffer()
+counter_reconciler = CounterReconciler()
+# 다른 워커가 재계산하기 전에 이 워커의 증감도 반영한다.
+invalidation_bus.add_flush_handler(counter_buffer.flush)
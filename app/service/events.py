@@ -0,0 +1,166 @@
+import asyncio
+import logging
+from collections import defaultdict
+from typing import Iterable, List, Optional
+
+from core.config import Config
+from db.models import Base, Comment, Episode, Notice
+from schemas.models import EntityEvent
+from service.transport import EventTransport, create_event_transport
+
+logger = logging.getLogger(__name__)
+
+# 알림을 보내는 모델 -> (이벤트 이름, 구독 주제를 정하는 외래 키 컬럼)
+# 주제는 컬럼 이름에서 _id 를 뗀 것과 값이다 (work_id=3 -> "work:3").
+PUBLISHED_MODELS = {
+    Episode: ("episode", ["work_id"]),
+    Notice: ("notice", ["work_id"]),
+    Comment: ("comment", ["episode_id", "notice_id"]),
+}
+
+
+def work_topic(work_id: int) -> str:
+    return f"work:{work_id}"
+
+
+def episode_topic(episode_id: int) -> str:
+    return f"episode:{episode_id}"
+
+
+class SubscriberLimitError(Exception):
+    """Raised when a worker already has `Config.EVENTS_MAX_SUBSCRIBERS` subscribers."""
+
+
+class SlowSubscriberError(Exception):
+    """Raised by `Subscription.get` once a subscriber fell too far behind and was dropped."""
+
+
+class Subscription:
+    """One subscriber's bounded queue of serialised events.
+
+    Publishing never waits for subscribers: when the queue is full the subscription
+    is dropped, and once the subscriber has read what was queued, `get` raises
+    `SlowSubscriberError`, so it can tell its client to reconnect and catch up by
+    reading the resources again.
+    """
+
+    def __init__(self, topics: List[str], queue_size: int):
+        self.topics = topics
+        self.overflowed = False
+        self._queue: asyncio.Queue = asyncio.Queue(maxsize=queue_size)
+
+    def _put(self, message: bytes) -> bool:
+        try:
+            self._queue.put_nowait(message)
+        except asyncio.QueueFull:
+            self.overflowed = True
+            return False
+        return True
+
+    async def get(self, timeout: Optional[float] = None) -> Optional[bytes]:
+        """Return the next event, or None when `timeout` seconds pass without one.
+
+        Raises:
+            SlowSubscriberError: If the subscription was dropped and its queue is drained.
+        """
+        if self.overflowed and self._queue.empty():
+            raise SlowSubscriberError()
+        try:
+            return await asyncio.wait_for(self._queue.get(), timeout)
+        except asyncio.TimeoutError:
+            return None
+
+
+class EventBroker:
+    """In-process pub/sub of entity events, fed by the add paths of `AsyncService`.
+
+    Events are published on the transport, which hands them to the broker of every
+    worker (see `service.transport`); each broker fans them out to its own
+    subscribers' queues. An event is serialised once, and subscribers receive the
+    JSON bytes.
+
+    Args:
+        transport (EventTransport): Carries events between workers.
+        queue_size (int): Events a subscriber may have waiting before it is dropped.
+        max_subscribers (int): Subscribers this worker accepts.
+    """
+
+    def __init__(self, transport: EventTransport, queue_size: int, max_subscribers: int):
+        self.transport = transport
+        self.queue_size = queue_size
+        self.max_subscribers = max_subscribers
+        self.dropped = 0
+        self._subscriptions: dict[str, set] = defaultdict(set)
+        self._count = 0
+
+    def __len__(self) -> int:
+        return self._count
+
+    def subscribe(self, topics: List[str]) -> Subscription:
+        """Subscribe to `topics` (see `work_topic` / `episode_topic`).
+
+        Raises:
+            SubscriberLimitError: If the worker has no room for another subscriber.
+        """
+        if self._count >= self.max_subscribers:
+            raise SubscriberLimitError()
+        subscription = Subscription(topics, self.queue_size)
+        for topic in topics:
+            self._subscriptions[topic].add(subscription)
+        self._count += 1
+        return subscription
+
+    def unsubscribe(self, subscription: Subscription) -> None:
+        """Remove `subscription` (calling it more than once is harmless)."""
+        removed = False
+        for topic in subscription.topics:
+            subscribers = self._subscriptions.get(topic)
+            if subscribers and subscription in subscribers:
+                subscribers.discard(subscription)
+                removed = True
+                if not subscribers:
+                    del self._subscriptions[topic]
+        if removed:
+            self._count -= 1
+
+    def _deliver(self, topic: str, message: bytes) -> None:
+        for subscription in list(self._subscriptions.get(topic, ())):
+            if not subscription._put(message):
+                # 느린 구독자 때문에 발행이 막히지 않도록 구독을 끊는다.
+                self.dropped += 1
+                self.unsubscribe(subscription)
+                logger.warning("Dropped a slow subscriber of %s", subscription.topics)
+
+    async def publish(self, topic: str, message: bytes) -> None:
+        await self.transport.publish(topic, message)
+
+    async def publish_created(self, db_model_class: type[Base], rows: Iterable[dict]) -> None:
+        """Publish a `<name>.created` event for each new row of `db_model_class`.
+
+        Failures are logged and swallowed: the rows are already committed, and
+        subscribers tolerate missed events.
+        """
+        name, columns = PUBLISHED_MODELS[db_model_class]
+        try:
+            for row in rows:
+                values = {column: row.get(column) for column in columns}
+                message = EntityEvent(type=f"{name}.created", id=row["id"], **values).model_dump_json(exclude_none=True).encode()
+                for column, value in values.items():
+                    if value is not None:
+                        await self.publish(f"{column[:-len('_id')]}:{value}", message)
+        except Exception:
+            logger.exception("Failed to publish %s events", name)
+
+    async def start(self) -> None:
+        """Start receiving events from the transport (call from the application's lifespan)."""
+        await self.transport.start(self._deliver)
+
+    async def stop(self) -> None:
+        await self.transport.stop(self._deliver)
+
+
+event_broker = EventBroker(
+    create_event_transport("events:"),
+    Config.EVENTS_QUEUE_SIZE,
+    Config.EVENTS_MAX_SUBSCRIBERS,
+)
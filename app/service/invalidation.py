@@ -0,0 +1,211 @@
+import asyncio
+import logging
+import secrets
+from typing import Any, Awaitable, Callable, Iterable, List, Optional
+
+from core.config import Config
+from repositories import has_replicas
+from schemas.models import EntityChange, WorkerMessage
+from service.cache import RecentWrites, ServiceCache, recent_writes, service_cache
+from service.transport import EventTransport, create_event_transport
+
+logger = logging.getLogger(__name__)
+
+Listener = Callable[[EntityChange], Awaitable[None]]
+
+
+class _FlushRequest:
+    def __init__(self, peers: set):
+        self.pending = set(peers)
+        self.confirmed: set = set()
+        self.done = asyncio.Event()
+
+    def confirm(self, origin: str) -> None:
+        if origin in self.pending:
+            self.pending.discard(origin)
+            self.confirmed.add(origin)
+        if not self.pending:
+            self.done.set()
+
+
+class InvalidationBus:
+    """Broadcasts committed entity changes to every worker, so in-process state stays coherent.
+
+    The write helpers of `AsyncService` publish an `EntityChange` (the table, ids and
+    cache tags of the written rows) after each commit. The publishing worker applies
+    it at once, and every other worker when the transport delivers it. The first
+    listener invalidates the tags in `service_cache`, so each worker keeps serving
+    reads from its own memory cache, with no round trip to a shared cache, and
+    drops the entries another worker's write made stale. A shared cache backend is
+    invalidated once by the publisher.
+
+    Delivery is at most once. Whenever the transport (re)connects, the local cache
+    is cleared, since changes may have been missed; while it is disconnected, stale
+    entries live at most `Config.CACHE_TTL` seconds.
+
+    Workers announce themselves when they start (and stop), so each one knows its
+    `peers`; `flush_all` uses them to wait until every worker has flushed its
+    write-behind buffers.
+
+    When the recent-write markers are kept per process, `record_write` copies them
+    to every worker, and a worker that (re)connects sends all clients to the
+    primary for one replica-lag window, since it may have missed some.
+
+    Args:
+        transport (EventTransport): Carries the changes between workers.
+        cache (ServiceCache): The cache to invalidate.
+        recent_writes (RecentWrites): The read-your-writes markers to keep in sync.
+    """
+
+    def __init__(self, transport: EventTransport, cache: ServiceCache, recent_writes: RecentWrites):
+        self.transport = transport
+        self.cache = cache
+        self.recent_writes = recent_writes
+        # 워커를 구분하는 값 (워커는 각자 이 모듈을 import 한다)
+        self.origin = secrets.token_hex(8)
+        self.received = 0
+        # 실행 중인 것으로 알려진 다른 워커
+        self.peers: set = set()
+        self._listeners: List[Listener] = [self._invalidate_cache]
+        self._flush_handlers: List[Callable[[], Awaitable[Any]]] = []
+        self._flush_requests: dict = {}
+        self._tasks: set = set()
+
+    def add_listener(self, listener: Listener) -> None:
+        """Call `listener` with every change committed by any worker (this one included)."""
+        self._listeners.append(listener)
+
+    def add_flush_handler(self, handler: Callable[[], Awaitable[Any]]) -> None:
+        """Run `handler` (e.g. a write-behind buffer's `flush`) whenever any worker calls `flush_all`."""
+        self._flush_handlers.append(handler)
+
+    def _spawn(self, coroutine) -> None:
+        task = asyncio.ensure_future(coroutine)
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+
+    async def _send(self, channel: str, request: Optional[str] = None, reply: bool = False, key: Optional[str] = None) -> None:
+        message = WorkerMessage(origin=self.origin, request=request, reply=reply, key=key)
+        try:
+            await self.transport.publish(channel, message.model_dump_json().encode())
+        except Exception:
+            logger.exception("Failed to send '%s' to the other workers", channel)
+
+    async def _invalidate_cache(self, change: EntityChange) -> None:
+        if change.origin != self.origin and self.cache.backend is not None and self.cache.backend.shared:
+            return
+        await self.cache.invalidate(change.tags)
+        if has_replicas():
+            await self.cache.invalidate_later(change.tags, Config.DB_REPLICA_LAG)
+
+    async def _apply(self, change: EntityChange) -> None:
+        for listener in self._listeners:
+            try:
+                await listener(change)
+            except Exception:
+                logger.exception("Failed to apply a change of %s", change.table)
+
+    async def publish(self, table: str, ids: Iterable[int], tags: Iterable[str]) -> None:
+        """Apply a committed change here and broadcast it to the other workers.
+
+        Broadcast failures are logged and swallowed: the rows are already committed.
+        """
+        change = EntityChange(origin=self.origin, table=table, ids=list(ids), tags=sorted(tags))
+        await self._apply(change)
+        try:
+            await self.transport.publish("entities", change.model_dump_json().encode())
+        except Exception:
+            logger.exception("Failed to broadcast a change of %s", table)
+
+    async def record_write(self, client: str) -> None:
+        """Mark `client` in `recent_writes`, on every worker unless the markers are shared.
+
+        The other workers apply the marker when the transport delivers it, usually well
+        before the client's next request.
+        """
+        key = await self.recent_writes.add(client)
+        if not self.recent_writes.shared:
+            await self._send("writes", key=key)
+
+    async def _flush_local(self) -> None:
+        for handler in self._flush_handlers:
+            try:
+                await handler()
+            except Exception:
+                logger.exception("Flush handler %r failed", handler)
+
+    async def _confirm_flush(self, request: str) -> None:
+        await self._flush_local()
+        await self._send("flushed", request=request)
+
+    async def flush_all(self, timeout: float) -> int:
+        """Flush this worker's buffers and have every other worker flush theirs.
+
+        Waits until all `peers` confirmed, at most `timeout` seconds; peers that did
+        not confirm are forgotten (they announce themselves again on reconnect).
+
+        Returns:
+            int: The number of other workers that confirmed.
+        """
+        await self._flush_local()
+        if not self.peers:
+            return 0
+        request = secrets.token_hex(8)
+        waiting = _FlushRequest(self.peers)
+        self._flush_requests[request] = waiting
+        try:
+            await self._send("flush", request=request)
+            await asyncio.wait_for(waiting.done.wait(), timeout)
+        except asyncio.TimeoutError:
+            logger.warning("%d workers did not confirm a flush within %.1fs", len(waiting.pending), timeout)
+            self.peers -= waiting.pending
+        finally:
+            del self._flush_requests[request]
+        return len(waiting.confirmed)
+
+    def _deliver(self, channel: str, message: bytes) -> None:
+        if channel == "entities":
+            change = EntityChange.model_validate_json(message)
+            # 자기 변경은 publish 에서 이미 반영했다.
+            if change.origin == self.origin:
+                return
+            self.peers.add(change.origin)
+            self.received += 1
+            self._spawn(self._apply(change))
+            return
+
+        control = WorkerMessage.model_validate_json(message)
+        if control.origin == self.origin:
+            return
+        if channel == "bye":
+            self.peers.discard(control.origin)
+            return
+        self.peers.add(control.origin)
+        if channel == "hello" and not control.reply:
+            # 새로 뜬 워커도 이 워커를 알 수 있게 답한다.
+            self._spawn(self._send("hello", reply=True))
+        elif channel == "flush":
+            self._spawn(self._confirm_flush(control.request))
+        elif channel == "flushed" and control.request in self._flush_requests:
+            self._flush_requests[control.request].confirm(control.origin)
+        elif channel == "writes" and control.key:
+            self._spawn(self.recent_writes.mark(control.key))
+
+    def _resync(self) -> None:
+        self.cache.clear_local()
+        if not self.recent_writes.shared:
+            self.recent_writes.mark_everyone()
+        self._spawn(self._send("hello"))
+
+    async def start(self) -> None:
+        """Start receiving other workers' changes (call from the application's lifespan)."""
+        await self.transport.start(self._deliver, resync=self._resync)
+        # resync 를 부르지 않는 전송 (local) 에서도 다른 워커에 알린다.
+        await self._send("hello")
+
+    async def stop(self) -> None:
+        await self._send("bye")
+        await self.transport.stop(self._deliver)
+
+
+invalidation_bus = InvalidationBus(create_event_transport("invalidate:"), service_cache, recent_writes)
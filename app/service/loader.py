@@ -0,0 +1,125 @@
+import asyncio
+import contextvars
+from collections import defaultdict
+from typing import Any, Awaitable, Callable, Hashable, Mapping, Optional
+
+from core.config import Config
+from core.metrics import timed
+from db.models import User, Work
+from repositories.routing import read_from_replica
+from schemas.models import UserResponse, WorkResponse
+from service.projection import get_projection
+
+
+class BatchLoader:
+    """Coalesce concurrent lookups by key into one batch call (the DataLoader pattern).
+
+    Keys requested within `delay` seconds of the first one are collected and passed
+    to `batch_load` together, at most `max_batch_size` at a time. A key that is
+    already waiting or being loaded is not requested again; its callers share the
+    result.
+
+    The batch runs in its own task and session, outside the caller's transaction,
+    so callers that must see their own uncommitted writes bypass the loader.
+
+    Args:
+        batch_load (Callable): Maps a list of keys to a `{key: value}` mapping; keys
+            missing from it load as None.
+        delay (float): Seconds to wait for more keys after the first one.
+        max_batch_size (int): Dispatch as soon as this many keys are waiting.
+    """
+
+    def __init__(
+        self,
+        batch_load: Callable[[list], Awaitable[Mapping[Hashable, Any]]],
+        delay: float = Config.LOADER_BATCH_DELAY,
+        max_batch_size: int = Config.LOADER_MAX_BATCH_SIZE,
+    ):
+        self.batch_load = batch_load
+        self.delay = delay
+        self.max_batch_size = max_batch_size
+        self._futures: dict[Hashable, asyncio.Future] = {}
+        self._waiting: list[Hashable] = []
+        self._timer: Optional[asyncio.TimerHandle] = None
+        self._tasks: set[asyncio.Task] = set()
+
+    async def load(self, key: Hashable) -> Any:
+        """Return the value of `key`, loaded together with concurrent lookups."""
+        future = self._futures.get(key)
+        if future is None:
+            loop = asyncio.get_running_loop()
+            future = self._futures[key] = loop.create_future()
+            self._waiting.append(key)
+            if len(self._waiting) >= self.max_batch_size:
+                self._dispatch()
+            elif self._timer is None:
+                self._timer = loop.call_later(self.delay, self._dispatch)
+        # 한 호출자가 취소되어도 같은 키를 기다리는 다른 호출자에게는 영향이 없도록 한다.
+        # 쿼리는 요청 밖에서 실행되므로, 기다린 시간을 요청의 DB 시간으로 기록한다.
+        with timed("db"):
+            return await asyncio.shield(future)
+
+    def _dispatch(self) -> None:
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+        keys, self._waiting = self._waiting, []
+        if not keys:
+            return
+        # 묶음 조회는 호출한 요청의 컨텍스트 (UnitOfWork 등) 없이 실행한다.
+        task = contextvars.Context().run(asyncio.create_task, self._run(keys))
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+
+    async def _run(self, keys: list) -> None:
+        try:
+            values = await self.batch_load(keys)
+        except Exception as e:
+            for key in keys:
+                future = self._futures.pop(key)
+                if not future.done():
+                    future.set_exception(e)
+            return
+        for key in keys:
+            future = self._futures.pop(key)
+            if not future.done():
+                future.set_result(values.get(key))
+
+
+async def _load_users(ids: list) -> dict:
+    from service.service_helper import service_scope
+
+    projection = get_projection(User, UserResponse)
+    read_from_replica.set(True)
+    async with service_scope() as service:
+        rows = await service.repository.users.search([("id", "in", ids)], columns=projection.columns)
+    return {row.id: projection.to_response(row) for row in rows}
+
+
+async def _load_first_work_pages(keys: list) -> dict:
+    """Load the first page of works of each `(user_id, limit)` key, one query per page size."""
+    from service.service import to_page
+    from service.service_helper import service_scope
+
+    projection = get_projection(Work, WorkResponse)
+    user_ids_by_limit = defaultdict(list)
+    for user_id, limit in keys:
+        user_ids_by_limit[limit].append(user_id)
+
+    pages = {}
+    read_from_replica.set(True)
+    async with service_scope() as service:
+        for limit, user_ids in user_ids_by_limit.items():
+            rows = await service.repository.works.search_grouped(
+                "user_id", user_ids, limit + 1, columns=projection.columns
+            )
+            rows_by_user = defaultdict(list)
+            for row in rows:
+                rows_by_user[row.user_id].append(row)
+            for user_id in user_ids:
+                pages[(user_id, limit)] = to_page(projection, rows_by_user[user_id], limit)
+    return pages
+
+
+user_loader = BatchLoader(_load_users)
+first_work_page_loader = BatchLoader(_load_first_work_pages)
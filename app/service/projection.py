@@ -0,0 +1,104 @@
+from functools import lru_cache
+from typing import Any, Optional, Sequence, get_args
+
+from pydantic import BaseModel, TypeAdapter
+from sqlalchemy import inspect
+
+from db.models import Base
+
+# keyset 페이지네이션 커서를 만들기 위해 항상 조회하는 컬럼
+KEYSET_COLUMNS = ("created_at", "id")
+
+
+def _nested_model(annotation: Any) -> Optional[type[BaseModel]]:
+    """The pydantic model inside an annotation such as `Optional[List[EpisodeResponse]]`."""
+    if isinstance(annotation, type) and issubclass(annotation, BaseModel):
+        return annotation
+    for arg in get_args(annotation):
+        model = _nested_model(arg)
+        if model is not None:
+            return model
+    return None
+
+
+class Projection:
+    """A column projection and a precompiled row mapper for one response model.
+
+    Only the columns the response model declares (plus the keyset columns used for
+    cursors) are selected, and rows are validated straight into the response model
+    without going through ORM instances.
+
+    Fields named after a relationship of the db model (e.g. `WorkDetailResponse.user`)
+    are filled only when the caller includes them; their rows are mapped with the
+    nested response model's own projection.
+
+    Attributes:
+        db_model_class (type[Base]): The SQLAlchemy model the columns belong to.
+        response_model_class (type[BaseModel]): The pydantic model rows are mapped to.
+        columns (list): The column attributes to select; their keys are the field names.
+        includes (dict): Relationship field name -> nested response model.
+    """
+
+    def __init__(self, db_model_class: type[Base], response_model_class: type[BaseModel]):
+        table_columns = db_model_class.__table__.columns
+        relationships = inspect(db_model_class).relationships
+        fields = [name for name in response_model_class.model_fields if name not in relationships]
+        missing = [name for name in fields if name not in table_columns]
+        if missing:
+            raise ValueError(
+                f"Fields {missing} of '{response_model_class.__name__}' are not columns of '{db_model_class.__name__}'."
+            )
+
+        names = fields + [name for name in KEYSET_COLUMNS if name not in fields and name in table_columns]
+        self.db_model_class = db_model_class
+        self.response_model_class = response_model_class
+        self.columns = [getattr(db_model_class, name) for name in names]
+        self.includes = {
+            name: _nested_model(field.annotation)
+            for name, field in response_model_class.model_fields.items()
+            if name in relationships
+        }
+        self._fields = fields
+        self._list_adapter = TypeAdapter(list[response_model_class])
+
+    def include_columns(self, include: Sequence[str]) -> dict[str, list[str]]:
+        """Map the included relationship fields to the column names their response models need.
+
+        Raises:
+            ValueError: If a name is not an includable field of the response model.
+        """
+        unknown = [name for name in include if name not in self.includes]
+        if unknown:
+            raise ValueError(
+                f"Cannot include {unknown}; '{self.response_model_class.__name__}' supports {sorted(self.includes)}."
+            )
+        relationships = inspect(self.db_model_class).relationships
+        return {
+            name: [column.key for column in get_projection(relationships[name].mapper.class_, self.includes[name]).columns]
+            for name in include
+        }
+
+    def to_response(self, row: Any) -> BaseModel:
+        """Map a single projected row to the response model."""
+        if row is None:
+            return None
+        return self.response_model_class.model_validate(row, from_attributes=True)
+
+    def to_response_list(self, rows: Sequence[Any], include: Sequence[str] = ()) -> list[BaseModel]:
+        """Map projected rows (or entities, with `include`) to response models in one batched validation."""
+        if include:
+            # 포함하지 않은 관계는 읽지 않는다 (lazy loading 방지).
+            rows = [
+                {
+                    **{name: getattr(row, name) for name in self._fields},
+                    **{name: getattr(row, name) for name in include},
+                }
+                for row in rows
+            ]
+        return self._list_adapter.validate_python(rows, from_attributes=True)
+
+
+@lru_cache(maxsize=None)
+def get_projection(db_model_class: type[Base], response_model_class: type[BaseModel]) -> Projection:
+    """Return the (cached) Projection for a db model / response model pair."""
+    return Projection(db_model_class, response_model_class)
@@ -1,15 +1,44 @@
+import time
 from collections import defaultdict
 from functools import wraps
-from typing import Any, Generator, Union
+from typing import Any, Generator, Optional, Union
 
-from pydantic import BaseModel
+from pydantic import BaseModel, TypeAdapter
 
+from core.config import Config
+from core.utils.password import (
+    hash_password,
+    hash_password_async,
+    needs_rehash,
+    verify_password,
+    verify_password_async,
+)
 from db.models import *
-from repositories import Repository
+from repositories import AsyncRepository, Repository
 from repositories.base import BaseRepository
+from repositories.pagination import clamp_page_size, decode_cursor, encode_cursor
+from repositories.routing import has_written, read_from_replica
+from service.counters import counter_buffer
+from service.events import PUBLISHED_MODELS, event_broker
+from service.invalidation import invalidation_bus
+from service.loader import first_work_page_loader, user_loader
+from service.cache import entity_tag, foreign_key_columns, invalidation_tags, list_tag, service_cache
+from service.projection import Projection, get_projection
+from service.trending import decayed_score, log_score, trending_buffer
 from schemas.models import *
 
 service_dict = defaultdict(dict)
+# 복제본에서 읽어도 되는 서비스 함수 ("Category.function")
+read_only_service_functions = set()
+
+SEARCH_KINDS = ("work", "episode", "notice")
+
+# 카운터 이름 -> (카운트되는 행의 repository, 카운트하는 행의 repository) 속성 이름
+COUNTED_REPOSITORIES = {
+    "work_favorites": ("works", "favorites"),
+    "comment_likes": ("comments", "likes"),
+}
+_search_results_adapter = TypeAdapter(list[SearchResult])
 
 def session_exception_handler(func):
     """A decorator to handle exceptions in a session context.
@@ -32,6 +61,27 @@ def session_exception_handler(func):
     return wrapper
 
 
+def async_session_exception_handler(func):
+    """The coroutine counterpart of `session_exception_handler`.
+
+    Args:
+        func: The coroutine function to decorate.
+
+    Returns:
+        The decorated coroutine function.
+    """
+
+    @wraps(func)
+    async def wrapper(self, *args, **kwargs):
+        try:
+            return await func(self, *args, **kwargs)
+        except Exception as e:
+            await self.repository.rollback()
+            raise e
+
+    return wrapper
+
+
 def to_db_model(
     db_model_class: type[Base],
     obj: Union[BaseModel, dict],
@@ -48,6 +98,17 @@ def to_db_model(
     else:
         raise ValueError(f"Invalid type for obj: {type(obj)}")
 
+def to_row(
+    obj: Union[BaseModel, dict],
+    exclude_unset: bool = False,
+) -> dict:
+    if isinstance(obj, BaseModel):
+        return obj.model_dump(exclude_unset=exclude_unset)
+    elif isinstance(obj, dict):
+        return obj
+    else:
+        raise ValueError(f"Invalid type for obj: {type(obj)}")
+
 def to_response_model(
     response_model_class: type[BaseModel],
     obj: Union[Base, dict],
@@ -65,10 +126,83 @@ def to_response_model(
         raise ValueError(f"Invalid type for obj: {type(obj)}")
 
 
-def _mark_as_service_function(category):
+def to_page(
+    projection: Projection,
+    rows: list,
+    limit: int,
+    include: Optional[list[str]] = None,
+) -> CursorPage:
+    """Build a CursorPage from up to `limit + 1` projected rows fetched in keyset order.
+
+    The extra row only signals that a next page exists; it is not returned.
+    """
+    next_cursor = None
+    if len(rows) > limit:
+        rows = rows[:limit]
+        last = rows[-1]
+        next_cursor = encode_cursor(last.created_at, last.id)
+    # items 는 이미 검증되었으므로 다시 검증하지 않는다.
+    return CursorPage[projection.response_model_class].model_construct(
+        items=projection.to_response_list(rows, include or ()),
+        next_cursor=next_cursor,
+    )
+
+
+def to_search_page(rows: list, limit: int, offset: int) -> SearchPage:
+    next_offset = None
+    if len(rows) > limit:
+        rows = rows[:limit]
+        next_offset = offset + limit
+    return SearchPage.model_construct(
+        items=_search_results_adapter.validate_python(rows, from_attributes=True),
+        next_offset=next_offset,
+    )
+
+
+def to_resource_version(row) -> Optional[ResourceVersion]:
+    """Build a ResourceVersion from a `get_version` probe (None when no row matched)."""
+    if not row.count:
+        return None
+    last_modified = row.last_modified
+    return ResourceVersion(
+        tag=f"{row.count}:{row.max_id}:{last_modified.isoformat() if last_modified else ''}",
+        last_modified=last_modified,
+    )
+
+
+def to_trending_works(projection: Projection, rows: list, now: float) -> list[TrendingWork]:
+    """Build TrendingWorks from `get_top` rows, with the scores decayed to `now`."""
+    return [
+        TrendingWork.model_construct(work=projection.to_response(row), score=decayed_score(row.trending_score, now))
+        for row in rows
+    ]
+
+
+def to_similar_works(projection: Projection, rows: list) -> list[SimilarWork]:
+    """Build SimilarWorks from `get_similar` rows."""
+    return [
+        SimilarWork.model_construct(work=projection.to_response(row), score=row.similarity_score)
+        for row in rows
+    ]
+
+
+def _search_bounds(kinds: Optional[list[str]], offset: int, limit: Optional[int]):
+    kinds = list(kinds) if kinds else list(SEARCH_KINDS)
+    unknown = [kind for kind in kinds if kind not in SEARCH_KINDS]
+    if unknown:
+        raise ValueError(f"Unsupported search type {unknown}.")
+    limit = clamp_page_size(limit)
+    if offset < 0 or offset + limit > Config.SEARCH_MAX_RESULTS:
+        raise ValueError(f"Search results are limited to the first {Config.SEARCH_MAX_RESULTS}.")
+    return kinds, offset, limit
+
+
+def _mark_as_service_function(category, read_only=False):
     def _inner(func):
         global service_helper_functions
         service_dict[category][func.__name__] = func
+        if read_only:
+            read_only_service_functions.add(f"{category}.{func.__name__}")
         return func
 
     return _inner
@@ -92,15 +226,140 @@ class Service:
         self.repository.refresh(model)
         return to_response_model(response_model_class, model)
 
+    @session_exception_handler
+    def _add_models(
+        self,
+        repository: BaseRepository,
+        models: list[Union[BaseModel, dict]],
+    ) -> BatchResponse:
+        rows = [to_row(model) for model in models]
+        ids = repository.add_many(rows)
+        self.repository.commit()
+        return BatchResponse(ids=ids)
+
+    @session_exception_handler
+    def _update_models(
+        self,
+        repository: BaseRepository,
+        model_updates: list[Union[BaseModel, dict]],
+    ) -> BatchResponse:
+        rows = [to_row(model_update, exclude_unset=True) for model_update in model_updates]
+        repository.update_many(rows)
+        self.repository.commit()
+        return BatchResponse(ids=[row["id"] for row in rows])
+
+    @session_exception_handler
+    def _upsert_models(self, repository: BaseRepository, rows: list[dict]) -> None:
+        repository.upsert_many(rows)
+        self.repository.commit()
+
+    def _counted_repositories(self, counter: str) -> tuple[BaseRepository, BaseRepository]:
+        counted, counting = COUNTED_REPOSITORIES[counter]
+        return getattr(self.repository, counted), getattr(self.repository, counting)
+
+    @session_exception_handler
+    def _add_counted(self, counter: str, counted_id: int, row: dict) -> bool:
+        """Insert `row` (e.g. a favorite of work `counted_id`) unless it exists, and count it.
+
+        Returns:
+            bool: Whether the row was inserted.
+
+        Raises:
+            ValueError: If the counted row (e.g. the work) does not exist.
+        """
+        counted, counting = self._counted_repositories(counter)
+        if counted.get_by_id(counted_id, columns=[counted.model.id]) is None:
+            raise ValueError(f"{counted.model.__name__} with id {counted_id} not found")
+        if not counting.add_if_absent(row):
+            return False
+        self.repository.counters.apply_deltas(counter, {counted_id: 1})
+        self.repository.commit()
+        return True
+
+    @session_exception_handler
+    def _delete_counted(self, counter: str, counted_id: int, row: dict) -> bool:
+        """Delete `row` if it exists, and uncount it. Returns whether it was deleted."""
+        _, counting = self._counted_repositories(counter)
+        deleted = counting.delete_matching(row)
+        if not deleted:
+            return False
+        self.repository.counters.apply_deltas(counter, {counted_id: -deleted})
+        self.repository.commit()
+        return True
+
+    @session_exception_handler
+    def _apply_counter_deltas(self, deltas: dict[str, dict[int, int]]) -> None:
+        for counter, counter_deltas in deltas.items():
+            self.repository.counters.apply_deltas(counter, counter_deltas)
+        self.repository.commit()
+
+    @session_exception_handler
+    def _reconcile_counter(self, counter: str, start_id: int, end_id: int) -> int:
+        fixed = self.repository.counters.reconcile(counter, start_id, end_id)
+        self.repository.commit()
+        return fixed
+
+    @session_exception_handler
+    def _get_trending_works(self, limit: int) -> list[TrendingWork]:
+        projection = get_projection(Work, WorkResponse)
+        rows = self.repository.trending.get_top(limit, projection.columns)
+        return to_trending_works(projection, rows, time.time())
+
+    @session_exception_handler
+    def _prune_trending(self, min_score: float) -> int:
+        pruned = self.repository.trending.prune(min_score)
+        self.repository.commit()
+        return pruned
+
+    @session_exception_handler
+    def _get_similar_works(self, work_id: int, limit: int) -> list[SimilarWork]:
+        projection = get_projection(Work, WorkResponse)
+        rows = self.repository.similarities.get_similar(work_id, limit, projection.columns)
+        return to_similar_works(projection, rows)
+
+    @session_exception_handler
+    def _replace_similar_works(self, start_id: int, end_id: Optional[int], rows: list[dict]) -> None:
+        self.repository.similarities.replace(start_id, end_id, rows)
+        self.repository.commit()
+
+    @session_exception_handler
+    def _get_version(
+        self,
+        repository: BaseRepository,
+        conditions: list[tuple[str, str, Any]],
+    ) -> Optional[ResourceVersion]:
+        return to_resource_version(repository.get_version(conditions))
+
+    @session_exception_handler
+    def _get_model_ids(
+        self,
+        repository: BaseRepository,
+        conditions: list[tuple[str, str, Any]],
+    ) -> list[int]:
+        rows = repository.search(conditions, columns=[repository.model.id])
+        return [row.id for row in rows]
+
     @session_exception_handler
     def _get_model_list(
         self,
         repository: BaseRepository,
         response_model_class: type[BaseModel],
         conditions: list[tuple[str, str, Any]] = None,
-    ) -> list[BaseModel]:
-        models = repository.search(conditions) if conditions else repository.get_all()
-        return [to_response_model(response_model_class, model) for model in models]
+        cursor: Optional[str] = None,
+        limit: Optional[int] = None,
+        include: Optional[list[str]] = None,
+    ) -> CursorPage:
+        projection = get_projection(repository.model, response_model_class)
+        limit = clamp_page_size(limit)
+        after = decode_cursor(cursor) if cursor else None
+        # 포함할 관계는 요청 수와 무관하게 관계당 쿼리 하나 (또는 JOIN) 로 불러온다.
+        include_columns = projection.include_columns(include) if include else None
+        rows = (
+            repository.search(conditions, limit=limit + 1, after=after, columns=projection.columns, include=include_columns)
+            if conditions
+            else repository.get_all(limit=limit + 1, after=after, columns=projection.columns, include=include_columns)
+        )
+        return to_page(projection, rows, limit, include)
 
     @session_exception_handler
     def _get_model_by_id(
@@ -110,10 +369,11 @@ class Service:
         response_model_class: type[BaseModel],
         model_id: int,
     ) -> BaseModel:
-        model = repository.get_by_id(model_id)
-        if model is None:
+        projection = get_projection(db_model_class, response_model_class)
+        row = repository.get_by_id(model_id, columns=projection.columns)
+        if row is None:
             raise ValueError(f"{db_model_class.__name__} with id {model_id} not found")
-        return to_response_model(response_model_class, model)
+        return projection.to_response(row)
 
     @session_exception_handler
     def _delete_model(self, repository: BaseRepository, model_id: int):
@@ -142,14 +402,18 @@ class Service:
         model_update = (
             model_update.model_dump(exclude_unset=True)
             if isinstance(model_update, BaseModel)
-            else model_update
+            else dict(model_update)
         )
+        # 비밀번호는 응답 모델에 없으므로 비교하지 않고, 해시로만 저장한다.
+        password = model_update.pop("password", None)
         for key, value in model_update.items():
             if (
                 getattr(src_model, key) != value
                 and update_model_class.model_fields[key].default != value
             ):
                 update_d[key] = value
+        if password is not None:
+            update_d["password"] = hash_password(password)
 
         repository.update(model, **update_d)
         self.repository.commit()
@@ -159,15 +423,20 @@ class Service:
     # User Service
     @_mark_as_service_function(category="User")
     def add_user(self, user: Union[UserCreate, dict]) -> UserResponse:
+        user = to_row(user)
+        user = {**user, "password": hash_password(user["password"])}
         return self._add_model(self.repository.users, User, UserResponse, user)
 
-    @_mark_as_service_function(category="User")
+    @_mark_as_service_function(category="User", read_only=True)
     def get_user_list(
         self,
         id: Union[int, list, None] = None,
         username: Union[str, list, None] = None,
         is_active: Union[bool, list, None] = None,
-    ) -> list[UserResponse]:
+        cursor: Optional[str] = None,
+        limit: Optional[int] = None,
+        include: Optional[list[str]] = None,
+    ) -> CursorPage[UserResponse]:
         conditions = []
         if id:
             conditions.append(("id", "in", id if isinstance(id, list) else [id]))
@@ -177,12 +446,18 @@ class Service:
             conditions.append(
                 ("is_active", "in", is_active if isinstance(is_active, list) else [is_active])
             )
-        return self._get_model_list(self.repository.users, UserResponse, conditions)
+        if include:
+            return self._get_model_list(self.repository.users, UserDetailResponse, conditions, cursor, limit, include)
+        return self._get_model_list(self.repository.users, UserResponse, conditions, cursor, limit)
 
-    @_mark_as_service_function(category="User")
+    @_mark_as_service_function(category="User", read_only=True)
     def get_user_by_id(self, id: int) -> UserResponse:
         return self._get_model_by_id(self.repository.users, User, UserResponse, id)
 
+    @_mark_as_service_function(category="User", read_only=True)
+    def get_user_version(self, id: int) -> Optional[ResourceVersion]:
+        return self._get_version(self.repository.users, [("id", "eq", id)])
+
     @_mark_as_service_function(category="User")
     def delete_user(self, id: int) -> None:
         return self._delete_model(self.repository.users, id)
@@ -191,27 +466,573 @@ class Service:
     def update_user(self, id: int, update: Union[UserUpdate, dict]) -> UserResponse:
         return self._update_model(self.repository.users, User, UserResponse, UserUpdate, id, update)
     
-    @_mark_as_service_function(category="User")
-    def get_user_by_username(self, username: str) -> list[UserResponse]:
+    @_mark_as_service_function(category="User", read_only=True)
+    def get_user_by_username(self, username: str) -> CursorPage[UserResponse]:
         conditions = []
         conditions.append(("username", "eq", username))
         return self._get_model_list(self.repository.users, UserResponse, conditions)
     
     @_mark_as_service_function(category="Auth")
     def login(self, user: Union[UserCreate, dict]) -> UserResponse:
-        result = self.repository.users.login(user)
+        user = UserCreate.model_validate(user)
+        result = self.repository.users.get_by_username(user.username)
         
-        if result==None:
+        if result==None or not verify_password(user.password, result.password):
             return None
-        else:
-            return to_response_model(UserResponse, result)
         
-    @_mark_as_service_function(category="Work")
-    def get_works_by_user_id(self, user_id: int) -> List[WorkResponse]:
+        if needs_rehash(result.password):
+            result.password = hash_password(user.password)
+            self.repository.commit()
+        return to_response_model(UserResponse, result)
+        
+    @_mark_as_service_function(category="Work", read_only=True)
+    def get_works_by_user_id(
+        self,
+        user_id: int,
+        cursor: Optional[str] = None,
+        limit: Optional[int] = None,
+        include: Optional[list[str]] = None,
+    ) -> CursorPage[WorkResponse]:
         conditions = []
         conditions.append(("user_id", "in", user_id if isinstance(user_id, list) else [user_id]))
-        return self._get_model_list(self.repository.works, WorkResponse, conditions)
+        if include:
+            return self._get_model_list(self.repository.works, WorkDetailResponse, conditions, cursor, limit, include)
+        return self._get_model_list(self.repository.works, WorkResponse, conditions, cursor, limit)
+
+    @_mark_as_service_function(category="Work", read_only=True)
+    def get_works_version(self, user_id: int) -> Optional[ResourceVersion]:
+        return self._get_version(self.repository.works, [("user_id", "eq", user_id)])
 
     @_mark_as_service_function(category="Work")
     def add_work(self, work: Union[WorkCreate, dict]):
-        return self._add_model(self.repository.works, Work, WorkResponse, work)
\ No newline at end of file
+        return self._add_model(self.repository.works, Work, WorkResponse, work)
+
+    @_mark_as_service_function(category="Work")
+    def add_works(self, works: list[Union[WorkCreate, dict]]) -> BatchResponse:
+        return self._add_models(self.repository.works, works)
+
+    @_mark_as_service_function(category="Work")
+    def update_works(self, updates: list[Union[WorkBatchUpdate, dict]]) -> BatchResponse:
+        return self._update_models(self.repository.works, updates)
+
+    @_mark_as_service_function(category="Work")
+    def get_work_ids_by_user_id(self, user_id: int, ids: list[int]) -> list[int]:
+        conditions = []
+        conditions.append(("user_id", "eq", user_id))
+        conditions.append(("id", "in", ids))
+        return self._get_model_ids(self.repository.works, conditions)
+
+    # Episode Service
+    @_mark_as_service_function(category="Episode")
+    def add_episodes(self, episodes: list[Union[EpisodeCreate, dict]]) -> BatchResponse:
+        return self._add_models(self.repository.episodes, episodes)
+
+    @_mark_as_service_function(category="Episode")
+    def update_episodes(self, updates: list[Union[EpisodeBatchUpdate, dict]]) -> BatchResponse:
+        return self._update_models(self.repository.episodes, updates)
+
+    @_mark_as_service_function(category="Episode")
+    def get_episode_ids_by_work_id(self, work_id: int, ids: list[int]) -> list[int]:
+        conditions = []
+        conditions.append(("work_id", "eq", work_id))
+        conditions.append(("id", "in", ids))
+        return self._get_model_ids(self.repository.episodes, conditions)
+
+    @_mark_as_service_function(category="Episode", read_only=True)
+    def get_episode_by_id(self, id: int) -> EpisodeResponse:
+        return self._get_model_by_id(self.repository.episodes, Episode, EpisodeResponse, id)
+
+    @_mark_as_service_function(category="Episode", read_only=True)
+    def get_episode_content_length(self, work_id: int, episode_id: int) -> Optional[int]:
+        return self.repository.episodes.get_content_length(work_id, episode_id)
+
+    # WatchHistory Service
+    @_mark_as_service_function(category="WatchHistory")
+    def upsert_watch_histories(self, rows: list[dict]) -> None:
+        return self._upsert_models(self.repository.watch_history, rows)
+
+    # Favorite Service
+    @_mark_as_service_function(category="Favorite")
+    def add_favorite(self, user_id: int, work_id: int) -> bool:
+        return self._add_counted("work_favorites", work_id, {"user_id": user_id, "work_id": work_id})
+
+    @_mark_as_service_function(category="Favorite")
+    def delete_favorite(self, user_id: int, work_id: int) -> bool:
+        return self._delete_counted("work_favorites", work_id, {"user_id": user_id, "work_id": work_id})
+
+    # Like Service
+    @_mark_as_service_function(category="Like")
+    def add_like(self, user_id: int, comment_id: int) -> bool:
+        return self._add_counted("comment_likes", comment_id, {"user_id": user_id, "comment_id": comment_id})
+
+    @_mark_as_service_function(category="Like")
+    def delete_like(self, user_id: int, comment_id: int) -> bool:
+        return self._delete_counted("comment_likes", comment_id, {"user_id": user_id, "comment_id": comment_id})
+
+    # Trending Service
+    @_mark_as_service_function(category="Trending")
+    def add_trending_scores(self, rows: list[dict]) -> None:
+        return self._upsert_models(self.repository.trending, rows)
+
+    @_mark_as_service_function(category="Trending", read_only=True)
+    def get_trending_works(self, limit: int) -> list[TrendingWork]:
+        return self._get_trending_works(limit)
+
+    @_mark_as_service_function(category="Trending")
+    def prune_trending(self) -> int:
+        return self._prune_trending(log_score(Config.TRENDING_MIN_SCORE, time.time()))
+
+    # Recommendation Service
+    @_mark_as_service_function(category="Recommendation", read_only=True)
+    def get_similar_works(self, work_id: int, limit: int) -> list[SimilarWork]:
+        return self._get_similar_works(work_id, limit)
+
+    @_mark_as_service_function(category="Recommendation")
+    def replace_similar_works(self, start_id: int, end_id: Optional[int], rows: list[dict]) -> None:
+        return self._replace_similar_works(start_id, end_id, rows)
+
+    # Counter Service
+    @_mark_as_service_function(category="Counter")
+    def apply_counter_deltas(self, deltas: dict[str, dict[int, int]]) -> None:
+        return self._apply_counter_deltas(deltas)
+
+    @_mark_as_service_function(category="Counter")
+    def reconcile_counters(self) -> dict[str, int]:
+        fixed = {}
+        for counter in COUNTED_REPOSITORIES:
+            fixed[counter] = 0
+            max_id = self.repository.counters.get_max_id(counter) or 0
+            # 잠금 시간을 줄이기 위해 id 구간별로 나눠서 커밋한다.
+            for start in range(1, max_id + 1, Config.COUNTER_RECONCILE_BATCH_SIZE):
+                fixed[counter] += self._reconcile_counter(counter, start, start + Config.COUNTER_RECONCILE_BATCH_SIZE)
+        return fixed
+
+    # Search Service
+    @_mark_as_service_function(category="Search", read_only=True)
+    def search(
+        self,
+        query: str,
+        kinds: Optional[list[str]] = None,
+        offset: int = 0,
+        limit: Optional[int] = None,
+    ) -> SearchPage:
+        kinds, offset, limit = _search_bounds(kinds, offset, limit)
+        rows = self.repository.search.search(query, kinds, limit + 1, offset)
+        return to_search_page(rows, limit, offset)
+
+
+class AsyncService(Service):
+    """The `AsyncRepository` counterpart of `Service`.
+
+    Only the common helpers (and service functions that post-process a repository
+    result themselves) are overridden. Service functions that just delegate to a
+    helper are inherited and return the helper's coroutine, which the caller awaits.
+
+    Hot lookups are read through `service_cache`, and the write helpers invalidate
+    the cache tags of the rows they touch.
+    New episodes, notices and comments are pushed to their subscribers through
+    `event_broker` once committed.
+    """
+
+    def __init__(self, repository: AsyncRepository):
+        self.repository = repository
+
+    async def _invalidate(self, db_model_class: type[Base], rows: list[Any]):
+        """Invalidate the cache tags of written rows, now and again after commit.
+
+        Invalidating before the commit keeps later reads in the same transaction
+        from seeing stale entries; invalidating after it drops entries that a
+        concurrent request cached from the pre-commit state. The post-commit
+        invalidation goes through `invalidation_bus`, which applies it on every worker.
+        """
+        names = ["id"] + foreign_key_columns(db_model_class)
+        ids = set()
+        tags = set()
+        for row in rows:
+            values = row if isinstance(row, dict) else {name: getattr(row, name) for name in names}
+            if values.get("id") is not None:
+                ids.add(values["id"])
+            tags |= invalidation_tags(db_model_class, values)
+        if not tags:
+            return
+        await service_cache.invalidate(tags)
+        # 커밋 뒤의 무효화는 다른 워커에도 전한다 (지연 무효화도 워커마다 한다).
+        self.repository.after_commit(lambda: invalidation_bus.publish(db_model_class.__tablename__, sorted(ids), tags))
+
+    def _publish_created(self, db_model_class: type[Base], rows: list[Any]):
+        """Push `<name>.created` events of new rows to their subscribers after commit.
+
+        Only the models in `PUBLISHED_MODELS` are published. The values are read now,
+        since the commit expires the rows.
+        """
+        if db_model_class not in PUBLISHED_MODELS:
+            return
+        names = ["id"] + PUBLISHED_MODELS[db_model_class][1]
+        values = [
+            {name: row.get(name) for name in names} if isinstance(row, dict) else {name: getattr(row, name) for name in names}
+            for row in rows
+        ]
+        self.repository.after_commit(lambda: event_broker.publish_created(db_model_class, values))
+
+    # Common
+    @async_session_exception_handler
+    async def _add_model(
+        self,
+        repository: BaseRepository,
+        db_model_class: type[Base],
+        response_model_class: type[BaseModel],
+        model: Union[BaseModel, dict],
+    ) -> BaseModel:
+        model = to_db_model(db_model_class, model)
+        repository.add(model)
+        await self.repository.flush()
+        await self._invalidate(db_model_class, [model])
+        self._publish_created(db_model_class, [model])
+        await self.repository.commit()
+        await self.repository.refresh(model)
+        return to_response_model(response_model_class, model)
+
+    @async_session_exception_handler
+    async def _add_models(
+        self,
+        repository: BaseRepository,
+        models: list[Union[BaseModel, dict]],
+    ) -> BatchResponse:
+        rows = [to_row(model) for model in models]
+        ids = await repository.add_many(rows)
+        rows = [{**row, "id": id} for row, id in zip(rows, ids)]
+        await self._invalidate(repository.model, rows)
+        self._publish_created(repository.model, rows)
+        await self.repository.commit()
+        return BatchResponse(ids=ids)
+
+    @async_session_exception_handler
+    async def _update_models(
+        self,
+        repository: BaseRepository,
+        model_updates: list[Union[BaseModel, dict]],
+    ) -> BatchResponse:
+        rows = [to_row(model_update, exclude_unset=True) for model_update in model_updates]
+        # 변경 전 외래 키 값으로 목록 캐시 태그를 구한다.
+        columns = [getattr(repository.model, name) for name in ["id"] + foreign_key_columns(repository.model)]
+        current = await repository.search([("id", "in", [row["id"] for row in rows])], columns=columns)
+        await repository.update_many(rows)
+        await self._invalidate(repository.model, current + rows)
+        await self.repository.commit()
+        return BatchResponse(ids=[row["id"] for row in rows])
+
+    @async_session_exception_handler
+    async def _upsert_models(self, repository: BaseRepository, rows: list[dict]) -> None:
+        await repository.upsert_many(rows)
+        await self.repository.commit()
+
+    @async_session_exception_handler
+    async def _add_counted(self, counter: str, counted_id: int, row: dict) -> bool:
+        counted, counting = self._counted_repositories(counter)
+        if await counted.get_by_id(counted_id, columns=[counted.model.id]) is None:
+            raise ValueError(f"{counted.model.__name__} with id {counted_id} not found")
+        # 같은 행을 동시에 추가해도 한 요청만 추가한 것으로 센다.
+        if not await counting.add_if_absent(row):
+            return False
+        # 증감은 커밋 후 counter_buffer 에 모았다가 일괄 반영한다.
+        self.repository.after_commit(lambda: counter_buffer.increment(counter, counted_id, 1))
+        await self.repository.commit()
+        return True
+
+    @async_session_exception_handler
+    async def _delete_counted(self, counter: str, counted_id: int, row: dict) -> bool:
+        _, counting = self._counted_repositories(counter)
+        deleted = await counting.delete_matching(row)
+        if not deleted:
+            return False
+        self.repository.after_commit(lambda: counter_buffer.increment(counter, counted_id, -deleted))
+        await self.repository.commit()
+        return True
+
+    @async_session_exception_handler
+    async def _apply_counter_deltas(self, deltas: dict[str, dict[int, int]]) -> None:
+        for counter, counter_deltas in deltas.items():
+            await self.repository.counters.apply_deltas(counter, counter_deltas)
+            counted, _ = self._counted_repositories(counter)
+            columns = [getattr(counted.model, name) for name in ["id"] + foreign_key_columns(counted.model)]
+            rows = await counted.search([("id", "in", list(counter_deltas))], columns=columns)
+            await self._invalidate(counted.model, rows)
+        await self.repository.commit()
+
+    @async_session_exception_handler
+    async def _reconcile_counter(self, counter: str, start_id: int, end_id: int) -> int:
+        fixed = await self.repository.counters.reconcile(counter, start_id, end_id)
+        await self.repository.commit()
+        return fixed
+
+    @async_session_exception_handler
+    async def _get_trending_works(self, limit: int) -> list[TrendingWork]:
+        projection = get_projection(Work, WorkResponse)
+        rows = await self.repository.trending.get_top(limit, projection.columns)
+        return to_trending_works(projection, rows, time.time())
+
+    @async_session_exception_handler
+    async def _prune_trending(self, min_score: float) -> int:
+        pruned = await self.repository.trending.prune(min_score)
+        await self.repository.commit()
+        return pruned
+
+    @async_session_exception_handler
+    async def _get_similar_works(self, work_id: int, limit: int) -> list[SimilarWork]:
+        projection = get_projection(Work, WorkResponse)
+        rows = await self.repository.similarities.get_similar(work_id, limit, projection.columns)
+        return to_similar_works(projection, rows)
+
+    @async_session_exception_handler
+    async def _replace_similar_works(self, start_id: int, end_id: Optional[int], rows: list[dict]) -> None:
+        await self.repository.similarities.replace(start_id, end_id, rows)
+        await self.repository.commit()
+
+    @async_session_exception_handler
+    async def _get_version(
+        self,
+        repository: BaseRepository,
+        conditions: list[tuple[str, str, Any]],
+    ) -> Optional[ResourceVersion]:
+        return to_resource_version(await repository.get_version(conditions))
+
+    @async_session_exception_handler
+    async def _get_model_ids(
+        self,
+        repository: BaseRepository,
+        conditions: list[tuple[str, str, Any]],
+    ) -> list[int]:
+        rows = await repository.search(conditions, columns=[repository.model.id])
+        return [row.id for row in rows]
+
+    @async_session_exception_handler
+    async def _get_model_list(
+        self,
+        repository: BaseRepository,
+        response_model_class: type[BaseModel],
+        conditions: list[tuple[str, str, Any]] = None,
+        cursor: Optional[str] = None,
+        limit: Optional[int] = None,
+        include: Optional[list[str]] = None,
+    ) -> CursorPage:
+        projection = get_projection(repository.model, response_model_class)
+        limit = clamp_page_size(limit)
+        after = decode_cursor(cursor) if cursor else None
+        # 포함할 관계는 요청 수와 무관하게 관계당 쿼리 하나 (또는 JOIN) 로 불러온다.
+        include_columns = projection.include_columns(include) if include else None
+        rows = (
+            await repository.search(conditions, limit=limit + 1, after=after, columns=projection.columns, include=include_columns)
+            if conditions
+            else await repository.get_all(limit=limit + 1, after=after, columns=projection.columns, include=include_columns)
+        )
+        return to_page(projection, rows, limit, include)
+
+    @async_session_exception_handler
+    async def _get_model_by_id(
+        self,
+        repository: BaseRepository,
+        db_model_class: type[Base],
+        response_model_class: type[BaseModel],
+        model_id: int,
+    ) -> BaseModel:
+        projection = get_projection(db_model_class, response_model_class)
+        row = await repository.get_by_id(model_id, columns=projection.columns)
+        if row is None:
+            raise ValueError(f"{db_model_class.__name__} with id {model_id} not found")
+        return projection.to_response(row)
+
+    @async_session_exception_handler
+    async def _delete_model(self, repository: BaseRepository, model_id: int):
+        model = await repository.get_by_id(model_id)
+        if model is None:
+            return
+        await self._invalidate(repository.model, [model])
+        await repository.delete(model)
+        await self.repository.commit()
+
+    @async_session_exception_handler
+    async def _update_model(
+        self,
+        repository: BaseRepository,
+        db_model_class: type[Base],
+        response_model_class: type[BaseModel],
+        update_model_class: type[BaseModel],
+        model_id: int,
+        model_update: Union[BaseModel, dict],
+    ) -> BaseModel:
+        model = await repository.get_by_id(model_id)
+        if model is None:
+            raise ValueError(f"{db_model_class.__name__} with id {model_id} not found")
+        # 외래 키가 바뀌면 이전 값의 캐시도 무효화해야 한다.
+        previous = {name: getattr(model, name) for name in ["id"] + foreign_key_columns(db_model_class)}
+
+        update_d = {}
+        src_model = to_response_model(response_model_class, model)
+        model_update = (
+            model_update.model_dump(exclude_unset=True)
+            if isinstance(model_update, BaseModel)
+            else dict(model_update)
+        )
+        # 비밀번호는 응답 모델에 없으므로 비교하지 않고, 해시로만 저장한다.
+        password = model_update.pop("password", None)
+        for key, value in model_update.items():
+            if (
+                getattr(src_model, key) != value
+                and update_model_class.model_fields[key].default != value
+            ):
+                update_d[key] = value
+        if password is not None:
+            update_d["password"] = await hash_password_async(password)
+
+        repository.update(model, **update_d)
+        await self._invalidate(db_model_class, [previous, model])
+        await self.repository.commit()
+        await self.repository.refresh(model)
+        return to_response_model(response_model_class, model)
+
+    async def add_user(self, user: Union[UserCreate, dict]) -> UserResponse:
+        user = to_row(user)
+        user = {**user, "password": await hash_password_async(user["password"])}
+        return await self._add_model(self.repository.users, User, UserResponse, user)
+
+    async def login(self, user: Union[UserCreate, dict]) -> UserResponse:
+        user = UserCreate.model_validate(user)
+        result = await self.repository.users.get_by_username(user.username)
+
+        if not await verify_password_async(user.password, result.password if result else None):
+            return None
+
+        if needs_rehash(result.password):
+            # 평문(레거시) 또는 반복 횟수가 바뀐 해시는 로그인 시 다시 저장한다.
+            result.password = await hash_password_async(user.password)
+            await self.repository.commit()
+        return to_response_model(UserResponse, result)
+
+    async def _get_or_load(self, tag: str, suffix: str, response_type: Any, loader) -> Any:
+        """`service_cache.get_or_load`, bypassed once this session has written.
+
+        Its reads may then see its own uncommitted rows, which must not be stored (no
+        invalidation follows a rollback), and cached values may predate its writes.
+        """
+        if has_written(self.repository.db_session):
+            return await loader()
+        return await service_cache.get_or_load(tag, suffix, response_type, loader)
+
+    def _can_batch(self) -> bool:
+        """Whether reads may go through the batch loaders.
+
+        They read in a session of their own, so only callers that could read from a
+        replica (see `routing.route`) and have not written in their own session use them.
+        """
+        return (
+            Config.LOADER_ENABLED
+            and read_from_replica.get()
+            and not has_written(self.repository.db_session)
+        )
+
+    async def _load_user_by_id(self, id: int) -> UserResponse:
+        if not self._can_batch():
+            return await Service.get_user_by_id(self, id)
+        user = await user_loader.load(id)
+        if user is None:
+            raise ValueError(f"User with id {id} not found")
+        return user
+
+    async def _load_works_by_user_id(self, user_id: int, cursor: Optional[str], limit: Optional[int]) -> CursorPage[WorkResponse]:
+        # 첫 페이지 (작가 페이지) 만 묶어서 조회한다.
+        if cursor or not self._can_batch():
+            return await Service.get_works_by_user_id(self, user_id, cursor, limit)
+        return await first_work_page_loader.load((user_id, clamp_page_size(limit)))
+
+    async def get_user_by_id(self, id: int) -> UserResponse:
+        return await self._get_or_load(
+            entity_tag(User, id),
+            "UserResponse",
+            UserResponse,
+            lambda: self._load_user_by_id(id),
+        )
+
+    async def add_favorite(self, user_id: int, work_id: int) -> bool:
+        added = await Service.add_favorite(self, user_id, work_id)
+        # 선호 취소는 인기 점수에서 빼지 않는다 (점수는 최근 활동량이다).
+        if added:
+            await trending_buffer.record(work_id, Config.TRENDING_FAVORITE_WEIGHT)
+        return added
+
+    async def get_user_version(self, id: int) -> Optional[ResourceVersion]:
+        return await self._get_or_load(
+            entity_tag(User, id),
+            "ResourceVersion",
+            ResourceVersion,
+            lambda: Service.get_user_version(self, id),
+        )
+
+    async def get_works_version(self, user_id: int) -> Optional[ResourceVersion]:
+        return await self._get_or_load(
+            list_tag(Work, "user_id", user_id),
+            "ResourceVersion",
+            ResourceVersion,
+            lambda: Service.get_works_version(self, user_id),
+        )
+
+    async def get_works_by_user_id(
+        self,
+        user_id: int,
+        cursor: Optional[str] = None,
+        limit: Optional[int] = None,
+        include: Optional[list[str]] = None,
+    ) -> CursorPage[WorkResponse]:
+        # 포함한 관계의 변경은 목록 캐시 태그로 무효화되지 않으므로 캐시하지 않는다.
+        if isinstance(user_id, list) or include:
+            return await Service.get_works_by_user_id(self, user_id, cursor, limit, include)
+        return await self._get_or_load(
+            list_tag(Work, "user_id", user_id),
+            f"WorkResponse:{cursor}:{clamp_page_size(limit)}",
+            CursorPage[WorkResponse],
+            lambda: self._load_works_by_user_id(user_id, cursor, limit),
+        )
+
+    async def iter_episode_content(
+        self,
+        episode_id: int,
+        start: int,
+        end: int,
+        chunk_size: Optional[int] = None,
+    ):
+        """Yield bytes `start..end` (inclusive) of an episode's content, one chunk per query.
+
+        The session is closed after every chunk, so a slow client never holds a
+        pooled connection and only one chunk is kept in memory at a time.
+        """
+        chunk_size = chunk_size or Config.EPISODE_CHUNK_SIZE
+        offset = start
+        while offset <= end:
+            size = min(chunk_size, end - offset + 1)
+            chunk = await self.repository.episodes.get_content_chunk(episode_id, offset, size)
+            await self.repository.close()
+            if not chunk:
+                break
+            yield chunk
+            offset += len(chunk)
+
+    async def reconcile_counters(self) -> dict[str, int]:
+        fixed = {}
+        for counter in COUNTED_REPOSITORIES:
+            fixed[counter] = 0
+            max_id = await self.repository.counters.get_max_id(counter) or 0
+            for start in range(1, max_id + 1, Config.COUNTER_RECONCILE_BATCH_SIZE):
+                # 모든 워커에 쌓인 증감을 먼저 반영해야 재계산한 값에 두 번 더해지지 않는다.
+                await invalidation_bus.flush_all(Config.COUNTER_RECONCILE_FLUSH_TIMEOUT)
+                fixed[counter] += await self._reconcile_counter(counter, start, start + Config.COUNTER_RECONCILE_BATCH_SIZE)
+        return fixed
+
+    async def search(
+        self,
+        query: str,
+        kinds: Optional[list[str]] = None,
+        offset: int = 0,
+        limit: Optional[int] = None,
+    ) -> SearchPage:
+        kinds, offset, limit = _search_bounds(kinds, offset, limit)
+        rows = await self.repository.search.search(query, kinds, limit + 1, offset)
+        return to_search_page(rows, limit, offset)
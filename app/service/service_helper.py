@@ -1,14 +1,39 @@
+import inspect
+import time
+from collections import defaultdict
+from contextlib import asynccontextmanager
+from contextvars import ContextVar
 from functools import wraps
+from typing import Optional
 
 from core.config import Config
+from core.metrics import record_phase, service_function_duration
 from db.models import *
+from fastapi import Request
+
 from repositories import (
+    AsyncRepository,
+    AsyncSessionLocal,
     Repository,
     SessionLocal,
+    UnitOfWork,
+    get_async_session,
     get_session,
+    has_replicas,
 )
+from repositories.query_log import current_service_function
+from repositories.routing import has_written, read_from_replica
 from schemas.models import *
-from service.service import Service, service_dict
+from service.cache import recent_writes
+from service.invalidation import invalidation_bus
+from service.service import AsyncService, Service, read_only_service_functions, service_dict
+
+async_service_dict = defaultdict(dict)
+
+# 현재 요청의 UnitOfWork (unit_of_work 의존성이 설정한다)
+_current_unit_of_work: ContextVar[Optional[UnitOfWork]] = ContextVar("unit_of_work", default=None)
+# 현재 요청의 클라이언트가 최근에 썼는지 (그렇다면 읽기 전용 함수도 primary 에서 읽는다)
+_wrote_recently: ContextVar[bool] = ContextVar("wrote_recently", default=False)
 
 
 def _create_service(db_session) -> Service:
@@ -17,7 +42,18 @@ def _create_service(db_session) -> Service:
     return Service(repo)
 
 
-def _inject_service_dependency(func):
+def _create_async_service(db_session) -> AsyncService:
+    repo = AsyncRepository(db_session)
+
+    return AsyncService(repo)
+
+
+def _record_service_time(name: str, elapsed: float) -> None:
+    record_phase("service", elapsed)
+    service_function_duration.observe(elapsed, name)
+
+
+def _inject_service_dependency(func, name, read_only=False):
     @wraps(func)
     def wrapper(*args, **kwargs):
         session_gen = get_session(SessionLocal)
@@ -26,18 +62,116 @@ def _inject_service_dependency(func):
         service = _create_service(
             db_session
         )
+        # 느린 쿼리 로그에 호출한 서비스 함수를 남긴다.
+        caller = current_service_function.set(name)
+        replica = read_from_replica.set(read_only)
+        started = time.perf_counter()
         try:
             return func(service, *args, **kwargs)
         finally:
             session_gen.close()
+            _record_service_time(name, time.perf_counter() - started)
+            read_from_replica.reset(replica)
+            current_service_function.reset(caller)
 
     return wrapper
 
 
+async def unit_of_work(request: Request):
+    """FastAPI dependency that scopes one session and one transaction to a request.
+
+    While it is active, every `async_service_dict` call made by the request reuses
+    its UnitOfWork instead of opening a session of its own. The transaction is
+    committed after the endpoint returns and rolled back if it raises.
+
+    With read replicas, a request that writes marks its client (its access token) in
+    `recent_writes` (on every worker, see `invalidation_bus.record_write`), and the
+    client's requests read from the primary for the next `Config.DB_REPLICA_LAG` seconds.
+    """
+    client = request.headers.get("authorization") if has_replicas() else None
+    wrote_recently = _wrote_recently.set(client is not None and await recent_writes.contains(client))
+
+    session_gen = get_async_session(AsyncSessionLocal)
+    db_session = await session_gen.__anext__()
+    uow = UnitOfWork(db_session)
+    token = _current_unit_of_work.set(uow)
+    try:
+        yield uow
+        await uow.complete()
+        if client is not None and has_written(db_session):
+            await invalidation_bus.record_write(client)
+    except Exception:
+        await uow.rollback()
+        raise
+    finally:
+        _current_unit_of_work.reset(token)
+        _wrote_recently.reset(wrote_recently)
+        await session_gen.aclose()
+
+
+@asynccontextmanager
+async def service_scope():
+    """Provide an AsyncService with a session of its own.
+
+    For work that outlives the request's unit of work, such as the body of a
+    streamed response, which is sent after the dependency has closed its session.
+    """
+    session_gen = get_async_session(AsyncSessionLocal)
+    db_session = await session_gen.__anext__()
+    try:
+        yield _create_async_service(db_session)
+    finally:
+        await session_gen.aclose()
+
+
+def _inject_async_service_dependency(func, name, read_only=False):
+    @wraps(func)
+    async def wrapper(*args, **kwargs):
+        caller = current_service_function.set(name)
+        replica = read_from_replica.set(read_only and not _wrote_recently.get())
+        started = time.perf_counter()
+        try:
+            return await _call_async_service(func, *args, **kwargs)
+        finally:
+            _record_service_time(name, time.perf_counter() - started)
+            read_from_replica.reset(replica)
+            current_service_function.reset(caller)
+
+    return wrapper
+
+
+async def _call_async_service(func, *args, **kwargs):
+    uow = _current_unit_of_work.get()
+    if uow is not None:
+        result = func(AsyncService(uow), *args, **kwargs)
+        if inspect.isawaitable(result):
+            result = await result
+        return result
+
+    session_gen = get_async_session(AsyncSessionLocal)
+    db_session = await session_gen.__anext__()
+
+    service = _create_async_service(
+        db_session
+    )
+    try:
+        result = func(service, *args, **kwargs)
+        # 공통 헬퍼에 위임하는 서비스 함수는 코루틴을 그대로 반환한다.
+        if inspect.isawaitable(result):
+            result = await result
+        return result
+    finally:
+        await session_gen.aclose()
+
+
 for category, services in service_dict.items():
     for service_name, service in services.items():
+        name = f"{category}.{service_name}"
+        read_only = name in read_only_service_functions
         service_func = getattr(Service, service_name)
-        service_dict[category][service_name] = _inject_service_dependency(service_func)
+        service_dict[category][service_name] = _inject_service_dependency(service_func, name, read_only)
+        async_service_func = getattr(AsyncService, service_name)
+        async_service_dict[category][service_name] = _inject_async_service_dependency(async_service_func, name, read_only)
 
 
-__all__ = ["service_dict"]
\ No newline at end of file
+__all__ = ["service_dict", "async_service_dict", "service_scope", "unit_of_work"]
@@ -0,0 +1,282 @@
+import asyncio
+import logging
+import os
+import struct
+import threading
+from typing import Callable, List, Optional, Tuple
+
+from core.config import Config
+
+logger = logging.getLogger(__name__)
+
+# 받은 메시지를 (채널, 본문) 으로 넘기는 콜백
+Deliver = Callable[[str, bytes], None]
+# 메시지를 놓쳤을 수 있을 때 (재연결 후) 부르는 콜백
+Resync = Optional[Callable[[], None]]
+
+# 소켓 허브의 프레임 헤더 (채널 길이, 본문 길이)
+_FRAME = struct.Struct("!HI")
+
+
+async def _close(writer: asyncio.StreamWriter) -> None:
+    # 닫힘을 기다리지 않으면 Python 3.9 는 끊긴 연결의 예외를 "never retrieved" 로 남긴다.
+    writer.close()
+    try:
+        await writer.wait_closed()
+    except (ConnectionError, OSError):
+        pass
+
+
+def _deliver_safely(deliver: Deliver, channel: str, message: bytes) -> None:
+    # 받는 쪽의 오류로 수신 루프가 멈추지 않게 한다.
+    try:
+        deliver(channel, message)
+    except Exception:
+        logger.exception("Failed to handle a message on %s", channel)
+
+
+class EventTransport:
+    """Carries published messages to every worker, the publishing one included.
+
+    A receiver registers a `deliver` callback with `start` and gets every message
+    published on the transport (by any worker sharing it) as `(channel, message)`.
+    Delivery is at most once: messages published while a worker is disconnected
+    are lost, so receivers must tolerate gaps. Transports that connect to a broker
+    call `resync` whenever they (re)connect, since messages may have been missed.
+    """
+
+    async def start(self, deliver: Deliver, resync: Resync = None) -> None:
+        raise NotImplementedError
+
+    async def stop(self, deliver: Deliver) -> None:
+        raise NotImplementedError
+
+    async def publish(self, channel: str, message: bytes) -> None:
+        raise NotImplementedError
+
+
+class LocalTransport(EventTransport):
+    """Delivers messages to the receivers started on the same instance.
+
+    With a single worker every receiver has one of its own. Several receivers
+    started on one instance stand in for workers sharing a message broker (tests).
+    """
+
+    def __init__(self):
+        self._receivers: List[Deliver] = []
+
+    async def start(self, deliver: Deliver, resync: Resync = None) -> None:
+        self._receivers.append(deliver)
+
+    async def stop(self, deliver: Deliver) -> None:
+        if deliver in self._receivers:
+            self._receivers.remove(deliver)
+
+    async def publish(self, channel: str, message: bytes) -> None:
+        for deliver in list(self._receivers):
+            deliver(channel, message)
+
+
+class RedisTransport(EventTransport):
+    """Publishes through Redis pub/sub, so every worker of every container receives
+    every message (requires the optional `redis` package).
+
+    Args:
+        url (str): The Redis URL.
+        prefix (str): Prepended to the channels, so several transports can share a Redis.
+    """
+
+    # 연결이 끊기면 이만큼 기다렸다가 다시 구독한다 (초)
+    RECONNECT_DELAY = 1.0
+
+    def __init__(self, url: str, prefix: str):
+        try:
+            import redis.asyncio as redis
+        except ImportError as e:
+            raise RuntimeError("A redis transport requires the 'redis' package.") from e
+        self._client = redis.from_url(url)
+        self.prefix = prefix
+        self._task: Optional[asyncio.Task] = None
+
+    async def _listen(self, deliver: Deliver, resync: Resync) -> None:
+        while True:
+            pubsub = self._client.pubsub()
+            try:
+                await pubsub.psubscribe(f"{self.prefix}*")
+                if resync is not None:
+                    resync()
+                async for message in pubsub.listen():
+                    if message["type"] != "pmessage":
+                        continue
+                    channel = message["channel"]
+                    channel = channel.decode() if isinstance(channel, bytes) else channel
+                    _deliver_safely(deliver, channel[len(self.prefix):], message["data"])
+            except asyncio.CancelledError:
+                raise
+            except Exception:
+                logger.exception("Lost the Redis subscription to %s*, reconnecting", self.prefix)
+                await asyncio.sleep(self.RECONNECT_DELAY)
+            finally:
+                await pubsub.reset()
+
+    async def start(self, deliver: Deliver, resync: Resync = None) -> None:
+        if self._task is None:
+            self._task = asyncio.create_task(self._listen(deliver, resync))
+
+    async def stop(self, deliver: Deliver) -> None:
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+
+    async def publish(self, channel: str, message: bytes) -> None:
+        await self._client.publish(self.prefix + channel, message)
+
+
+def _frame(channel: str, message: bytes) -> bytes:
+    channel = channel.encode()
+    return _FRAME.pack(len(channel), len(message)) + channel + message
+
+
+async def _read_frame(reader: asyncio.StreamReader) -> Tuple[str, bytes]:
+    channel_size, message_size = _FRAME.unpack(await reader.readexactly(_FRAME.size))
+    body = await reader.readexactly(channel_size + message_size)
+    return body[:channel_size].decode(), body[channel_size:]
+
+
+class SocketHub:
+    """Relays every message a client sends to every connected client over a Unix socket.
+
+    The stand-in for a message broker when all workers run on one host: the
+    multi-worker launcher (`python app.py` with `API_WORKERS` > 1) runs it in a
+    thread and the workers connect with `SocketTransport`. A client that stops
+    reading is disconnected once `MAX_BUFFER` bytes are waiting for it.
+
+    Args:
+        path (str): The path of the Unix socket (replaced if it exists).
+    """
+
+    MAX_BUFFER = 16 * 1024 * 1024
+
+    def __init__(self, path: str):
+        self.path = path
+        self._clients: set = set()
+
+    async def _relay(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        self._clients.add(writer)
+        # 빈 프레임으로 등록이 끝났음을 알린다 (이후 발행되는 메시지는 모두 받는다).
+        writer.write(_frame("", b""))
+        try:
+            while True:
+                frame = _frame(*await _read_frame(reader))
+                for client in list(self._clients):
+                    if client.transport.get_write_buffer_size() > self.MAX_BUFFER:
+                        logger.warning("Disconnecting a worker that stopped reading from the event hub")
+                        self._clients.discard(client)
+                        client.close()
+                        continue
+                    client.write(frame)
+        except (asyncio.IncompleteReadError, ConnectionError):
+            pass
+        finally:
+            self._clients.discard(writer)
+            await _close(writer)
+
+    async def serve(self) -> None:
+        if os.path.exists(self.path):
+            os.unlink(self.path)
+        server = await asyncio.start_unix_server(self._relay, path=self.path)
+        async with server:
+            await server.serve_forever()
+
+    def start_in_thread(self) -> threading.Thread:
+        """Serve in a daemon thread with its own event loop."""
+        thread = threading.Thread(target=lambda: asyncio.run(self.serve()), name="socket-hub", daemon=True)
+        thread.start()
+        return thread
+
+
+class SocketTransport(EventTransport):
+    """Publishes through a `SocketHub`, so every worker on the host receives every message.
+
+    Args:
+        path (str): The hub's Unix socket.
+        prefix (str): Prepended to the channels, so several transports can share a hub.
+    """
+
+    RECONNECT_DELAY = 0.5
+    # start 가 첫 연결을 기다리는 최대 시간 (초)
+    CONNECT_TIMEOUT = 5.0
+
+    def __init__(self, path: str, prefix: str):
+        self.path = path
+        self.prefix = prefix
+        self._writer: Optional[asyncio.StreamWriter] = None
+        self._task: Optional[asyncio.Task] = None
+        self._lock: Optional[asyncio.Lock] = None
+
+    async def _listen(self, deliver: Deliver, resync: Resync, connected: asyncio.Event) -> None:
+        while True:
+            try:
+                reader, writer = await asyncio.open_unix_connection(self.path)
+            except OSError:
+                await asyncio.sleep(self.RECONNECT_DELAY)
+                continue
+            try:
+                await _read_frame(reader)
+                self._writer = writer
+                connected.set()
+                if resync is not None:
+                    resync()
+                while True:
+                    channel, message = await _read_frame(reader)
+                    if channel.startswith(self.prefix):
+                        _deliver_safely(deliver, channel[len(self.prefix):], message)
+            except (asyncio.IncompleteReadError, ConnectionError):
+                logger.warning("Lost the connection to the event hub at %s, reconnecting", self.path)
+            finally:
+                self._writer = None
+                await _close(writer)
+            await asyncio.sleep(self.RECONNECT_DELAY)
+
+    async def start(self, deliver: Deliver, resync: Resync = None) -> None:
+        if self._task is not None:
+            return
+        self._lock = asyncio.Lock()
+        connected = asyncio.Event()
+        self._task = asyncio.create_task(self._listen(deliver, resync, connected))
+        try:
+            await asyncio.wait_for(connected.wait(), self.CONNECT_TIMEOUT)
+        except asyncio.TimeoutError:
+            logger.warning("The event hub at %s is not up yet, still connecting", self.path)
+
+    async def stop(self, deliver: Deliver) -> None:
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+
+    async def publish(self, channel: str, message: bytes) -> None:
+        if self._writer is None:
+            raise ConnectionError(f"Not connected to the event hub at {self.path}")
+        async with self._lock:
+            self._writer.write(_frame(self.prefix + channel, message))
+            await self._writer.drain()
+
+
+def create_event_transport(prefix: str) -> EventTransport:
+    """Create the transport selected by `Config.EVENTS_TRANSPORT` for channels under `prefix`."""
+    if Config.EVENTS_TRANSPORT == "local":
+        return LocalTransport()
+    elif Config.EVENTS_TRANSPORT == "socket":
+        return SocketTransport(Config.EVENTS_SOCKET_PATH, prefix)
+    elif Config.EVENTS_TRANSPORT == "redis":
+        return RedisTransport(Config.EVENTS_REDIS_URL, prefix)
+    else:
+        raise ValueError(f"Unsupported EVENTS_TRANSPORT '{Config.EVENTS_TRANSPORT}'.")
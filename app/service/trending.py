@@ -0,0 +1,164 @@
+import asyncio
+import logging
+import math
+import time
+from datetime import datetime
+from typing import Optional
+
+from pytz import timezone
+
+from core.config import Config
+from repositories.routing import read_from_replica
+from schemas.models import TrendingPage
+from service.write_behind import WriteBehindBuffer
+
+logger = logging.getLogger(__name__)
+
+# 점수를 환산하는 기준 시각 (2025-01-01 00:00 UTC, UNIX 시각)
+EPOCH = 1735689600.0
+
+
+def _decay_rate() -> float:
+    return math.log(2) / Config.TRENDING_HALF_LIFE
+
+
+def log_score(weight: float, at: float) -> float:
+    """Return the stored (log-space) score of an event of `weight` at UNIX time `at`.
+
+    A work's trending score at time t is the sum of its events' weights, each halved
+    every `Config.TRENDING_HALF_LIFE` seconds since the event:
+
+        score(t) = sum(w_i * 2 ** -((t - t_i) / half_life))
+
+    Every score decays at the same rate, so the order of the works does not change
+    while no events arrive. The scores are therefore stored as of a fixed `EPOCH`,
+    `sum(w_i * 2 ** ((t_i - EPOCH) / half_life))`, which never has to be rewritten,
+    and in log space, where they grow linearly with time instead of overflowing.
+    """
+    return math.log(weight) + (at - EPOCH) * _decay_rate()
+
+
+def decayed_score(score: float, at: float) -> float:
+    """Return the trending score at UNIX time `at` of a stored (log-space) `score`."""
+    return math.exp(score - (at - EPOCH) * _decay_rate())
+
+
+def log_add(a: float, b: float) -> float:
+    """Return `ln(e^a + e^b)`, i.e. the sum of two log-space scores."""
+    if a < b:
+        a, b = b, a
+    return a + math.log1p(math.exp(b - a))
+
+
+class TrendingBuffer(WriteBehindBuffer):
+    """Coalesces trending events (episode views, new favorites) per work.
+
+    The log-space scores of a work's events are summed in memory and added to the
+    ranking table by multi-row upserts (see `WriteBehindBuffer` for the flush
+    triggers and the memory bound).
+    """
+
+    name = "trending"
+
+    def __init__(
+        self,
+        flush_size: int = Config.TRENDING_FLUSH_SIZE,
+        flush_interval: float = Config.TRENDING_FLUSH_INTERVAL,
+        max_pending: int = Config.TRENDING_MAX_PENDING,
+    ):
+        super().__init__(flush_size, flush_interval, max_pending)
+
+    def _combine(self, current: float, value: float) -> float:
+        return log_add(current, value)
+
+    async def _write(self, pending: dict) -> None:
+        from service.service_helper import service_scope
+
+        rows = [{"work_id": work_id, "score": score} for work_id, score in pending.items()]
+        async with service_scope() as service:
+            await service.add_trending_scores(rows)
+
+    async def record(self, work_id: int, weight: float, at: Optional[float] = None) -> None:
+        """Buffer an event of `weight` on `work_id` (at UNIX time `at`, default now)."""
+        await self.add(work_id, log_score(weight, at if at is not None else time.time()))
+
+
+class TrendingFeed:
+    """The top works by trending score, held in memory by every worker.
+
+    `get` serves slices of the last snapshot without touching the database. The
+    snapshot (with the scores decayed to the time it was taken) is reloaded from
+    the ranking table every `interval` seconds, and works whose score has decayed
+    below `Config.TRENDING_MIN_SCORE` are deleted from the table every
+    `prune_interval` seconds.
+    """
+
+    def __init__(
+        self,
+        size: int = Config.TRENDING_TOP_K,
+        interval: float = Config.TRENDING_REFRESH_INTERVAL,
+        prune_interval: float = Config.TRENDING_PRUNE_INTERVAL,
+    ):
+        self.size = size
+        self.interval = interval
+        self.prune_interval = prune_interval
+        self._snapshot: Optional[TrendingPage] = None
+        self._pruned_at: Optional[float] = None
+        self._task: Optional[asyncio.Task] = None
+
+    async def refresh(self) -> TrendingPage:
+        """Reload the snapshot from the ranking table."""
+        from service.service_helper import service_scope
+
+        # 랭킹은 몇 초 늦어도 되므로 복제본에서 읽는다.
+        token = read_from_replica.set(True)
+        try:
+            async with service_scope() as service:
+                items = await service.get_trending_works(self.size)
+        finally:
+            read_from_replica.reset(token)
+        self._snapshot = TrendingPage.model_construct(
+            items=items,
+            computed_at=datetime.now(timezone('Asia/Seoul')),
+        )
+        return self._snapshot
+
+    async def prune(self) -> int:
+        from service.service_helper import service_scope
+
+        async with service_scope() as service:
+            return await service.prune_trending()
+
+    async def get(self, limit: int) -> TrendingPage:
+        """Return the first `limit` works of the snapshot (loading it on first use)."""
+        snapshot = self._snapshot or await self.refresh()
+        return TrendingPage.model_construct(items=snapshot.items[:limit], computed_at=snapshot.computed_at)
+
+    async def _run(self):
+        while True:
+            try:
+                if self.prune_interval and (self._pruned_at is None or time.monotonic() - self._pruned_at >= self.prune_interval):
+                    self._pruned_at = time.monotonic()
+                    await self.prune()
+                await self.refresh()
+            except Exception:
+                logger.exception("Trending refresh failed")
+            await asyncio.sleep(self.interval)
+
+    def start(self) -> None:
+        """Start the periodic refresh (call from the application's lifespan)."""
+        if self._task is None:
+            self._task = asyncio.create_task(self._run())
+
+    async def stop(self) -> None:
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+
+
+trending_buffer = TrendingBuffer()
+trending_feed = TrendingFeed()
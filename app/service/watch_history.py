@@ -0,0 +1,46 @@
+from datetime import datetime
+from typing import Optional
+
+from pytz import timezone
+
+from core.config import Config
+from service.service_helper import service_scope
+from service.write_behind import WriteBehindBuffer
+
+
+class WatchHistoryBuffer(WriteBehindBuffer):
+    """Write-behind buffer for watch history events.
+
+    Events are kept per (user_id, work_id), keeping only the latest `watched_at`,
+    and written with multi-row upserts (see `WriteBehindBuffer` for the flush
+    triggers and the memory bound).
+    """
+
+    name = "watch history"
+
+    def __init__(
+        self,
+        flush_size: int = Config.WATCH_HISTORY_FLUSH_SIZE,
+        flush_interval: float = Config.WATCH_HISTORY_FLUSH_INTERVAL,
+        max_pending: int = Config.WATCH_HISTORY_MAX_PENDING,
+    ):
+        super().__init__(flush_size, flush_interval, max_pending)
+
+    def _combine(self, current: datetime, value: datetime) -> datetime:
+        return max(current, value)
+
+    async def _write(self, pending: dict) -> None:
+        rows = [
+            {"user_id": user_id, "work_id": work_id, "watched_at": watched_at}
+            for (user_id, work_id), watched_at in pending.items()
+        ]
+        # 요청의 UnitOfWork 와 무관한 별도 세션/트랜잭션으로 쓴다.
+        async with service_scope() as service:
+            await service.upsert_watch_histories(rows)
+
+    async def record(self, user_id: int, work_id: int, watched_at: Optional[datetime] = None) -> None:
+        """Buffer a view of `work_id` by `user_id`."""
+        await self.add((user_id, work_id), watched_at or datetime.now(timezone('Asia/Seoul')))
+
+
+watch_history_buffer = WatchHistoryBuffer()
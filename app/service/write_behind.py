@@ -0,0 +1,113 @@
+import asyncio
+import contextvars
+import logging
+from typing import Any, Hashable, Optional
+
+logger = logging.getLogger(__name__)
+
+
+class WriteBehindBuffer:
+    """Coalesce writes in memory and apply them in batches.
+
+    Values added under the same key are combined with `_combine`, and the pending
+    keys are handed to `_write` when `flush_size` keys are pending, every
+    `flush_interval` seconds, and on `stop`.
+
+    At most `max_pending` keys are held. An `add` that finds the buffer full waits
+    for a flush; if the flush cannot make room (e.g. the database is down), the
+    value is dropped and counted in `dropped`.
+
+    Subclasses implement `_combine` and `_write`.
+    """
+
+    name = "write-behind"
+
+    def __init__(self, flush_size: int, flush_interval: float, max_pending: int):
+        self.flush_size = flush_size
+        self.flush_interval = flush_interval
+        self.max_pending = max_pending
+        self.dropped = 0
+        self._pending: dict[Hashable, Any] = {}
+        self._lock: Optional[asyncio.Lock] = None
+        self._flush_tasks: set[asyncio.Task] = set()
+        self._loop_task: Optional[asyncio.Task] = None
+
+    def __len__(self) -> int:
+        return len(self._pending)
+
+    @property
+    def _flush_lock(self) -> asyncio.Lock:
+        # 이벤트 루프 안에서 만든다 (Python 3.9 의 Lock 은 만들 때의 루프에 묶인다).
+        if self._lock is None:
+            self._lock = asyncio.Lock()
+        return self._lock
+
+    def _combine(self, current: Any, value: Any) -> Any:
+        raise NotImplementedError
+
+    async def _write(self, pending: dict) -> None:
+        raise NotImplementedError
+
+    def _merge(self, key: Hashable, value: Any) -> bool:
+        if key in self._pending:
+            self._pending[key] = self._combine(self._pending[key], value)
+            return True
+        if len(self._pending) >= self.max_pending:
+            return False
+        self._pending[key] = value
+        return True
+
+    async def add(self, key: Hashable, value: Any) -> None:
+        """Buffer `value` under `key`."""
+        if key not in self._pending and len(self._pending) >= self.max_pending:
+            await self.flush()
+        if not self._merge(key, value):
+            self.dropped += 1
+            logger.warning("%s buffer is full, dropped %s", self.name, key)
+            return
+
+        if len(self._pending) >= self.flush_size and not self._flush_lock.locked():
+            # 요청은 기다리지 않고, 쓰기는 백그라운드에서 (요청의 컨텍스트 없이) 진행한다.
+            task = contextvars.Context().run(asyncio.create_task, self.flush())
+            self._flush_tasks.add(task)
+            task.add_done_callback(self._flush_tasks.discard)
+
+    async def flush(self) -> int:
+        """Write every pending key and return the number of keys written."""
+        async with self._flush_lock:
+            if not self._pending:
+                return 0
+            pending, self._pending = self._pending, {}
+            try:
+                await self._write(pending)
+            except Exception:
+                logger.exception("Failed to flush %d %s entries", len(pending), self.name)
+                # 다음 flush 때 다시 시도한다 (상한을 넘는 만큼은 버린다).
+                for key, value in pending.items():
+                    if not self._merge(key, value):
+                        self.dropped += 1
+                return 0
+            return len(pending)
+
+    async def _run(self):
+        while True:
+            await asyncio.sleep(self.flush_interval)
+            await self.flush()
+
+    def start(self) -> None:
+        """Start the periodic flush (call from the application's lifespan)."""
+        if self._loop_task is None:
+            self._loop_task = asyncio.create_task(self._run())
+
+    async def stop(self) -> None:
+        """Stop the periodic flush and write what is still pending."""
+        if self._loop_task is not None:
+            self._loop_task.cancel()
+            try:
+                await self._loop_task
+            except asyncio.CancelledError:
+                pass
+            self._loop_task = None
+        if self._flush_tasks:
+            await asyncio.gather(*self._flush_tasks, return_exceptions=True)
+        await self.flush()
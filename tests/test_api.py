@@ -0,0 +1,59 @@
+import secrets
+
+
+def test_users_pages_and_login(api):
+    prefix = f"api-{secrets.token_hex(3)}"
+
+    async def scenario(client):
+        for i in range(5):
+            response = await client.post("/api/v1/users/users", json={"username": f"{prefix}-{i}", "password": "pw"})
+            assert response.status_code == 200
+
+        seen = []
+        response = await client.get("/api/v1/users/", params={"limit": 2})
+        while True:
+            assert response.status_code == 200
+            page = response.json()
+            assert len(page["items"]) <= 2
+            seen += [item["username"] for item in page["items"]]
+            if not page["next_cursor"]:
+                break
+            response = await client.get("/api/v1/users/", params={"limit": 2, "cursor": page["next_cursor"]})
+        assert len(seen) == len(set(seen))
+        assert {f"{prefix}-{i}" for i in range(5)} <= set(seen)
+
+        assert (await client.get("/api/v1/users/", params={"cursor": "zzz"})).status_code == 400
+
+        response = await client.post("/api/v1/auth/login", json={"username": f"{prefix}-0", "password": "pw"})
+        assert response.status_code == 200 and response.headers["authorization"].startswith("Bearer ")
+        response = await client.post("/api/v1/auth/login", json={"username": f"{prefix}-0", "password": "wrong"})
+        assert response.status_code == 401
+
+    api(scenario)
+
+
+def test_works_of_user(api):
+    username = f"api-{secrets.token_hex(3)}"
+
+    async def scenario(client):
+        user = (await client.post("/api/v1/users/users", json={"username": username, "password": "pw"})).json()
+        login = await client.post("/api/v1/auth/login", json={"username": username, "password": "pw"})
+        headers = {"Authorization": login.headers["authorization"]}
+
+        response = await client.post(
+            "/api/v1/works/batch",
+            json=[{"title": f"work {i}", "description": "d", "user_id": user["id"]} for i in range(3)],
+            headers=headers,
+        )
+        assert response.status_code == 200, response.text
+
+        response = await client.get(f"/api/v1/works/{user['id']}", params={"limit": 2})
+        assert response.status_code == 200
+        page = response.json()
+        assert len(page["items"]) == 2 and page["next_cursor"]
+        response = await client.get(f"/api/v1/works/{user['id']}", params={"limit": 2, "cursor": page["next_cursor"]})
+        last_page = response.json()
+        titles = [item["title"] for item in page["items"] + last_page["items"]]
+        assert sorted(titles) == ["work 0", "work 1", "work 2"] and last_page["next_cursor"] is None
+
+    api(scenario)
@@ -0,0 +1,75 @@
+from types import SimpleNamespace
+
+import pytest
+
+from db.models import Work
+from repositories import base
+from repositories.base import BaseRepository
+
+
+class MySQLSession:
+    """Answers INSERTs like MySQL without RETURNING: `lastrowid` is the first id of the statement."""
+
+    def __init__(self, increment, lock_mode):
+        self.increment = increment
+        self.lock_mode = lock_mode
+        self.next_id = 100
+        self.inserts = 0
+
+    def get_bind(self):
+        dialect = SimpleNamespace(name="mysql", insert_returning=False)
+        return SimpleNamespace(dialect=dialect, url=f"mysql://test/{self.increment}-{self.lock_mode}")
+
+    def execute(self, statement, parameters=None):
+        if statement is base._AUTOINCREMENT_SETTINGS:
+            return SimpleNamespace(one=lambda: (self.increment, self.lock_mode))
+        self.inserts += 1
+        first = self.next_id
+        rows = len(statement._multi_values[0]) if statement._multi_values else 1
+        # 다른 세션의 INSERT 가 끼어든 것처럼 문장 사이에 id 를 건너뛴다.
+        self.next_id += rows * self.increment + 7
+        return SimpleNamespace(lastrowid=first)
+
+
+ROWS = [{"user_id": 1, "title": str(i), "description": "d"} for i in range(3)]
+
+
+@pytest.mark.parametrize(
+    "increment, lock_mode, ids, inserts",
+    [
+        (1, 1, [100, 101, 102], 1),
+        (2, 1, [100, 102, 104], 1),
+        # interleaved 모드에서는 id 가 연속이라는 보장이 없어 한 행씩 넣는다.
+        (1, 2, [100, 108, 116], 3),
+        (3, 2, [100, 110, 120], 3),
+    ],
+)
+def test_add_many_ids_without_returning(increment, lock_mode, ids, inserts):
+    db_session = MySQLSession(increment, lock_mode)
+    assert BaseRepository(db_session, Work).add_many(ROWS) == ids
+    assert db_session.inserts == inserts
+
+
+def test_batch_endpoints(api, sign_up):
+    async def scenario(client):
+        user, headers = await sign_up(client)
+        response = await client.post(
+            "/api/v1/works/batch", json=[{"title": f"w{i}", "description": "d"} for i in range(3)], headers=headers
+        )
+        ids = response.json()["ids"]
+        assert len(set(ids)) == 3
+
+        response = await client.patch(
+            "/api/v1/works/batch", json=[{"id": ids[0], "title": "renamed"}], headers=headers
+        )
+        assert response.status_code == 200 and response.json()["ids"] == [ids[0]]
+        page = (await client.get(f"/api/v1/works/{user['id']}")).json()
+        assert {work["id"]: work["title"] for work in page["items"]} == {ids[0]: "renamed", ids[1]: "w1", ids[2]: "w2"}
+
+        _, other_headers = await sign_up(client)
+        response = await client.patch(
+            "/api/v1/works/batch", json=[{"id": ids[1], "title": "stolen"}], headers=other_headers
+        )
+        assert response.status_code == 404
+
+    api(scenario)
@@ -0,0 +1,78 @@
+import asyncio
+import secrets
+
+from repositories import AsyncSessionLocal, Repository, SessionLocal, UnitOfWork, dispose_engines
+from service.service_helper import _current_unit_of_work, async_service_dict
+
+
+def _add_user() -> int:
+    with SessionLocal() as db_session:
+        repo = Repository(db_session)
+        user_id = repo.users.add_many([{"username": f"cache-{secrets.token_hex(4)}", "password": "pw"}])[0]
+        repo.commit()
+    return user_id
+
+
+def _run(main):
+    async def run():
+        try:
+            await main()
+        finally:
+            await dispose_engines()
+
+    asyncio.run(run())
+
+
+def test_writes_invalidate_cached_reads(database):
+    user_id = _add_user()
+    get_works = async_service_dict.get('Work').get("get_works_by_user_id")
+    add_works = async_service_dict.get('Work').get("add_works")
+
+    async def main():
+        assert (await get_works(user_id)).items == []
+        await add_works([{"user_id": user_id, "title": "w", "description": "d"}])
+        assert [work.title for work in (await get_works(user_id)).items] == ["w"]
+
+    _run(main)
+
+
+def test_uncommitted_reads_are_not_cached(database):
+    user_id = _add_user()
+    get_works = async_service_dict.get('Work').get("get_works_by_user_id")
+    add_works = async_service_dict.get('Work').get("add_works")
+
+    async def main():
+        assert (await get_works(user_id)).items == []
+        async with AsyncSessionLocal() as db_session:
+            uow = UnitOfWork(db_session)
+            token = _current_unit_of_work.set(uow)
+            try:
+                await add_works([{"user_id": user_id, "title": "w", "description": "d"}])
+                # 같은 트랜잭션에서는 자기 쓰기가 보인다.
+                assert len((await get_works(user_id)).items) == 1
+                await uow.rollback()
+            finally:
+                _current_unit_of_work.reset(token)
+        # 롤백된 행이 캐시에 남아 있으면 안 된다.
+        assert (await get_works(user_id)).items == []
+
+    _run(main)
+
+
+def test_update_publishes_one_invalidation(database, monkeypatch):
+    from service.invalidation import invalidation_bus
+
+    user_id = _add_user()
+    update_user = async_service_dict.get('User').get("update_user")
+    published = []
+
+    async def record(table, ids, tags):
+        published.append((table, ids))
+
+    monkeypatch.setattr(invalidation_bus, "publish", record)
+
+    async def main():
+        await update_user(user_id, {"password": "new"})
+
+    _run(main)
+    assert published == [("users", [user_id])]
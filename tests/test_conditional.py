@@ -0,0 +1,89 @@
+from datetime import datetime, timedelta
+
+from sqlalchemy import select
+
+from core.utils.conditional import format_http_date, is_not_modified, make_etag, parse_http_date
+from db.models import Work, _now
+from repositories import SessionLocal
+
+# DB 시각은 서울 시각이다 (UTC 03:00:00).
+MODIFIED = datetime(2025, 3, 1, 12, 0, 0, 500000)
+
+
+def test_make_etag():
+    etag = make_etag("v1", "cursor", 20)
+    assert etag.startswith('W/"') and etag.endswith('"')
+    assert make_etag("v1", "cursor", 20) == etag
+    assert make_etag("v2", "cursor", 20) != etag
+    assert make_etag("v1", "cursor", 10) != etag
+
+
+def test_http_dates():
+    assert format_http_date(MODIFIED) == "Sat, 01 Mar 2025 03:00:00 GMT"
+    assert parse_http_date(format_http_date(MODIFIED)).isoformat() == "2025-03-01T03:00:00+00:00"
+    assert parse_http_date("not a date") is None
+    assert parse_http_date(None) is None
+
+
+def test_if_none_match():
+    etag = make_etag("v1")
+    assert is_not_modified(etag, None, etag, None)
+    # 약한 비교: W/ 접두사는 무시한다.
+    assert is_not_modified(etag, None, etag[2:], None)
+    assert is_not_modified(etag, None, f'"other", {etag}', None)
+    assert is_not_modified(etag, None, "*", None)
+    assert not is_not_modified(etag, None, '"other"', None)
+
+
+def test_if_modified_since():
+    etag = make_etag("v1")
+    assert is_not_modified(etag, MODIFIED, None, "Sat, 01 Mar 2025 03:00:00 GMT")
+    assert is_not_modified(etag, MODIFIED, None, "Sat, 01 Mar 2025 04:00:00 GMT")
+    assert not is_not_modified(etag, MODIFIED, None, "Sat, 01 Mar 2025 02:59:59 GMT")
+    assert not is_not_modified(etag, None, None, "Sat, 01 Mar 2025 03:00:00 GMT")
+    assert not is_not_modified(etag, MODIFIED, None, "garbage")
+    # If-None-Match 가 있으면 If-Modified-Since 는 보지 않는다.
+    assert not is_not_modified(etag, MODIFIED, '"other"', "Sat, 01 Mar 2025 04:00:00 GMT")
+
+
+def test_conditional_get_of_works(api, sign_up):
+    async def scenario(client):
+        user, headers = await sign_up(client)
+        await client.post(
+            "/api/v1/works/batch", json=[{"title": f"w{i}", "description": "d", "user_id": user["id"]} for i in range(3)], headers=headers
+        )
+        url = f"/api/v1/works/{user['id']}"
+
+        response = await client.get(url, params={"limit": 2})
+        etag = response.headers["etag"]
+        assert "last-modified" not in response.headers
+
+        response = await client.get(url, params={"limit": 2}, headers={"If-None-Match": etag})
+        assert response.status_code == 304 and response.content == b""
+        # 다른 페이지는 다른 ETag 를 갖는다.
+        assert (await client.get(url, params={"limit": 3}, headers={"If-None-Match": etag})).status_code == 200
+
+        await client.post("/api/v1/works/batch", json=[{"title": "new", "description": "d", "user_id": user["id"]}], headers=headers)
+        response = await client.get(url, params={"limit": 2}, headers={"If-None-Match": etag})
+        assert response.status_code == 200 and response.headers["etag"] != etag
+
+    api(scenario)
+
+
+def test_works_are_not_validated_by_if_modified_since(api, sign_up):
+    async def scenario(client):
+        user, headers = await sign_up(client)
+        url = f"/api/v1/works/{user['id']}"
+        before = _now().replace(tzinfo=None)
+        await client.post("/api/v1/works/batch", json=[{"title": "w", "description": "d"}], headers=headers)
+        with SessionLocal() as db_session:
+            created_at = db_session.scalar(select(Work.created_at).where(Work.user_id == user["id"]))
+        # 생성 시각은 모듈을 불러온 시각이 아니라 행을 넣은 시각이다.
+        assert created_at >= before
+
+        # 삭제나 같은 초의 추가는 Last-Modified 를 바꾸지 않으므로, 목록은 If-Modified-Since 만으로 304 를 내지 않는다.
+        since = format_http_date(datetime.now() + timedelta(days=1))
+        response = await client.get(url, headers={"If-Modified-Since": since})
+        assert response.status_code == 200 and [work["title"] for work in response.json()["items"]] == ["w"]
+
+    api(scenario)
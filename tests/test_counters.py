@@ -0,0 +1,107 @@
+import asyncio
+
+from sqlalchemy import update
+
+from db.models import Work
+from repositories import SessionLocal
+from service.cache import MemoryCacheBackend, RecentWrites, ServiceCache
+from service.counters import counter_buffer
+from service.invalidation import InvalidationBus
+from service.transport import LocalTransport
+
+
+def test_reconcile_requires_the_internal_token(api, internal_headers):
+    async def scenario(client):
+        assert (await client.post("/api/v1/internal/counters/reconcile")).status_code == 401
+        response = await client.post("/api/v1/internal/counters/reconcile", headers={"X-Internal-Token": "wrong"})
+        assert response.status_code == 401
+        response = await client.post("/api/v1/internal/counters/reconcile", headers=internal_headers)
+        assert response.status_code == 200 and set(response.json()) == {"work_favorites", "comment_likes"}
+
+    api(scenario)
+
+
+def test_reconcile_fixes_drift_without_double_counting(api, internal_headers, sign_up):
+    async def favorite_count(client, user_id):
+        page = (await client.get(f"/api/v1/works/{user_id}")).json()
+        return page["items"][0]["favorite_count"]
+
+    async def scenario(client):
+        user, headers = await sign_up(client)
+        work_id = (await client.post(
+            "/api/v1/works/batch", json=[{"title": "w", "description": "d", "user_id": user["id"]}], headers=headers
+        )).json()["ids"][0]
+        assert (await client.post(f"/api/v1/works/{work_id}/favorite", headers=headers)).status_code == 200
+        # 증감은 아직 버퍼에 있다.
+        assert counter_buffer._pending[("work_favorites", work_id)] == 1
+
+        # 재계산 전에 버퍼를 비우므로, 선호 행 수에 증감이 한 번 더 더해지지 않는다.
+        await client.post("/api/v1/internal/counters/reconcile", headers=internal_headers)
+        assert len(counter_buffer) == 0
+        assert await favorite_count(client, user["id"]) == 1
+
+        with SessionLocal() as db_session:
+            db_session.execute(update(Work).where(Work.id == work_id).values(favorite_count=10))
+            db_session.commit()
+        response = await client.post("/api/v1/internal/counters/reconcile", headers=internal_headers)
+        assert response.json()["work_favorites"] == 1
+        assert await favorite_count(client, user["id"]) == 1
+
+    api(scenario)
+
+
+def test_concurrent_favorites_are_counted_once(api, sign_up):
+    async def scenario(client):
+        user, headers = await sign_up(client)
+        work_id = (await client.post(
+            "/api/v1/works/batch", json=[{"title": "w", "description": "d"}], headers=headers
+        )).json()["ids"][0]
+        # 같은 선호를 동시에 보내도 500 없이 한 번만 세고, 삭제도 한 번만 뺀다.
+        for method, pending in ((client.post, 1), (client.delete, 0)):
+            responses = await asyncio.gather(
+                *[method(f"/api/v1/works/{work_id}/favorite", headers=headers) for _ in range(5)]
+            )
+            assert all(response.status_code == 200 for response in responses)
+            assert counter_buffer._pending.get(("work_favorites", work_id), 0) == pending
+
+    api(scenario)
+
+
+def _bus(transport, flushed):
+    bus = InvalidationBus(
+        transport,
+        ServiceCache(MemoryCacheBackend(10), 60),
+        RecentWrites(MemoryCacheBackend(10), 5),
+    )
+
+    async def flush():
+        flushed.append(bus.origin)
+
+    bus.add_flush_handler(flush)
+    return bus
+
+
+def test_flush_all_waits_for_every_worker():
+    async def main():
+        transport = LocalTransport()
+        flushed = []
+        a, b, c = _bus(transport, flushed), _bus(transport, flushed), _bus(transport, flushed)
+        for bus in (a, b, c):
+            await bus.start()
+        await asyncio.sleep(0.01)
+        assert a.peers == {b.origin, c.origin}
+
+        assert await a.flush_all(1) == 2
+        assert sorted(flushed) == sorted([a.origin, b.origin, c.origin])
+
+        # 작별 인사 없이 멈춘 워커는 기다리다가 잊는다.
+        await transport.stop(c._deliver)
+        flushed.clear()
+        assert await a.flush_all(0.05) == 1
+        assert sorted(flushed) == sorted([a.origin, b.origin]) and a.peers == {b.origin}
+
+        await b.stop()
+        await asyncio.sleep(0.01)
+        assert a.peers == set() and await a.flush_all(1) == 0
+
+    asyncio.run(main())
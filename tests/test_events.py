@@ -0,0 +1,115 @@
+import asyncio
+import time
+
+import pytest
+
+from db.models import Comment, Episode
+from service.events import EventBroker, SlowSubscriberError, SubscriberLimitError, episode_topic, work_topic
+from service.transport import LocalTransport
+
+
+def _broker(queue_size=10, max_subscribers=10):
+    return EventBroker(LocalTransport(), queue_size, max_subscribers)
+
+
+def test_events_reach_the_subscribers_of_their_topic():
+    async def main():
+        broker = _broker()
+        await broker.start()
+        works = broker.subscribe([work_topic(1)])
+        episodes = broker.subscribe([episode_topic(7)])
+
+        await broker.publish_created(Episode, [{"id": 7, "work_id": 1}])
+        await broker.publish_created(Comment, [{"id": 3, "episode_id": 7, "notice_id": None}])
+
+        assert await works.get(0.1) == b'{"type":"episode.created","id":7,"work_id":1}'
+        assert await works.get(0.01) is None
+        assert await episodes.get(0.1) == b'{"type":"comment.created","id":3,"episode_id":7}'
+
+    asyncio.run(main())
+
+
+def test_slow_subscriber_is_dropped_after_its_queue():
+    async def main():
+        broker = _broker(queue_size=2)
+        await broker.start()
+        slow = broker.subscribe([work_topic(1)])
+        other = broker.subscribe([work_topic(1)])
+        for i in range(2):
+            await broker.publish(work_topic(1), b"%d" % i)
+        assert await other.get(0.1) == b"0"
+
+        # 가득 찬 구독자만 끊기고, 다른 구독자는 계속 받는다.
+        await broker.publish(work_topic(1), b"2")
+        assert slow.overflowed and broker.dropped == 1 and len(broker) == 1
+        assert [await other.get(0.1), await other.get(0.1)] == [b"1", b"2"]
+
+        # 끊긴 구독자는 쌓인 이벤트를 다 읽은 뒤에 알게 된다.
+        assert [await slow.get(0.1), await slow.get(0.1)] == [b"0", b"1"]
+        with pytest.raises(SlowSubscriberError):
+            await slow.get(0.1)
+        broker.unsubscribe(slow)
+        assert len(broker) == 1
+
+    asyncio.run(main())
+
+
+def test_subscriber_limit():
+    async def main():
+        broker = _broker(max_subscribers=2)
+        first = broker.subscribe([work_topic(1)])
+        broker.subscribe([work_topic(2), episode_topic(3)])
+        with pytest.raises(SubscriberLimitError):
+            broker.subscribe([work_topic(1)])
+
+        broker.unsubscribe(first)
+        broker.unsubscribe(first)
+        assert len(broker) == 1
+        broker.subscribe([work_topic(1)])
+
+    asyncio.run(main())
+
+
+def _work_with_episode(api, sign_up):
+    async def scenario(client):
+        _, headers = await sign_up(client)
+        work_ids = (await client.post(
+            "/api/v1/works/batch", json=[{"title": f"w{i}", "description": "d"} for i in range(2)], headers=headers
+        )).json()["ids"]
+        episode_id = (await client.post(
+            f"/api/v1/works/{work_ids[0]}/episodes/batch", json=[{"title": "e"}], headers=headers
+        )).json()["ids"][0]
+        # 다른 작품의 경로로는 회차를 구독할 수 없다.
+        response = await client.get(f"/api/v1/works/{work_ids[1]}/episodes/{episode_id}/events")
+        assert response.status_code == 404
+        return work_ids, episode_id
+
+    return api(scenario)
+
+
+def test_episode_events_check_the_work(api, sign_up):
+    from starlette.testclient import TestClient
+    from starlette.websockets import WebSocketDisconnect
+
+    from app import app
+    from repositories import dispose_engines
+    from service.events import event_broker
+
+    work_ids, episode_id = _work_with_episode(api, sign_up)
+    try:
+        client = TestClient(app)
+        with pytest.raises(WebSocketDisconnect) as closed:
+            with client.websocket_connect(f"/api/v1/works/{work_ids[1]}/episodes/{episode_id}/events/ws"):
+                pass
+        assert closed.value.code == 1008
+
+        with client.websocket_connect(f"/api/v1/works/{work_ids[0]}/episodes/{episode_id}/events/ws"):
+            assert len(event_broker) == 1
+        # 연결이 끊기면 구독도 정리된다.
+        for _ in range(100):
+            if len(event_broker) == 0:
+                break
+            time.sleep(0.01)
+        assert len(event_broker) == 0
+    finally:
+        asyncio.run(dispose_engines())
@@ -0,0 +1,81 @@
+import secrets
+
+import pytest
+
+from core.utils.http_range import parse_range
+
+
+@pytest.mark.parametrize(
+    "header, expected",
+    [
+        ("bytes=0-99", (0, 99)),
+        ("bytes=100-", (100, 999)),
+        ("bytes=-100", (900, 999)),
+        ("bytes=-5000", (0, 999)),
+        ("bytes=990-5000", (990, 999)),
+        ("Bytes = 5-5", (5, 5)),
+    ],
+)
+def test_parse_range(header, expected):
+    assert parse_range(header, 1000) == expected
+
+
+@pytest.mark.parametrize(
+    "header",
+    [
+        None,
+        "",
+        "items=0-1",
+        "bytes=0-1,5-6",
+        # 형식이 틀린 범위는 무시하고 전체를 보낸다 (RFC 9110 14.2).
+        "bytes=-",
+        "bytes=abc",
+        "bytes=5-1",
+        "bytes=1-2-3",
+        "bytes=١-٢",
+    ],
+)
+def test_parse_range_serves_whole_body(header):
+    assert parse_range(header, 1000) is None
+
+
+@pytest.mark.parametrize("header, total", [("bytes=1000-", 1000), ("bytes=-0", 1000), ("bytes=-10", 0)])
+def test_parse_range_unsatisfiable(header, total):
+    with pytest.raises(ValueError):
+        parse_range(header, total)
+
+
+def test_episode_content_ranges(api):
+    username = f"range-{secrets.token_hex(3)}"
+    content = "가나다라마바사" * 100
+
+    async def scenario(client):
+        user = (await client.post("/api/v1/users/users", json={"username": username, "password": "pw"})).json()
+        login = await client.post("/api/v1/auth/login", json={"username": username, "password": "pw"})
+        headers = {"Authorization": login.headers["authorization"]}
+        work_id = (await client.post(
+            "/api/v1/works/batch", json=[{"title": "w", "description": "d", "user_id": user["id"]}], headers=headers
+        )).json()["ids"][0]
+        episode_id = (await client.post(
+            f"/api/v1/works/{work_id}/episodes/batch", json=[{"title": "e", "content": content}], headers=headers
+        )).json()["ids"][0]
+        url = f"/api/v1/works/{work_id}/episodes/{episode_id}/content"
+        body = content.encode()
+
+        response = await client.get(url)
+        assert response.status_code == 200 and response.content == body
+
+        response = await client.get(url, headers={"Range": "bytes=3-8"})
+        assert response.status_code == 206 and response.content == body[3:9]
+        assert response.headers["content-range"] == f"bytes 3-8/{len(body)}"
+
+        response = await client.get(url, headers={"Range": "bytes=-4"})
+        assert response.status_code == 206 and response.content == body[-4:]
+
+        response = await client.get(url, headers={"Range": "bytes=9-3"})
+        assert response.status_code == 200 and response.content == body
+
+        response = await client.get(url, headers={"Range": f"bytes={len(body)}-"})
+        assert response.status_code == 416 and response.headers["content-range"] == f"bytes */{len(body)}"
+
+    api(scenario)
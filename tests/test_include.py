@@ -0,0 +1,36 @@
+from core.config import Config
+
+
+def test_include_loads_the_latest_episodes_per_work(api, sign_up, monkeypatch):
+    monkeypatch.setattr(Config, "INCLUDE_COLLECTION_LIMIT", 3)
+
+    async def scenario(client):
+        user, headers = await sign_up(client)
+        work_ids = (await client.post(
+            "/api/v1/works/batch", json=[{"title": f"w{i}", "description": "d"} for i in range(3)], headers=headers
+        )).json()["ids"]
+        episode_ids = {}
+        for work_id, count in zip(work_ids, (5, 2, 0)):
+            if count:
+                episode_ids[work_id] = (await client.post(
+                    f"/api/v1/works/{work_id}/episodes/batch", json=[{"title": f"e{i}"} for i in range(count)], headers=headers
+                )).json()["ids"]
+
+        url = f"/api/v1/works/{user['id']}"
+        response = await client.get(url, params={"include": ["episodes", "user"]})
+        assert response.status_code == 200 and "etag" not in response.headers
+        works = {work["id"]: work for work in response.json()["items"]}
+        # 부모마다 최신 INCLUDE_COLLECTION_LIMIT 개만, 최신 순으로 읽는다.
+        assert [episode["id"] for episode in works[work_ids[0]]["episodes"]] == episode_ids[work_ids[0]][::-1][:3]
+        assert [episode["id"] for episode in works[work_ids[1]]["episodes"]] == episode_ids[work_ids[1]][::-1]
+        assert works[work_ids[2]]["episodes"] == []
+        assert all(work["user"]["id"] == user["id"] for work in works.values())
+
+        # 요청하지 않은 관계는 채우지 않는다.
+        works = (await client.get(url, params={"include": "user"})).json()["items"]
+        assert all(work["episodes"] is None and work["user"]["username"] == user["username"] for work in works)
+
+        response = await client.get(url, params={"include": "comments"})
+        assert response.status_code == 400
+
+    api(scenario)
@@ -0,0 +1,21 @@
+from core.config import Config
+
+
+def test_internal_api_is_disabled_without_a_token(api, internal_headers, monkeypatch):
+    monkeypatch.setattr(Config, "INTERNAL_API_TOKEN", "")
+
+    async def scenario(client):
+        for headers in ({}, {"X-Internal-Token": ""}, internal_headers):
+            assert (await client.get("/api/v1/internal/pool", headers=headers)).status_code == 403
+
+    api(scenario)
+
+
+def test_pool_statistics(api, internal_headers):
+    async def scenario(client):
+        await client.get("/api/v1/users/", params={"limit": 1})
+        response = await client.get("/api/v1/internal/pool", headers=internal_headers)
+        assert response.status_code == 200
+        assert "async" in response.json()
+
+    api(scenario)
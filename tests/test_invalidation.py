@@ -0,0 +1,128 @@
+import asyncio
+
+from service.cache import MemoryCacheBackend, RecentWrites, ServiceCache
+from service.invalidation import InvalidationBus
+from service.transport import LocalTransport, SocketHub, SocketTransport
+
+
+class SharedBackend(MemoryCacheBackend):
+    shared = True
+
+
+def _bus(transport, backend=None):
+    backend = backend or MemoryCacheBackend(100)
+    return InvalidationBus(transport, ServiceCache(backend, 60), RecentWrites(backend, 5))
+
+
+def _counting_loader(loads):
+    async def load():
+        loads.append(1)
+        return len(loads)
+
+    return load
+
+
+def test_changes_invalidate_every_workers_cache():
+    async def main():
+        transport = LocalTransport()
+        a, b = _bus(transport), _bus(transport)
+        await a.start()
+        await b.start()
+        loads = []
+        load = _counting_loader(loads)
+
+        assert await b.cache.get_or_load("works:1", "", int, load) == 1
+        assert await b.cache.get_or_load("works:1", "", int, load) == 1
+
+        await a.publish("works", [1], ["works:1"])
+        await asyncio.sleep(0.01)
+        assert b.received == 1
+        assert await b.cache.get_or_load("works:1", "", int, load) == 2
+
+    asyncio.run(main())
+
+
+def test_listeners_see_every_change():
+    async def main():
+        transport = LocalTransport()
+        a, b = _bus(transport), _bus(transport)
+        seen = []
+
+        async def listener(change):
+            seen.append((change.table, change.ids))
+
+        b.add_listener(listener)
+        await a.start()
+        await b.start()
+        await a.publish("episodes", [3, 4], ["episodes:3", "episodes:4"])
+        await b.publish("works", [1], ["works:1"])
+        await asyncio.sleep(0.01)
+        assert sorted(seen) == [("episodes", [3, 4]), ("works", [1])]
+
+    asyncio.run(main())
+
+
+def test_resync_clears_the_local_cache():
+    async def main():
+        bus = _bus(LocalTransport())
+        loads = []
+        load = _counting_loader(loads)
+        await bus.cache.get_or_load("users:1", "", int, load)
+
+        # 재연결하면 놓친 변경이 있을 수 있으므로 비운다.
+        bus._resync()
+        assert await bus.cache.get_or_load("users:1", "", int, load) == 2
+
+    asyncio.run(main())
+
+
+def test_shared_backend_is_invalidated_once():
+    async def main():
+        transport = LocalTransport()
+        backend = SharedBackend(100, stores_objects=False)
+        a, b = _bus(transport, backend), _bus(transport, backend)
+        await a.start()
+        await b.start()
+        versions = []
+        original = backend.set
+
+        async def record(key, value, ttl):
+            if key.startswith("v:"):
+                versions.append(key)
+            await original(key, value, ttl)
+
+        backend.set = record
+        await a.publish("works", [1], ["works:1"])
+        await asyncio.sleep(0.01)
+        assert versions == ["v:works:1"]
+
+    asyncio.run(main())
+
+
+def test_socket_hub_relays_between_workers(tmp_path):
+    path = str(tmp_path / "events.sock")
+    SocketHub(path).start_in_thread()
+
+    async def main():
+        a, b = _bus(SocketTransport(path, "invalidate:")), _bus(SocketTransport(path, "invalidate:"))
+        await a.start()
+        await b.start()
+        try:
+            for _ in range(100):
+                if a.peers and b.peers:
+                    break
+                await asyncio.sleep(0.01)
+            assert a.peers == {b.origin} and b.peers == {a.origin}
+
+            await a.publish("works", [1], ["works:1"])
+            for _ in range(100):
+                if b.received:
+                    break
+                await asyncio.sleep(0.01)
+            assert b.received == 1 and a.received == 0
+            assert await a.flush_all(1) == 1
+        finally:
+            await a.stop()
+            await b.stop()
+
+    asyncio.run(main())
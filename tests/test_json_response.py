@@ -0,0 +1,48 @@
+import json
+from datetime import datetime
+
+from fastapi.encoders import jsonable_encoder
+
+from core.utils import json_response
+from core.utils.json_response import FastJSONResponse, ModelJSONResponse, dump_json
+from schemas.models import CursorPage, TrendingWork, WorkResponse
+
+WORKS = [
+    WorkResponse(id=1, title="첫 작품", favorite_count=3, created_at=datetime(2025, 3, 1, 12, 0, 0, 500000)),
+    WorkResponse(id=2, title='"quoted"', created_at=datetime(2025, 3, 2)),
+]
+
+
+def _validated(response_model, content) -> bytes:
+    # FastAPI 의 기본 경로: response_model 로 다시 검증하고 jsonable_encoder 를 거친다.
+    value = response_model.model_validate(content, from_attributes=True)
+    return FastJSONResponse(jsonable_encoder(value)).body
+
+
+def test_fast_path_matches_the_validated_path():
+    page = CursorPage[WorkResponse].model_construct(items=WORKS, next_cursor="abc")
+    trending = TrendingWork.model_construct(work=WORKS[0], score=1.5)
+    for response_model, content in ((CursorPage[WorkResponse], page), (TrendingWork, trending)):
+        assert json.loads(ModelJSONResponse(content).body) == json.loads(_validated(response_model, content))
+
+    assert json.loads(dump_json(WORKS)) == [json.loads(dump_json(work)) for work in WORKS]
+    assert json.loads(dump_json([])) == [] and json.loads(dump_json({"a": 1})) == {"a": 1}
+
+
+def test_without_orjson(monkeypatch):
+    monkeypatch.setattr(json_response, "orjson", None)
+    content = {"title": "첫 작품", "ids": [1, 2]}
+    assert json.loads(dump_json(content)) == content
+    assert json.loads(FastJSONResponse(content).body) == content
+
+
+def test_endpoints_return_the_response_model(api, sign_up):
+    async def scenario(client):
+        user, headers = await sign_up(client)
+        await client.post("/api/v1/works/batch", json=[{"title": "첫 작품", "description": "d"}], headers=headers)
+        response = await client.get(f"/api/v1/works/{user['id']}")
+        assert response.headers["content-type"] == "application/json"
+        page = response.json()
+        assert CursorPage[WorkResponse].model_validate(page).model_dump(mode="json") == page
+
+    api(scenario)
@@ -0,0 +1,94 @@
+import asyncio
+
+import pytest
+from sqlalchemy import event
+
+from repositories import get_async_engine
+from service.loader import BatchLoader, user_loader
+
+
+def _loader(calls, **kwargs):
+    async def batch_load(keys):
+        calls.append(list(keys))
+        await asyncio.sleep(0)
+        return {key: key * 10 for key in keys if key != 0}
+
+    return BatchLoader(batch_load, **kwargs)
+
+
+def test_concurrent_loads_share_one_batch():
+    async def main():
+        calls = []
+        loader = _loader(calls, delay=0.01, max_batch_size=100)
+        values = await asyncio.gather(*(loader.load(key) for key in [1, 2, 2, 3, 0]))
+        assert values == [10, 20, 20, 30, None]
+        assert calls == [[1, 2, 3, 0]]
+
+        # 끝난 키는 다시 조회한다 (결과를 캐시하지 않는다).
+        assert await loader.load(1) == 10
+        assert calls[-1] == [1]
+
+    asyncio.run(main())
+
+
+def test_max_batch_size_dispatches_at_once():
+    async def main():
+        calls = []
+        loader = _loader(calls, delay=60, max_batch_size=2)
+        values = await asyncio.wait_for(asyncio.gather(*(loader.load(key) for key in [1, 2, 3, 4])), 1)
+        assert values == [10, 20, 30, 40]
+        assert calls == [[1, 2], [3, 4]]
+
+    asyncio.run(main())
+
+
+def test_batch_errors_reach_every_caller():
+    async def main():
+        async def batch_load(keys):
+            raise RuntimeError("database is down")
+
+        loader = BatchLoader(batch_load, delay=0.01, max_batch_size=100)
+        results = await asyncio.gather(loader.load(1), loader.load(2), return_exceptions=True)
+        assert all(isinstance(result, RuntimeError) for result in results)
+
+    asyncio.run(main())
+
+
+def test_cancelled_caller_does_not_cancel_the_others():
+    async def main():
+        calls = []
+        loader = _loader(calls, delay=0.01, max_batch_size=100)
+        first = asyncio.ensure_future(loader.load(1))
+        second = asyncio.ensure_future(loader.load(1))
+        await asyncio.sleep(0)
+        first.cancel()
+        assert await second == 10
+        with pytest.raises(asyncio.CancelledError):
+            await first
+
+    asyncio.run(main())
+
+
+def test_concurrent_user_requests_share_one_query(api, sign_up, monkeypatch):
+    # 느린 환경에서도 네 요청이 한 묶음에 들어오도록 기다리는 시간을 늘린다.
+    monkeypatch.setattr(user_loader, "delay", 0.2)
+
+    async def scenario(client):
+        users = [(await sign_up(client))[0] for _ in range(4)]
+        statements = []
+
+        def record(conn, cursor, statement, parameters, context, executemany):
+            # ETag 용 버전 조회는 세지 않는다.
+            if "users.username" in statement:
+                statements.append(statement)
+
+        engine = get_async_engine().sync_engine
+        event.listen(engine, "before_cursor_execute", record)
+        try:
+            responses = await asyncio.gather(*(client.get(f"/api/v1/users/{user['id']}") for user in users))
+        finally:
+            event.remove(engine, "before_cursor_execute", record)
+        assert [response.json()["id"] for response in responses] == [user["id"] for user in users]
+        assert len(statements) == 1
+
+    api(scenario)
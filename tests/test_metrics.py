@@ -0,0 +1,45 @@
+import pytest
+
+from core import metrics
+from core.config import Config
+from core.metrics import Histogram, render_metrics
+
+
+@pytest.fixture
+def histogram():
+    histogram = Histogram("test_duration_seconds", "Test.", ("route",), buckets=(0.1, 1.0))
+    yield histogram
+    metrics._registry.remove(histogram)
+
+
+def test_histogram_renders_cumulative_buckets(histogram):
+    for value in (0.05, 0.1, 0.5, 3.0):
+        histogram.observe(value, '/a"b')
+    lines = histogram.render()
+    assert lines[:2] == ["# HELP test_duration_seconds Test.", "# TYPE test_duration_seconds histogram"]
+    # 구간 경계값은 그 구간에 들어가고, 개수는 누적된다.
+    assert lines[2:] == [
+        'test_duration_seconds_bucket{route="/a\\"b",le="0.1"} 2',
+        'test_duration_seconds_bucket{route="/a\\"b",le="1.0"} 3',
+        'test_duration_seconds_bucket{route="/a\\"b",le="+Inf"} 4',
+        'test_duration_seconds_sum{route="/a\\"b"} 3.65',
+        'test_duration_seconds_count{route="/a\\"b"} 4',
+    ]
+    assert "\n".join(lines) in render_metrics()
+
+
+def test_requests_are_timed_by_route_and_phase(api, sign_up, monkeypatch):
+    monkeypatch.setattr(Config, "SERVER_TIMING", True)
+
+    async def scenario(client):
+        user, headers = await sign_up(client)
+        response = await client.get(f"/api/v1/works/{user['id']}", headers=headers)
+        phases = {entry.split(";")[0] for entry in response.headers["server-timing"].split(", ")}
+        assert {"service", "db", "serialization"} <= phases
+        return (await client.get("/metrics")).text
+
+    text = api(scenario)
+    # 경로 변수 대신 라우트의 경로 템플릿을 레이블로 쓴다.
+    assert 'http_request_duration_seconds_count{method="GET",route="/api/v1/works/{user_id}",status="200"}' in text
+    assert 'http_request_phase_seconds_count{route="/api/v1/works/{user_id}",phase="other"}' in text
+    assert 'service_function_duration_seconds_count{function="Work.get_works_by_user_id"}' in text
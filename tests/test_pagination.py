@@ -0,0 +1,28 @@
+from datetime import datetime
+
+import pytest
+
+from core.config import Config
+from repositories.pagination import clamp_page_size, decode_cursor, encode_cursor
+
+
+def test_cursor_round_trip():
+    created_at = datetime(2025, 3, 1, 12, 30, 45, 123456)
+
+    cursor = encode_cursor(created_at, 42)
+
+    assert decode_cursor(cursor) == (created_at, 42)
+    # URL 에 그대로 넣을 수 있어야 한다.
+    assert "=" not in cursor and "+" not in cursor and "/" not in cursor
+
+
+@pytest.mark.parametrize("cursor", ["", "zzz", "!!!", encode_cursor(datetime(2025, 1, 1), 1)[:-3]])
+def test_decode_cursor_rejects_malformed(cursor):
+    with pytest.raises(ValueError):
+        decode_cursor(cursor)
+
+
+def test_clamp_page_size():
+    assert clamp_page_size(None) == Config.PAGE_SIZE_DEFAULT
+    assert clamp_page_size(0) == 1
+    assert clamp_page_size(Config.PAGE_SIZE_MAX + 1) == Config.PAGE_SIZE_MAX
@@ -0,0 +1,99 @@
+import secrets
+
+from sqlalchemy import select, update
+
+from core.config import Config
+from core.utils import password
+from core.utils.password import hash_password, needs_rehash, verify_password
+from db.models import User
+from repositories import SessionLocal
+from service.service_helper import async_service_dict
+
+
+def _stored_password(username: str) -> str:
+    with SessionLocal() as db_session:
+        return db_session.scalar(select(User.password).where(User.username == username))
+
+
+def _store_password(username: str, value: str) -> None:
+    with SessionLocal() as db_session:
+        db_session.execute(update(User).where(User.username == username).values(password=value))
+        db_session.commit()
+
+
+async def _login(client, username, pw):
+    return (await client.post("/api/v1/auth/login", json={"username": username, "password": pw})).status_code
+
+
+def test_hash_and_verify():
+    hashed = hash_password("pw")
+    assert hashed.startswith(f"pbkdf2_sha256${Config.PASSWORD_HASH_ITERATIONS}$")
+    assert verify_password("pw", hashed) and not verify_password("other", hashed)
+    assert hash_password("pw") != hashed
+    assert not needs_rehash(hashed)
+    # 반복 횟수가 다르면 다시 해시해야 한다.
+    assert verify_password("pw", hash_password("pw", 10)) and needs_rehash(hash_password("pw", 10))
+
+
+def test_legacy_plaintext():
+    assert verify_password("pw", "pw") and not verify_password("other", "pw")
+    assert needs_rehash("pw")
+
+
+def test_malformed_hash_does_not_verify():
+    for hashed in ("pbkdf2_sha256$", "pbkdf2_sha256$x$c2FsdA==$ZGlnZXN0", "pbkdf2_sha256$10$!!$!!", "pbkdf2_sha256$1$2$3$4"):
+        assert not verify_password("pw", hashed)
+
+
+def test_signup_stores_a_hash_and_login_upgrades_legacy_passwords(api):
+    async def scenario(client):
+        username = f"pw-{secrets.token_hex(4)}"
+        await client.post("/api/v1/users/users", json={"username": username, "password": "pw"})
+        stored = _stored_password(username)
+        assert stored != "pw" and verify_password("pw", stored)
+
+        # 평문(레거시)이나 반복 횟수가 다른 해시는 로그인에 성공하면 다시 저장된다.
+        for legacy in ("pw", hash_password("pw", 10)):
+            _store_password(username, legacy)
+            assert await _login(client, username, "wrong") == 401
+            assert _stored_password(username) == legacy
+            assert await _login(client, username, "pw") == 200
+            stored = _stored_password(username)
+            assert stored != legacy and not needs_rehash(stored) and verify_password("pw", stored)
+
+        _store_password(username, "pbkdf2_sha256$broken")
+        assert await _login(client, username, "pw") == 401
+
+    api(scenario)
+
+
+def test_unknown_user_still_verifies_a_hash(api, monkeypatch):
+    verified = []
+    original = password.verify_password
+
+    def record(pw, hashed):
+        verified.append(hashed)
+        return original(pw, hashed)
+
+    monkeypatch.setattr(password, "verify_password", record)
+
+    async def scenario(client):
+        assert await _login(client, f"missing-{secrets.token_hex(4)}", "pw") == 401
+
+    api(scenario)
+    # 없는 유저도 해시를 한 번 검증해, 응답 시간으로 존재 여부를 알 수 없다.
+    assert len(verified) == 1 and verified[0].startswith("pbkdf2_sha256$")
+
+
+def test_update_user_hashes_the_password(api):
+    update_user = async_service_dict.get('User').get("update_user")
+
+    async def scenario(client):
+        username = f"pw-{secrets.token_hex(4)}"
+        user = (await client.post("/api/v1/users/users", json={"username": username, "password": "pw"})).json()
+        await update_user(user["id"], {"password": "new"})
+        stored = _stored_password(username)
+        assert stored != "new" and verify_password("new", stored)
+        assert await _login(client, username, "new") == 200
+
+    api(scenario)
@@ -0,0 +1,42 @@
+import pytest
+from sqlalchemy import select
+
+from db.models import User, Work
+from repositories import SessionLocal
+from schemas.models import EpisodeResponse, UserResponse, WorkDetailResponse, WorkResponse
+from service.projection import get_projection
+from service.service import to_response_model
+
+
+def test_projection_selects_only_the_response_fields():
+    projection = get_projection(Work, WorkResponse)
+    # 응답 필드 + 커서용 keyset 컬럼
+    assert [column.key for column in projection.columns] == ["created_at", "id", "title", "favorite_count"]
+    assert get_projection(Work, WorkResponse) is projection
+    assert get_projection(Work, WorkDetailResponse).includes == {"user": UserResponse, "episodes": EpisodeResponse}
+    with pytest.raises(ValueError):
+        get_projection(Work, WorkDetailResponse).include_columns(["comments"])
+    with pytest.raises(ValueError):
+        get_projection(User, WorkResponse)
+
+
+def test_projected_rows_match_the_entities(api, sign_up):
+    async def scenario(client):
+        user, headers = await sign_up(client)
+        await client.post(
+            "/api/v1/works/batch", json=[{"title": f"w{i}", "description": "d"} for i in range(3)], headers=headers
+        )
+        return user, (await client.get(f"/api/v1/works/{user['id']}")).json()
+
+    user, page = api(scenario)
+    projection = get_projection(Work, WorkResponse)
+    with SessionLocal() as db_session:
+        condition = Work.user_id == user["id"]
+        rows = db_session.execute(select(*projection.columns).where(condition).order_by(Work.id)).all()
+        entities = db_session.scalars(select(Work).where(condition).order_by(Work.id)).all()
+        expected = [to_response_model(WorkResponse, entity) for entity in entities]
+
+    # 컬럼만 읽은 행과 엔티티 전체를 읽은 행은 같은 응답이 된다.
+    assert projection.to_response_list(rows) == expected
+    assert [projection.to_response(row) for row in rows] == expected
+    assert sorted(page["items"], key=lambda item: item["id"]) == [work.model_dump(mode="json") for work in expected]
@@ -0,0 +1,24 @@
+from repositories.query_log import normalize_statement
+
+
+def test_normalize_statement():
+    assert normalize_statement("SELECT *\n  FROM works WHERE id IN (?, ?, ?)") == "SELECT * FROM works WHERE id IN (...)"
+    assert normalize_statement("INSERT INTO t (a, b) VALUES (?, ?), (?, ?), (?, ?)") == normalize_statement(
+        "INSERT INTO t (a, b) VALUES (?, ?)"
+    )
+
+
+def test_internal_routes_require_the_internal_token(api, internal_headers):
+    async def scenario(client):
+        for path in ("/api/v1/internal/slow-queries", "/api/v1/internal/pool"):
+            assert (await client.get(path)).status_code == 401
+            assert (await client.get(path, headers={"X-Internal-Token": "wrong"})).status_code == 401
+            assert (await client.get(path, headers={"X-Internal-Token": "정답".encode()})).status_code == 401
+
+        await client.get("/api/v1/users/", params={"limit": 1})
+        response = await client.get("/api/v1/internal/slow-queries", headers=internal_headers)
+        assert response.status_code == 200
+        statements = response.json()
+        assert statements and {"statement", "count", "total_seconds", "slow_count"} <= set(statements[0])
+
+    api(scenario)
@@ -0,0 +1,73 @@
+import asyncio
+
+from service.cache import MemoryCacheBackend, RecentWrites, ServiceCache
+from service.invalidation import InvalidationBus
+from service.transport import LocalTransport
+
+
+class SharedBackend(MemoryCacheBackend):
+    shared = True
+
+
+def _bus(transport, backend=None):
+    backend = backend or MemoryCacheBackend(100)
+    return InvalidationBus(transport, ServiceCache(backend, 60), RecentWrites(backend, 5))
+
+
+def test_recent_writes_expire():
+    async def main():
+        recent_writes = RecentWrites(MemoryCacheBackend(10), 0.05)
+        await recent_writes.add("Bearer a")
+        assert await recent_writes.contains("Bearer a")
+        assert not await recent_writes.contains("Bearer b")
+        await asyncio.sleep(0.06)
+        assert not await recent_writes.contains("Bearer a")
+
+    asyncio.run(main())
+
+
+def test_markers_reach_every_worker():
+    async def main():
+        transport = LocalTransport()
+        a, b = _bus(transport), _bus(transport)
+        await a.start()
+        await b.start()
+
+        await a.record_write("Bearer a")
+        await asyncio.sleep(0.01)
+        assert await a.recent_writes.contains("Bearer a")
+        assert await b.recent_writes.contains("Bearer a")
+        assert not await b.recent_writes.contains("Bearer b")
+
+    asyncio.run(main())
+
+
+def test_resync_sends_every_client_to_the_primary():
+    async def main():
+        bus = _bus(LocalTransport())
+        assert not await bus.recent_writes.contains("Bearer a")
+        # 재연결 전에 보낸 표식은 놓쳤을 수 있다.
+        bus._resync()
+        assert await bus.recent_writes.contains("Bearer a")
+
+    asyncio.run(main())
+
+
+def test_shared_markers_are_not_broadcast():
+    async def main():
+        transport = LocalTransport()
+        bus = _bus(transport, SharedBackend(100, stores_objects=False))
+        channels = []
+        publish = transport.publish
+
+        async def record(channel, message):
+            channels.append(channel)
+            await publish(channel, message)
+
+        transport.publish = record
+        await bus.record_write("Bearer a")
+        assert "writes" not in channels and await bus.recent_writes.contains("Bearer a")
+        bus._resync()
+        assert not await bus.recent_writes.contains("Bearer b")
+
+    asyncio.run(main())
@@ -0,0 +1,83 @@
+import secrets
+
+from core.config import Config
+
+
+async def _search(client, **params):
+    response = await client.get("/api/v1/search", params=params)
+    return response.status_code, response.json()
+
+
+def test_search_kinds_and_order(api, sign_up):
+    async def scenario(client):
+        _, headers = await sign_up(client)
+        tag = secrets.token_hex(4)
+        work_ids = (await client.post(
+            "/api/v1/works/batch",
+            json=[{"title": f"{tag} a", "description": "d"}, {"title": "b", "description": f"about {tag}"}],
+            headers=headers,
+        )).json()["ids"]
+        episode_id = (await client.post(
+            f"/api/v1/works/{work_ids[0]}/episodes/batch", json=[{"title": f"{tag} e"}], headers=headers
+        )).json()["ids"][0]
+
+        status, page = await _search(client, q=tag)
+        assert status == 200 and page["next_offset"] is None
+        # 점수가 같으면 종류, id 순이다.
+        assert [(item["kind"], item["id"], item["work_id"]) for item in page["items"]] == [
+            ("episode", episode_id, work_ids[0]),
+            ("work", work_ids[0], work_ids[0]),
+            ("work", work_ids[1], work_ids[1]),
+        ]
+        assert all(item["score"] > 0 for item in page["items"])
+
+        status, page = await _search(client, q=tag, type="work")
+        assert [item["id"] for item in page["items"]] == work_ids
+        status, page = await _search(client, q=tag, type="comment")
+        assert status == 400
+
+    api(scenario)
+
+
+def test_search_wildcards_are_literal(api, sign_up):
+    async def scenario(client):
+        _, headers = await sign_up(client)
+        tag = secrets.token_hex(4)
+        work_ids = (await client.post(
+            "/api/v1/works/batch",
+            json=[{"title": f"{tag} 100%_done", "description": "d"}, {"title": f"{tag} 1000done", "description": "d"}],
+            headers=headers,
+        )).json()["ids"]
+
+        status, page = await _search(client, q=f"{tag} 100%_d")
+        assert [item["id"] for item in page["items"]] == work_ids[:1]
+        status, page = await _search(client, q="%_%_")
+        assert page["items"] == []
+
+    api(scenario)
+
+
+def test_search_paging(api, sign_up):
+    async def scenario(client):
+        _, headers = await sign_up(client)
+        tag = secrets.token_hex(4)
+        work_ids = (await client.post(
+            "/api/v1/works/batch", json=[{"title": f"{tag} {i}", "description": "d"} for i in range(5)], headers=headers
+        )).json()["ids"]
+
+        seen = []
+        offset = 0
+        while offset is not None:
+            status, page = await _search(client, q=tag, offset=offset, limit=2)
+            assert status == 200 and len(page["items"]) <= 2
+            seen += [item["id"] for item in page["items"]]
+            offset = page["next_offset"]
+        assert seen == work_ids
+
+        # 앞쪽 SEARCH_MAX_RESULTS 개까지만 볼 수 있다.
+        status, _ = await _search(client, q=tag, offset=Config.SEARCH_MAX_RESULTS - 1, limit=2)
+        assert status == 400
+        status, page = await _search(client, q=tag, offset=Config.SEARCH_MAX_RESULTS - 2, limit=2)
+        assert status == 200 and page["items"] == []
+
+    api(scenario)
@@ -0,0 +1,56 @@
+import pytest
+
+np = pytest.importorskip("numpy")
+sparse = pytest.importorskip("scipy.sparse")
+
+from jobs.similar_works import top_neighbours  # noqa: E402
+
+
+def _brute_force(dense, top_n):
+    norms = np.linalg.norm(dense, axis=0)
+    expected = {}
+    for work in range(dense.shape[1]):
+        scores = []
+        for other in range(dense.shape[1]):
+            co = dense[:, work] @ dense[:, other]
+            if other != work and co:
+                scores.append((-co / (norms[work] * norms[other]), other))
+        expected[work] = [(other, -score) for score, other in sorted(scores)[:top_n]]
+    return expected
+
+
+def _collect(matrix, top_n, block_size):
+    found = {}
+    starts = []
+    for start, end, work_ids, similar_ids, scores in top_neighbours(matrix, top_n, block_size):
+        starts.append((start, end))
+        for work, other, score in zip(work_ids, similar_ids, scores):
+            assert start <= work < end
+            found.setdefault(int(work), []).append((int(other), float(score)))
+    return found, starts
+
+
+@pytest.mark.parametrize("block_size", [1, 2, 7, 100])
+def test_top_neighbours_matches_brute_force(block_size):
+    rng = np.random.default_rng(7)
+    # 유저 40명 x 작품 7개, 작품 0 은 아무도 보지 않았다.
+    dense = (rng.random((40, 7)) < 0.3) * rng.choice([1.0, 5.0], size=(40, 7))
+    dense[:, 0] = 0
+
+    found, starts = _collect(sparse.csr_matrix(dense, dtype=np.float32), 3, block_size)
+
+    assert starts[0][0] == 0 and starts[-1][1] == 7
+    expected = _brute_force(dense, 3)
+    for work in range(7):
+        got = found.get(work, [])
+        assert [other for other, _ in got] == [other for other, _ in expected[work]]
+        assert [score for _, score in got] == pytest.approx([score for _, score in expected[work]], rel=1e-5)
+    assert 0 not in found
+
+
+def test_top_neighbours_breaks_ties_by_id():
+    # 작품 1, 2, 3 은 작품 0 과 유사도가 같다.
+    dense = np.array([[1, 1, 1, 1], [1, 1, 1, 1]], dtype=np.float32)
+    found, _ = _collect(sparse.csr_matrix(dense), 2, 4)
+    assert [other for other, _ in found[0]] == [1, 2]
+    assert [other for other, _ in found[3]] == [0, 1]
@@ -0,0 +1,57 @@
+import math
+import time
+
+import pytest
+
+from core.config import Config
+from service.trending import EPOCH, TrendingBuffer, TrendingFeed, decayed_score, log_add, log_score
+
+HALF_LIFE = Config.TRENDING_HALF_LIFE
+
+
+def test_score_halves_every_half_life():
+    score = log_score(8, EPOCH + 1000)
+    assert decayed_score(score, EPOCH + 1000) == pytest.approx(8)
+    assert decayed_score(score, EPOCH + 1000 + HALF_LIFE) == pytest.approx(4)
+    assert decayed_score(score, EPOCH + 1000 + 3 * HALF_LIFE) == pytest.approx(1)
+
+
+def test_log_add_sums_decayed_scores():
+    now = EPOCH + 10 * HALF_LIFE
+    old, new = log_score(4, now - HALF_LIFE), log_score(1, now)
+    assert decayed_score(log_add(old, new), now) == pytest.approx(3)
+    assert log_add(old, new) == log_add(new, old)
+
+
+def test_scores_do_not_overflow():
+    # 기준 시각에서 수십 년 뒤에도 로그 공간의 점수는 유한하다.
+    far = EPOCH + 50 * 365 * 24 * 60 * 60
+    score = log_add(log_score(1e6, far), log_score(1e6, far))
+    assert math.isfinite(score)
+    assert decayed_score(score, far) == pytest.approx(2e6)
+
+
+def test_trending_feed_orders_by_decayed_score(api, sign_up):
+    async def scenario(client):
+        user, headers = await sign_up(client)
+        ids = (await client.post(
+            "/api/v1/works/batch",
+            json=[{"title": f"w{i}", "description": "d", "user_id": user["id"]} for i in range(3)],
+            headers=headers,
+        )).json()["ids"]
+        now = time.time()
+
+        buffer = TrendingBuffer(flush_size=100, flush_interval=60, max_pending=100)
+        # 오래된 큰 점수는 최근의 작은 점수보다 낮아질 수 있다.
+        await buffer.record(ids[0], 16, at=now - 6 * HALF_LIFE)
+        await buffer.record(ids[1], 1, at=now)
+        await buffer.record(ids[1], 1, at=now)
+        await buffer.record(ids[2], 1, at=now - HALF_LIFE)
+        assert await buffer.flush() == 3
+
+        page = await TrendingFeed(size=Config.TRENDING_TOP_K).refresh()
+        mine = [item for item in page.items if item.work.id in ids]
+        assert [item.work.id for item in mine] == [ids[1], ids[2], ids[0]]
+        assert mine[0].score > mine[1].score > mine[2].score > 0
+
+    api(scenario)
@@ -0,0 +1,86 @@
+import asyncio
+import secrets
+from types import SimpleNamespace
+
+import pytest
+from sqlalchemy import func, select
+
+from db.models import Work
+from repositories import Repository, SessionLocal, dispose_engines
+from service.invalidation import invalidation_bus
+from service.service_helper import async_service_dict, unit_of_work
+
+REQUEST = SimpleNamespace(headers={})
+
+
+def _add_user() -> int:
+    with SessionLocal() as db_session:
+        repo = Repository(db_session)
+        user_id = repo.users.add_many([{"username": f"uow-{secrets.token_hex(4)}", "password": "pw"}])[0]
+        repo.commit()
+    return user_id
+
+
+def _committed_works(user_id: int) -> int:
+    with SessionLocal() as db_session:
+        return db_session.scalar(select(func.count()).select_from(Work).where(Work.user_id == user_id))
+
+
+def _run(main):
+    async def run():
+        try:
+            await main()
+        finally:
+            await dispose_engines()
+
+    asyncio.run(run())
+
+
+@pytest.fixture
+def published(monkeypatch):
+    published = []
+
+    async def record(table, ids, tags):
+        published.append(table)
+
+    monkeypatch.setattr(invalidation_bus, "publish", record)
+    return published
+
+
+def test_service_calls_share_one_transaction(database, published):
+    user_id = _add_user()
+    add_works = async_service_dict.get('Work').get("add_works")
+    get_works = async_service_dict.get('Work').get("get_works_by_user_id")
+
+    async def main():
+        dependency = unit_of_work(REQUEST)
+        await dependency.__anext__()
+        await add_works([{"user_id": user_id, "title": "a", "description": "d"}])
+        await add_works([{"user_id": user_id, "title": "b", "description": "d"}])
+        # 같은 요청의 서비스 호출은 커밋 전의 쓰기를 본다.
+        assert len((await get_works(user_id)).items) == 2
+        assert _committed_works(user_id) == 0 and published == []
+
+        # 엔드포인트가 끝나면 한 번에 커밋하고, 그 뒤에 무효화를 알린다.
+        with pytest.raises(StopAsyncIteration):
+            await dependency.__anext__()
+        assert _committed_works(user_id) == 2 and published == ["works", "works"]
+
+    _run(main)
+
+
+def test_a_failed_request_rolls_back_every_call(database, published):
+    user_id = _add_user()
+    add_works = async_service_dict.get('Work').get("add_works")
+
+    async def main():
+        dependency = unit_of_work(REQUEST)
+        await dependency.__anext__()
+        await add_works([{"user_id": user_id, "title": "a", "description": "d"}])
+        await add_works([{"user_id": user_id, "title": "b", "description": "d"}])
+        with pytest.raises(RuntimeError):
+            await dependency.athrow(RuntimeError("endpoint failed"))
+
+    _run(main)
+    # 앞선 호출의 쓰기도 함께 취소되고, 무효화도 알리지 않는다.
+    assert _committed_works(user_id) == 0 and published == []
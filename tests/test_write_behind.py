@@ -0,0 +1,87 @@
+import asyncio
+
+from service.write_behind import WriteBehindBuffer
+
+
+class SumBuffer(WriteBehindBuffer):
+    name = "sum"
+
+    def __init__(self, flush_size=100, max_pending=100):
+        super().__init__(flush_size, flush_interval=60, max_pending=max_pending)
+        self.written = []
+        self.failing = False
+
+    def _combine(self, current, value):
+        return current + value
+
+    async def _write(self, pending):
+        if self.failing:
+            raise RuntimeError("database is down")
+        self.written.append(dict(pending))
+
+
+def test_values_are_combined_per_key():
+    async def main():
+        buffer = SumBuffer()
+        for key, value in [("a", 1), ("b", 2), ("a", 3)]:
+            await buffer.add(key, value)
+        assert len(buffer) == 2
+        assert await buffer.flush() == 2
+        assert buffer.written == [{"a": 4, "b": 2}]
+        assert await buffer.flush() == 0
+
+    asyncio.run(main())
+
+
+def test_flush_size_flushes_in_background():
+    async def main():
+        buffer = SumBuffer(flush_size=3)
+        for key in range(3):
+            await buffer.add(key, 1)
+        await asyncio.sleep(0)
+        assert buffer.written == [{0: 1, 1: 1, 2: 1}] and len(buffer) == 0
+
+    asyncio.run(main())
+
+
+def test_full_buffer_flushes_to_make_room():
+    async def main():
+        buffer = SumBuffer(max_pending=2)
+        await buffer.add("a", 1)
+        await buffer.add("b", 1)
+        await buffer.add("c", 1)
+        assert buffer.written == [{"a": 1, "b": 1}]
+        assert dict(buffer._pending) == {"c": 1} and buffer.dropped == 0
+
+    asyncio.run(main())
+
+
+def test_full_buffer_drops_when_the_flush_fails():
+    async def main():
+        buffer = SumBuffer(max_pending=2)
+        buffer.failing = True
+        await buffer.add("a", 1)
+        await buffer.add("b", 1)
+        await buffer.add("c", 1)
+        # 실패한 flush 의 값은 다시 쌓이고, 자리가 없는 새 키는 버린다.
+        assert dict(buffer._pending) == {"a": 1, "b": 1} and buffer.dropped == 1
+        # 이미 있는 키에는 계속 더할 수 있다.
+        await buffer.add("a", 5)
+        assert buffer._pending["a"] == 6
+
+        buffer.failing = False
+        await buffer.stop()
+        assert buffer.written == [{"a": 6, "b": 1}] and len(buffer) == 0
+
+    asyncio.run(main())
+
+
+def test_stop_writes_what_is_pending():
+    async def main():
+        buffer = SumBuffer()
+        buffer.start()
+        await buffer.add("a", 1)
+        await buffer.stop()
+        assert buffer.written == [{"a": 1}]
+
+    asyncio.run(main())